@@ -0,0 +1,251 @@
+"""Headless benchmarks for the linebyline operators.
+
+Run from the repository root:
+
+    blender --background --factory-startup --python benchmarks/bench.py -- --scale small --output results.json
+
+Compare against a stored baseline, failing with exit code 1 on regressions:
+
+    blender --background --factory-startup --python benchmarks/bench.py -- --baseline baseline.json
+
+Store the current results as the new baseline:
+
+    blender --background --factory-startup --python benchmarks/bench.py -- --save-baseline baseline.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import addon_utils
+import bpy
+import numpy as np
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Addon package holding all operators
+ADDON = "linebyline"
+
+# Scene sizes: number of objects and the side length of the large grid mesh
+SCALES = {
+    "small": {"objects": 1000, "grid": 300},
+    "full": {"objects": 10000, "grid": 1000},
+    "huge": {"objects": 100000, "grid": 1000},
+}
+
+# A run slower than baseline * (1 + threshold) counts as a regression
+DEFAULT_THRESHOLD = 0.25
+
+
+# Scene generation
+
+def reset_scene():
+    bpy.ops.wm.read_homefile(use_empty=True)
+
+
+def make_cube_mesh(name):
+    """Small closed mesh with one selected edge and vertex"""
+    verts = [(x, y, z) for x in (-0.5, 0.5) for y in (-0.5, 0.5) for z in (-0.5, 0.5)]
+    faces = [(0, 1, 3, 2), (4, 6, 7, 5), (0, 4, 5, 1), (2, 3, 7, 6), (0, 2, 6, 4), (1, 5, 7, 3)]
+    mesh = bpy.data.meshes.new(name)
+    mesh.from_pydata(verts, [], faces)
+    mesh.vertices[0].select = True
+    mesh.vertices[1].select = True
+    mesh.edges[0].select = True
+    return mesh
+
+
+def make_objects(count, shared_mesh=False):
+    """Scatter count cube objects, all selected, the first one active"""
+    scene = bpy.context.scene
+    rng = np.random.default_rng(0)
+    locations = rng.uniform(-count ** 0.5, count ** 0.5, (count, 3))
+    mesh = make_cube_mesh("BenchCube") if shared_mesh else None
+
+    objects = []
+    for index, location in enumerate(locations):
+        obj = bpy.data.objects.new(f"Bench{index}", mesh or make_cube_mesh(f"BenchCube{index}"))
+        obj.location = location
+        scene.collection.objects.link(obj)
+        obj.select_set(True)
+        objects.append(obj)
+
+    bpy.context.view_layer.objects.active = objects[0]
+    return objects
+
+
+def make_grid_object(side, select_fraction=0.5):
+    """Single grid mesh with side * side vertices and a block of selected faces"""
+    scene = bpy.context.scene
+    x, y = np.meshgrid(np.linspace(-10.0, 10.0, side), np.linspace(-10.0, 10.0, side))
+    co = np.column_stack((x.ravel(), y.ravel(), np.zeros(side * side))).astype(np.float32)
+
+    # Quads between neighbouring rows and columns
+    index = np.arange(side * side).reshape(side, side)
+    quads = np.stack((
+        index[:-1, :-1], index[:-1, 1:], index[1:, 1:], index[1:, :-1],
+    ), axis=-1).reshape(-1, 4)
+
+    mesh = bpy.data.meshes.new("BenchGrid")
+    mesh.vertices.add(len(co))
+    mesh.vertices.foreach_set("co", co.ravel())
+    mesh.loops.add(quads.size)
+    mesh.loops.foreach_set("vertex_index", quads.ravel().astype(np.int32))
+    mesh.polygons.add(len(quads))
+    mesh.polygons.foreach_set("loop_start", np.arange(0, quads.size, 4, dtype=np.int32))
+    mesh.update(calc_edges=True)
+
+    # Select a square block of faces and their vertices
+    limit = int(side * select_fraction)
+    face_rows, face_cols = np.divmod(np.arange(len(quads)), side - 1)
+    face_select = (face_rows < limit) & (face_cols < limit)
+    mesh.polygons.foreach_set("select", face_select)
+    vert_select = np.zeros(len(co), dtype=bool)
+    vert_select[quads[face_select].ravel()] = True
+    mesh.vertices.foreach_set("select", vert_select)
+
+    obj = bpy.data.objects.new("BenchGrid", mesh)
+    scene.collection.objects.link(obj)
+    obj.select_set(True)
+    bpy.context.view_layer.objects.active = obj
+    return obj
+
+
+# Benchmark cases: name -> (setup(scale) returning the element count, operator call)
+
+def setup_objects(scale):
+    return len(make_objects(scale["objects"]))
+
+
+def setup_grid(scale):
+    make_grid_object(scale["grid"])
+    return scale["grid"] ** 2
+
+
+def setup_grid_edit(scale):
+    count = setup_grid(scale)
+    bpy.ops.object.mode_set(mode='EDIT')
+    bpy.ops.mesh.select_mode(type='FACE')
+    return count
+
+
+def setup_rename(scale):
+    count = setup_objects(scale)
+    bpy.context.scene.rename_tool.suffix_col = True
+    return count
+
+
+def setup_random(scale):
+    count = setup_objects(scale)
+    bpy.context.scene.random_manipulator_tool.min_distance_enabled = True
+    return count
+
+
+def setup_cave(scale):
+    return 102 ** 2
+
+
+CASES = {
+    "object.add_empty_at_vertex": (setup_grid, lambda: bpy.ops.object.add_empty_at_vertex()),
+    "mesh.mark_face_outline_seams": (setup_grid_edit, lambda: bpy.ops.mesh.mark_face_outline_seams()),
+    "object.replace_with_empty": (setup_objects, lambda: bpy.ops.object.replace_with_empty()),
+    "object.align_to_grid": (setup_objects, lambda: bpy.ops.object.align_to_grid()),
+    "object.random_manipulator_operator": (setup_random, lambda: bpy.ops.object.random_manipulator_operator()),
+    "object.rename_multiple_objects": (setup_rename, lambda: bpy.ops.object.rename_multiple_objects()),
+    "object.align_global": (setup_objects, lambda: bpy.ops.object.align_global(axis='X')),
+    "object.align_to_edge": (setup_objects, lambda: bpy.ops.object.align_to_edge(mode='MANY')),
+    "object.auto_align_axes": (setup_grid, lambda: bpy.ops.object.auto_align_axes(method='OBB')),
+    "object.set_origin_to_selected_vertex": (setup_objects, lambda: bpy.ops.object.set_origin_to_selected_vertex()),
+    "object.set_origin_to_selected_vertex[grid]": (setup_grid, lambda: bpy.ops.object.set_origin_to_selected_vertex()),
+    "object.set_origin_preset": (setup_objects, lambda: bpy.ops.object.set_origin_preset(preset='BOTTOM_CENTER')),
+    "object.audit_godot_hints": (setup_rename, lambda: bpy.ops.object.audit_godot_hints()),
+    "mesh.create_cave_wall": (setup_cave, lambda: bpy.ops.mesh.create_cave_wall(subdivision=100)),
+}
+
+
+def run_case(name, scale, repeat):
+    """Best wall time of an operator over repeat runs, each on a freshly built scene"""
+    setup, call = CASES[name]
+    timings = []
+    count = 0
+    for _ in range(repeat):
+        reset_scene()
+        count = setup(scale)
+        start = time.perf_counter()
+        result = call()
+        timings.append(time.perf_counter() - start)
+        if 'FINISHED' not in result:
+            raise RuntimeError(f"{name} returned {result}")
+
+    seconds = min(timings)
+    return {
+        "seconds": seconds,
+        "elements": count,
+        "per_second": count / seconds if seconds > 0.0 else None,
+    }
+
+
+def compare(results, baseline, threshold):
+    """Return the names of cases slower than their baseline by more than threshold"""
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get("results", {}).get(name)
+        if reference is None:
+            print(f"{name}: no baseline")
+            continue
+        ratio = result["seconds"] / reference["seconds"] if reference["seconds"] > 0.0 else 1.0
+        status = "REGRESSION" if ratio > 1.0 + threshold else "ok"
+        print(f"{name}: {result['seconds']:.4f}s vs {reference['seconds']:.4f}s ({ratio:.2f}x) {status}")
+        if status == "REGRESSION":
+            regressions.append(name)
+    return regressions
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(prog="bench")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--only", nargs="*", help="Run only these cases")
+    parser.add_argument("--output", help="Write results to this JSON file")
+    parser.add_argument("--baseline", help="Compare against this JSON file")
+    parser.add_argument("--save-baseline", help="Write results as a new baseline to this JSON file")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    # Make the addon package importable and enable it
+    sys.path.insert(0, REPO_DIR)
+    addon_utils.enable(ADDON, default_set=True)
+
+    scale = SCALES[args.scale]
+    results = {}
+    for name in args.only or CASES:
+        results[name] = run_case(name, scale, args.repeat)
+        print(f"{name}: {results[name]['seconds']:.4f}s for {results[name]['elements']} elements")
+
+    report = {
+        "blender": bpy.app.version_string,
+        "scale": args.scale,
+        "repeat": args.repeat,
+        "results": results,
+    }
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w") as file:
+                json.dump(report, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        if baseline.get("scale") != args.scale:
+            print(f"Baseline was recorded at scale '{baseline.get('scale')}', not '{args.scale}'")
+            return 1
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    sys.exit(main(argv))
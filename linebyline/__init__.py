@@ -0,0 +1,172 @@
+bl_info = {
+    "name": "linebyline",
+    "author": "linebyline",
+    "version": (2, 0, 0),
+    "blender": (4, 1, 1),
+    "location": "View 3D > linebyline",
+    "description": "Object, origin, naming and mesh tools, mostly for the Godot workflow",
+    "category": "Object",
+}
+
+import bpy
+import importlib
+import sys
+from bpy.app.handlers import persistent
+
+# Feature modules in registration order. They only hold operators, panels and
+# properties; the NumPy based code is imported when an operator first runs.
+MODULES = (
+    "add_empty_on_vertex",
+    "align_on_edge",
+    "cave_wall_generator_beta",
+    "collision_proxy",
+    "face_outline_seam",
+    "godot_export",
+    "godot_hint_audit",
+    "grid_align_objects",
+    "random_mass_rotation",
+    "rename_multiple_objects",
+    "replace_with_empty",
+    "selection_snapshots",
+    "set_origin_to_vertex",
+)
+
+_modules = []
+
+
+def _mesh_cache():
+    # The shared mesh cache only exists once an operator has imported it, which keeps NumPy out of startup
+    return sys.modules.get(f"{__name__}.core")
+
+
+@persistent
+def _track_geometry_updates(scene, depsgraph):
+    core = _mesh_cache()
+    if core is not None:
+        core.track_geometry_updates(depsgraph)
+
+
+@persistent
+def _clear_mesh_cache(*args):
+    # Undo and file loads replace the ID data behind the cached arrays
+    core = _mesh_cache()
+    if core is not None:
+        core.clear_all()
+
+
+def _update_keymap(self, context):
+    from . import set_origin_to_vertex
+    set_origin_to_vertex.unregister_keymap()
+    set_origin_to_vertex.register_keymap(self)
+
+
+def _update_profiling(self, context):
+    from . import profiling
+    profiling.configure(self)
+
+
+class LinebylinePreferences(bpy.types.AddonPreferences):
+    bl_idname = __name__
+
+    # Set origin menu shortcut
+    custom_key: bpy.props.StringProperty(
+        name="Custom Key",
+        description="Key to trigger the Set Origin operation",
+        default="C",
+        update=_update_keymap,
+    )
+    use_shift: bpy.props.BoolProperty(
+        name="Use Shift",
+        description="Use Shift as a modifier",
+        default=True,
+        update=_update_keymap,
+    )
+    use_ctrl: bpy.props.BoolProperty(
+        name="Use Ctrl",
+        description="Use Ctrl as a modifier",
+        default=True,
+        update=_update_keymap,
+    )
+    use_alt: bpy.props.BoolProperty(
+        name="Use Alt",
+        description="Use Alt as a modifier",
+        default=True,
+        update=_update_keymap,
+    )
+
+    # Operator profiling
+    profiling_enabled: bpy.props.BoolProperty(
+        name="Profile Operators",
+        description="Time the linebyline operators and their stages and report them in the info bar",
+        default=False,
+        update=_update_profiling,
+    )
+    profile_output: bpy.props.EnumProperty(
+        name="Profile Output",
+        description="Extra file written for every profiled operator run",
+        items=[
+            ('NONE', "None", "Only report the timings"),
+            ('PSTATS', "cProfile", "Write a .pstats file"),
+            ('TRACE', "Chrome Trace", "Write a Chrome trace .json file of the stages"),
+        ],
+        default='NONE',
+        update=_update_profiling,
+    )
+    profile_directory: bpy.props.StringProperty(
+        name="Profile Directory",
+        description="Folder for profile files, the temporary folder when empty",
+        subtype='DIR_PATH',
+        default="",
+        update=_update_profiling,
+    )
+
+    def draw(self, context):
+        layout = self.layout
+
+        layout.label(text="Set Origin Menu Shortcut:")
+        row = layout.row(align=True)
+        row.prop(self, "custom_key")
+        row.prop(self, "use_shift")
+        row.prop(self, "use_ctrl")
+        row.prop(self, "use_alt")
+
+        layout.separator()
+        layout.prop(self, "profiling_enabled")
+        if self.profiling_enabled:
+            layout.prop(self, "profile_output")
+            if self.profile_output != 'NONE':
+                layout.prop(self, "profile_directory")
+
+
+def register():
+    bpy.utils.register_class(LinebylinePreferences)
+
+    for name in MODULES:
+        module = importlib.import_module(f".{name}", __name__)
+        module.register()
+        _modules.append(module)
+
+    # Not listed yet when enabled without storing it in the preferences
+    addon = bpy.context.preferences.addons.get(__name__)
+    if addon is not None:
+        _update_profiling(addon.preferences, bpy.context)
+        _update_keymap(addon.preferences, bpy.context)
+
+    bpy.app.handlers.depsgraph_update_post.append(_track_geometry_updates)
+    bpy.app.handlers.load_post.append(_clear_mesh_cache)
+    bpy.app.handlers.undo_post.append(_clear_mesh_cache)
+    bpy.app.handlers.redo_post.append(_clear_mesh_cache)
+
+
+def unregister():
+    for module in reversed(_modules):
+        module.unregister()
+    _modules.clear()
+
+    bpy.app.handlers.depsgraph_update_post.remove(_track_geometry_updates)
+    bpy.app.handlers.load_post.remove(_clear_mesh_cache)
+    bpy.app.handlers.undo_post.remove(_clear_mesh_cache)
+    bpy.app.handlers.redo_post.remove(_clear_mesh_cache)
+    _clear_mesh_cache()
+
+    bpy.utils.unregister_class(LinebylinePreferences)
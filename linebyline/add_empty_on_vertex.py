@@ -0,0 +1,193 @@
+import bmesh
+import bpy
+import sys
+from . import profiling
+from bpy.app.handlers import persistent
+
+# Custom properties of live linked empties: the source object and the index of the tracked vertex
+LINK_SOURCE = "vertex_link_source"
+LINK_INDEX = "vertex_link_index"
+
+# Source object session uid -> (source, [empties], [vertex indices]). Found again whenever
+# the number of objects changes, so added, duplicated and deleted empties are picked up.
+_links = {"sources": {}, "object_count": -1, "updating": False}
+
+
+def find_links():
+    sources = {}
+    for obj in bpy.data.objects:
+        source = obj.get(LINK_SOURCE)
+        if isinstance(source, bpy.types.Object) and source.type == 'MESH' and LINK_INDEX in obj:
+            entry = sources.setdefault(source.session_uid, (source, [], []))
+            entry[1].append(obj)
+            entry[2].append(obj[LINK_INDEX])
+    _links["sources"] = sources
+    _links["object_count"] = len(bpy.data.objects)
+
+    # The cached positions follow the order of the empties, which may have changed
+    vertex_links = sys.modules.get(f"{__package__}.vertex_links")
+    if vertex_links:
+        vertex_links.clear()
+
+
+@persistent
+def follow_linked_vertices(scene, depsgraph):
+    """Move live linked empties whose source mesh or object was updated"""
+    # Moving the empties triggers another update, which has nothing to do
+    if _links["updating"]:
+        return
+    if len(bpy.data.objects) != _links["object_count"]:
+        find_links()
+    if not _links["sources"]:
+        return
+
+    changes = []
+    for update in depsgraph.updates:
+        if not (update.is_updated_geometry or update.is_updated_transform):
+            continue
+        entry = _links["sources"].get(update.id.original.session_uid)
+        if entry:
+            changes.append((*entry, update.is_updated_geometry))
+    if not changes:
+        return
+
+    # NumPy is only imported once a file actually has live links
+    from . import vertex_links
+    _links["updating"] = True
+    try:
+        vertex_links.refresh(changes)
+    except ReferenceError:
+        # An empty was deleted in a way that kept the object count, find the links again
+        _links["object_count"] = -1
+    finally:
+        _links["updating"] = False
+
+
+@persistent
+def _forget_links(*args):
+    # Undo and file loads replace the objects behind the stored references
+    _links["sources"] = {}
+    _links["object_count"] = -1
+
+
+@profiling.instrument
+class AddEmptyAtVertexOperator(bpy.types.Operator):
+    """Add an empty object at the position of selected vertices"""
+    bl_idname = "object.add_empty_at_vertex"
+    bl_label = "Add Empty at Vertex"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    live_link: bpy.props.BoolProperty(
+        name="Live Link",
+        description="Keep the empties on their vertices when the mesh is edited or moved",
+        default=False,
+        options={'SKIP_SAVE'}
+    )
+    snapshot: bpy.props.StringProperty(
+        name="Snapshot",
+        description="Use this saved vertex selection instead of the current one",
+        default="",
+        options={'SKIP_SAVE'}
+    )
+    
+    def execute(self, context):
+        import numpy as np
+        from . import core
+
+        selected_objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
+        new_empties = []
+        
+        # Iterate over selected objects
+        for obj in selected_objects:
+            # Get the world position of every selected vertex at once
+            mesh = obj.data
+            if obj.mode == 'EDIT':
+                # The mesh arrays are stale in edit mode, read the selected vertices from the edit mesh
+                bm = bmesh.from_edit_mesh(mesh)
+                bm.verts.ensure_lookup_table()
+                indices = np.flatnonzero(core.input_selection(mesh, self.snapshot, bm))
+                co = np.array([bm.verts[i].co for i in indices.tolist()], dtype=np.float32).reshape(-1, 3)
+            else:
+                indices = np.flatnonzero(core.input_selection(mesh, self.snapshot))
+                co = core.positions(mesh)[indices]
+            world_positions = core.to_world(co, obj.matrix_world)
+            profiling.count(len(world_positions))
+
+            # Create the Empty objects directly, without an operator call per vertex
+            for index, world_position in zip(indices.tolist(), world_positions):
+                empty = bpy.data.objects.new("Empty", None)
+                empty.empty_display_type = 'PLAIN_AXES'
+                empty.location = world_position
+                if self.live_link:
+                    empty[LINK_SOURCE] = obj
+                    empty[LINK_INDEX] = index
+                context.collection.objects.link(empty)
+                new_empties.append(empty)
+
+        # Select the new empties like the add operator would, edit mode stays untouched
+        if new_empties and context.mode == 'OBJECT':
+            for obj in context.selected_objects:
+                obj.select_set(False)
+            for empty in new_empties:
+                empty.select_set(True)
+            context.view_layer.objects.active = new_empties[-1]
+        
+        if self.live_link:
+            find_links()
+        return {'FINISHED'}
+
+
+@profiling.instrument
+class ClearVertexLinkOperator(bpy.types.Operator):
+    """Stop the selected empties from following their vertices"""
+    bl_idname = "object.clear_vertex_link"
+    bl_label = "Clear Vertex Link"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        cleared = 0
+        for obj in context.selected_objects:
+            if LINK_SOURCE in obj:
+                del obj[LINK_SOURCE]
+                obj.pop(LINK_INDEX, None)
+                cleared += 1
+
+        find_links()
+        self.report({'INFO'}, f"Cleared the vertex link of {cleared} object(s).")
+        return {'FINISHED'}
+
+
+def add_empty_at_vertex_menu(self, context):
+    layout = self.layout
+    # Add a separator before the custom operator
+    layout.separator()
+    # Add the custom operator to the Shift+A > Empty menu
+    layout.operator(AddEmptyAtVertexOperator.bl_idname, text="Empty at Selected Vertices").live_link = False
+    layout.operator(AddEmptyAtVertexOperator.bl_idname, text="Linked Empty at Selected Vertices").live_link = True
+
+
+def clear_vertex_link_menu(self, context):
+    self.layout.operator(ClearVertexLinkOperator.bl_idname)
+
+
+def register():
+    bpy.utils.register_class(AddEmptyAtVertexOperator)
+    bpy.utils.register_class(ClearVertexLinkOperator)
+    bpy.types.VIEW3D_MT_mesh_add.append(add_empty_at_vertex_menu)
+    bpy.types.VIEW3D_MT_object_parent.append(clear_vertex_link_menu)
+    bpy.app.handlers.depsgraph_update_post.append(follow_linked_vertices)
+    bpy.app.handlers.load_post.append(_forget_links)
+    bpy.app.handlers.undo_post.append(_forget_links)
+    bpy.app.handlers.redo_post.append(_forget_links)
+
+
+def unregister():
+    bpy.utils.unregister_class(AddEmptyAtVertexOperator)
+    bpy.utils.unregister_class(ClearVertexLinkOperator)
+    bpy.types.VIEW3D_MT_mesh_add.remove(add_empty_at_vertex_menu)
+    bpy.types.VIEW3D_MT_object_parent.remove(clear_vertex_link_menu)
+    bpy.app.handlers.depsgraph_update_post.remove(follow_linked_vertices)
+    bpy.app.handlers.load_post.remove(_forget_links)
+    bpy.app.handlers.undo_post.remove(_forget_links)
+    bpy.app.handlers.redo_post.remove(_forget_links)
+    _forget_links()
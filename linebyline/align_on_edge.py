@@ -0,0 +1,183 @@
+import bpy
+import sys
+from . import profiling
+
+# Operators
+@profiling.instrument
+class OBJECT_OT_AlignGlobal(bpy.types.Operator):
+    bl_idname = "object.align_global"
+    bl_label = "Align to Global Axis"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    axis: bpy.props.EnumProperty(
+        items=[
+            ('X', "X Axis", ""),
+            ('Y', "Y Axis", ""),
+            ('Z', "Z Axis", "")
+        ],
+        name="Axis",
+        default='X'
+    )
+    snapshot: bpy.props.StringProperty(
+        name="Snapshot",
+        description="Use the first edge of this saved vertex selection instead of the active edge",
+        default="",
+        options={'SKIP_SAVE'}
+    )
+    
+    def execute(self, context):
+        from .alignment import align_to_global_axis
+
+        selected_objects = context.selected_objects
+        if not selected_objects:
+            self.report({'WARNING'}, "No objects selected.")
+            return {'CANCELLED'}
+        
+        axis_index = {'X': 0, 'Y': 1, 'Z': 2}[self.axis]
+        mesh_objects = [obj for obj in selected_objects if obj.type == 'MESH']  # Only align mesh objects
+        skipped = align_to_global_axis(mesh_objects, axis_index, self.snapshot)
+        if skipped:
+            self.report({'WARNING'}, f"No active edge in {len(skipped)} object(s), e.g. '{skipped[0]}'.")
+        
+        return {'FINISHED'}
+
+@profiling.instrument
+class OBJECT_OT_AlignToEdge(bpy.types.Operator):
+    bl_idname = "object.align_to_edge"
+    bl_label = "Align to Edge of Another Object"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    mode: bpy.props.EnumProperty(
+        items=[
+            ('PAIR', "Active to Other", "Align the active object to the edge of the other selected object"),
+            ('MANY', "Selected to Active", "Align all selected objects to the edge of the active object"),
+        ],
+        name="Mode",
+        default='PAIR',
+        options={'SKIP_SAVE'}
+    )
+
+    match_midpoint: bpy.props.BoolProperty(
+        name="Match Midpoints",
+        description="Also move the aligned objects so the edge midpoints coincide",
+        default=False
+    )
+    
+    def execute(self, context):
+        from .alignment import align_many_to_edge, align_to_another_edge
+
+        objs = context.selected_objects
+        active_obj = context.object
+
+        if self.mode == 'MANY':
+            others = [obj for obj in objs if obj != active_obj and obj.type == 'MESH']
+            if not active_obj or active_obj.type != 'MESH' or not others:
+                self.report({'WARNING'}, "Select the objects to align and make the target mesh active.")
+                return {'CANCELLED'}
+
+            skipped = align_many_to_edge(others, active_obj, self.match_midpoint)
+            if len(skipped) == len(others):
+                self.report({'WARNING'}, "No object could be aligned, check the active edges.")
+                return {'CANCELLED'}
+            if skipped:
+                self.report({'WARNING'}, f"No active edge in {len(skipped)} object(s), e.g. '{skipped[0]}'.")
+            return {'FINISHED'}
+
+        if len(objs) != 2:
+            self.report({'WARNING'}, "Please select two objects.")
+            return {'CANCELLED'}
+        
+        target_obj = objs[0] if objs[1] == active_obj else objs[1]
+        if not align_to_another_edge(active_obj, target_obj, self.match_midpoint):
+            self.report({'WARNING'}, "Both objects need an active edge selected.")
+            return {'CANCELLED'}
+        return {'FINISHED'}
+
+@profiling.instrument
+class OBJECT_OT_AutoAlign(bpy.types.Operator):
+    """Rotate Selected Objects so their Principal Axes Match the Global Axes"""
+    bl_idname = "object.auto_align_axes"
+    bl_label = "Auto Align to Global Axes"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    method: bpy.props.EnumProperty(
+        items=[
+            ('PCA', "Principal Axes", "Axes of the vertex covariance, largest spread along X"),
+            ('OBB', "Oriented Bounding Box", "Principal axes refined to the tightest bounding box"),
+        ],
+        name="Method",
+        default='PCA'
+    )
+
+    def execute(self, context):
+        from .alignment import auto_align_objects
+
+        mesh_objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
+        if not mesh_objects:
+            self.report({'WARNING'}, "No mesh objects selected.")
+            return {'CANCELLED'}
+
+        skipped = auto_align_objects(mesh_objects, self.method)
+        if skipped:
+            self.report({'WARNING'}, f"Skipped {len(skipped)} object(s) with fewer than 3 vertices.")
+        return {'FINISHED'}
+
+# Submenu
+class OBJECT_MT_AlignSubmenu(bpy.types.Menu):
+    bl_idname = "OBJECT_MT_align_submenu"
+    bl_label = "Align to Axis/Edge"
+    
+    def draw(self, context):
+        layout = self.layout
+        layout.operator(OBJECT_OT_AlignGlobal.bl_idname, text="Align to Global X Axis").axis = 'X'
+        layout.operator(OBJECT_OT_AlignGlobal.bl_idname, text="Align to Global Y Axis").axis = 'Y'
+        layout.operator(OBJECT_OT_AlignGlobal.bl_idname, text="Align to Global Z Axis").axis = 'Z'
+        layout.operator(OBJECT_OT_AlignToEdge.bl_idname, text="Align to Edge of Another Object").mode = 'PAIR'
+        layout.operator(OBJECT_OT_AlignToEdge.bl_idname, text="Align Selected to Active Edge").mode = 'MANY'
+        layout.operator(OBJECT_OT_AutoAlign.bl_idname, text="Auto Align to Global Axes")
+
+# Sidebar Panel
+class VIEW3D_PT_LineByLine(bpy.types.Panel):
+    bl_label = "Align to Axis/Edge"
+    bl_idname = "VIEW3D_PT_Align_to_Axis_or_Edge"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = 'linebyline'
+
+    def draw(self, context):
+        layout = self.layout
+        layout.label(text="Align Operations")
+        layout.operator(OBJECT_OT_AlignGlobal.bl_idname, text="Align to Global X Axis").axis = 'X'
+        layout.operator(OBJECT_OT_AlignGlobal.bl_idname, text="Align to Global Y Axis").axis = 'Y'
+        layout.operator(OBJECT_OT_AlignGlobal.bl_idname, text="Align to Global Z Axis").axis = 'Z'
+        layout.operator(OBJECT_OT_AlignToEdge.bl_idname, text="Align to Edge of Another Object").mode = 'PAIR'
+        layout.operator(OBJECT_OT_AlignToEdge.bl_idname, text="Align Selected to Active Edge").mode = 'MANY'
+        layout.operator(OBJECT_OT_AutoAlign.bl_idname, text="Auto Align to Global Axes")
+
+# Add to Object menu
+def menu_func(self, context):
+    layout = self.layout
+    layout.separator()
+    layout.menu(OBJECT_MT_AlignSubmenu.bl_idname)
+
+# Register
+def register():
+    bpy.utils.register_class(OBJECT_OT_AlignGlobal)
+    bpy.utils.register_class(OBJECT_OT_AlignToEdge)
+    bpy.utils.register_class(OBJECT_OT_AutoAlign)
+    bpy.utils.register_class(OBJECT_MT_AlignSubmenu)
+    bpy.utils.register_class(VIEW3D_PT_LineByLine)
+    bpy.types.VIEW3D_MT_object.append(menu_func)
+
+def unregister():
+    bpy.utils.unregister_class(OBJECT_OT_AlignGlobal)
+    bpy.utils.unregister_class(OBJECT_OT_AlignToEdge)
+    bpy.utils.unregister_class(OBJECT_OT_AutoAlign)
+    bpy.utils.unregister_class(OBJECT_MT_AlignSubmenu)
+    bpy.utils.unregister_class(VIEW3D_PT_LineByLine)
+    bpy.types.VIEW3D_MT_object.remove(menu_func)
+
+    # The axes cache only exists once an operator has run
+    alignment = sys.modules.get(f"{__package__}.alignment")
+    if alignment is not None:
+        alignment._axes_cache.clear()
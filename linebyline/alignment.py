@@ -0,0 +1,302 @@
+"""Edge and principal axis alignment helpers of the align operators"""
+
+import bmesh
+import mathutils
+import numpy as np
+import os
+from concurrent.futures import ThreadPoolExecutor
+from . import core
+
+# Principal axes per (mesh session uid, world 3x3, method): (geometry version, axes)
+_axes_cache = {}
+# Active edge from the select history per mesh session uid: (geometry version, edge or None)
+_history_cache = {}
+
+def bmesh_active_edge(bm):
+    """Local end points of the active edge from the bmesh select history, or None"""
+    history = list(bm.select_history)
+    if history and isinstance(history[-1], bmesh.types.BMEdge):
+        vert1, vert2 = history[-1].verts
+        return vert1.co.copy(), vert2.co.copy()
+
+    # In vertex select mode the last two picked vertices define the edge
+    if len(history) >= 2 and all(isinstance(e, bmesh.types.BMVert) for e in history[-2:]):
+        vert1, vert2 = history[-2:]
+        if any(vert2 in edge.verts for edge in vert1.link_edges):
+            return vert1.co.copy(), vert2.co.copy()
+
+    return None
+
+def snapshot_edge(obj, snapshot):
+    """Local end points of the first edge with both vertices in a selection snapshot, or None"""
+    mesh = obj.data
+    if obj.mode == 'EDIT':
+        bm = bmesh.from_edit_mesh(mesh)
+        edge_vertices = core.edit_edges(bm)
+        select = core.input_selection(mesh, snapshot, bm)
+    else:
+        edge_vertices = core.edges(mesh)
+        select = core.input_selection(mesh, snapshot)
+    selected = np.flatnonzero(select[edge_vertices].all(axis=1))
+    if not len(selected):
+        return None
+
+    vert1, vert2 = edge_vertices[selected[0]].tolist()
+    if obj.mode == 'EDIT':
+        bm.verts.ensure_lookup_table()
+        return bm.verts[vert1].co.copy(), bm.verts[vert2].co.copy()
+    co = core.positions(mesh)
+    return mathutils.Vector(co[vert1]), mathutils.Vector(co[vert2])
+
+def history_active_edge(mesh):
+    """Active edge of a mesh in object mode from its select history, or None; cached per geometry version"""
+    version = core.geometry_version(mesh)
+    cached = _history_cache.get(mesh.session_uid)
+    if cached is None or cached[0] != version:
+        # The select history is only exposed through bmesh, so this copies the whole mesh
+        bm = bmesh.new()
+        bm.from_mesh(mesh)
+        cached = (version, bmesh_active_edge(bm))
+        bm.free()
+        _history_cache[mesh.session_uid] = cached
+    return cached[1]
+
+def get_active_edge(obj, snapshot="", direction_only=False):
+    """Local end points (v1, v2) of the object's active edge, or None.
+
+    With direction_only the caller only uses the edge direction, so any of
+    several selected edges pointing the same way will do.
+    """
+    if snapshot:
+        return snapshot_edge(obj, snapshot)
+
+    mesh = obj.data
+    if obj.mode == 'EDIT':
+        bm = bmesh.from_edit_mesh(mesh)
+        edge = bmesh_active_edge(bm)
+        if edge is None:
+            selected = next((e for e in bm.edges if e.select), None)
+            if selected is not None:
+                edge = (selected.verts[0].co.copy(), selected.verts[1].co.copy())
+        return edge
+
+    # Find the selected edges without touching each edge in Python
+    selected = np.flatnonzero(core.edge_selection(mesh))
+    if not len(selected):
+        return None
+
+    co = core.positions(mesh)
+    edge_vertices = core.edges(mesh)[selected]
+    vert1, vert2 = edge_vertices[0].tolist()
+    first = mathutils.Vector(co[vert1]), mathutils.Vector(co[vert2])
+    if len(selected) == 1:
+        return first
+
+    if direction_only:
+        # Edges pointing the same way give the same alignment, the arrays settle it without the history
+        directions = co[edge_vertices[:, 1]] - co[edge_vertices[:, 0]]
+        lengths = np.linalg.norm(directions, axis=1, keepdims=True)
+        if lengths.min() > 1e-8:
+            directions = directions / lengths
+            if np.all(directions @ directions[0] > 1.0 - 1e-6):
+                return first
+
+    # Only the select history knows which of several edges is the active one
+    edge = history_active_edge(mesh)
+    return (edge[0].copy(), edge[1].copy()) if edge is not None else first
+
+def edge_world_direction(obj, edge):
+    """Normalized world space direction of a local edge, or None if it is degenerate"""
+    vert1, vert2 = edge
+    direction = obj.matrix_world.to_3x3() @ (vert2 - vert1)
+    if direction.length < 1e-8:
+        return None
+    return direction.normalized()
+
+def rotated_matrix(matrix_world, rotation_matrix):
+    """World matrix rotated in place around the object origin, mesh data untouched"""
+    return (
+        mathutils.Matrix.Translation(matrix_world.translation) @
+        (rotation_matrix @ matrix_world.to_3x3()).to_4x4()
+    )
+
+def align_to_global_axis(objects, axis, snapshot=""):
+    """Align the active edge of every object to a global axis in one pass.
+
+    Returns the names of objects without a usable active edge.
+    """
+    target_vector = mathutils.Vector((0, 0, 0))
+    target_vector[axis] = 1.0
+
+    # Compute all new matrices first, then assign them together
+    new_matrices = []
+    skipped = []
+    for obj in objects:
+        edge = get_active_edge(obj, snapshot, direction_only=True)
+        edge_vector = edge_world_direction(obj, edge) if edge else None
+        if edge_vector is None:
+            skipped.append(obj.name)
+            continue
+        rotation_matrix = edge_vector.rotation_difference(target_vector).to_matrix()
+        new_matrices.append((obj, rotated_matrix(obj.matrix_world, rotation_matrix)))
+
+    for obj, matrix in new_matrices:
+        obj.matrix_world = matrix
+
+    return skipped
+
+def edge_aligned_matrix(obj, edge, target_vector, target_midpoint=None):
+    """New world matrix turning the obj edge onto target_vector, or None for a degenerate edge.
+
+    With a target midpoint the object is also moved so both edge midpoints coincide.
+    """
+    edge_vector = edge_world_direction(obj, edge)
+    if edge_vector is None:
+        return None
+
+    rotation_matrix = edge_vector.rotation_difference(target_vector).to_matrix()
+    matrix = rotated_matrix(obj.matrix_world, rotation_matrix)
+    if target_midpoint is not None:
+        midpoint = matrix @ ((edge[0] + edge[1]) * 0.5)
+        matrix.translation += target_midpoint - midpoint
+    return matrix
+
+def align_to_another_edge(obj, target_obj, match_midpoint=False):
+    """Align the active edge of obj to the active edge of target_obj, returns False on failure"""
+    if not obj or not target_obj:
+        return False
+    return not align_many_to_edge([obj], target_obj, match_midpoint)
+
+def align_many_to_edge(objects, target_obj, match_midpoint=False):
+    """Align the active edge of every object to the active edge of target_obj in one pass.
+
+    The target edge is read once. Returns the names of objects that could
+    not be aligned, or all of them if the target has no usable edge.
+    """
+    edge_tgt = get_active_edge(target_obj, direction_only=not match_midpoint)
+    edge_vector_tgt = edge_world_direction(target_obj, edge_tgt) if edge_tgt else None
+    if edge_vector_tgt is None:
+        return [obj.name for obj in objects]
+
+    target_midpoint = None
+    if match_midpoint:
+        target_midpoint = target_obj.matrix_world @ ((edge_tgt[0] + edge_tgt[1]) * 0.5)
+
+    # Compute all new matrices first, then assign them together
+    new_matrices = []
+    skipped = []
+    for obj in objects:
+        edge_src = get_active_edge(obj, direction_only=not match_midpoint)
+        matrix = edge_aligned_matrix(obj, edge_src, edge_vector_tgt, target_midpoint) if edge_src else None
+        if matrix is None:
+            skipped.append(obj.name)
+            continue
+        new_matrices.append((obj, matrix))
+
+    for obj, matrix in new_matrices:
+        obj.matrix_world = matrix
+
+    return skipped
+
+def box_areas(points, angles, chunk=16384):
+    """Areas of the 2D bounding boxes of points rotated by each angle, in bounded memory"""
+    cos = np.cos(angles)
+    sin = np.sin(angles)
+    low_u = np.full(len(angles), np.inf)
+    high_u = np.full(len(angles), -np.inf)
+    low_v = np.full(len(angles), np.inf)
+    high_v = np.full(len(angles), -np.inf)
+
+    for start in range(0, len(points), chunk):
+        x = points[start:start + chunk, 0:1]
+        y = points[start:start + chunk, 1:2]
+        u = x * cos + y * sin
+        v = y * cos - x * sin
+        low_u = np.minimum(low_u, u.min(axis=0))
+        high_u = np.maximum(high_u, u.max(axis=0))
+        low_v = np.minimum(low_v, v.min(axis=0))
+        high_v = np.maximum(high_v, v.max(axis=0))
+
+    return (high_u - low_u) * (high_v - low_v), high_u - low_u, high_v - low_v
+
+def refine_obb(centered, axes):
+    """Rotate the two major axes around the minor one to the smallest bounding rectangle.
+
+    This approximates a minimum-volume OBB: a coarse 1 degree search over a
+    quarter turn followed by a fine search around the best angle.
+    """
+    points = centered @ axes[:, :2]
+    angles = np.radians(np.arange(0.0, 90.0, 1.0))
+    areas, _, _ = box_areas(points, angles)
+    best = angles[areas.argmin()]
+
+    angles = best + np.radians(np.arange(-1.0, 1.0, 0.05))
+    areas, extent_u, extent_v = box_areas(points, angles)
+    index = areas.argmin()
+    angle = angles[index]
+
+    major = np.cos(angle) * axes[:, 0] + np.sin(angle) * axes[:, 1]
+    middle = np.cos(angle) * axes[:, 1] - np.sin(angle) * axes[:, 0]
+    if extent_v[index] > extent_u[index]:
+        major, middle = middle, major
+    return np.column_stack((major, middle, axes[:, 2]))
+
+def principal_axes(co, method):
+    """Orthonormal principal axes of a point cloud as matrix columns (major, middle, minor).
+
+    Signs follow the local axes they replace and the frame is kept
+    right-handed, so nearly aligned objects do not flip.
+    """
+    centered = co - co.mean(axis=0)
+    covariance = centered.T @ centered / len(co)
+    _, vectors = np.linalg.eigh(covariance)
+    axes = vectors[:, ::-1].copy()
+
+    if method == 'OBB':
+        axes = refine_obb(centered, axes)
+
+    for i in range(2):
+        if axes[i, i] < 0.0:
+            axes[:, i] = -axes[:, i]
+    axes[:, 2] = np.cross(axes[:, 0], axes[:, 1])
+    return axes
+
+def auto_align_objects(objects, method):
+    """Rotate every object so its principal axes match global X, Y and Z.
+
+    The axes are found in world space and the world matrix is rotated about
+    the object origin, so mirrored scale and shear from parents are kept.
+    Vertex arrays are read on the main thread, the per-mesh eigen
+    decompositions run in a thread pool and results are cached per unique
+    mesh and world scale, rotation and shear. Returns the names of objects
+    that were skipped.
+    """
+    jobs = {}
+    skipped = []
+    keys = []
+    for obj in objects:
+        mesh = obj.data
+        if len(mesh.vertices) < 3:
+            skipped.append(obj.name)
+            continue
+        linear = np.array(obj.matrix_world.to_3x3(), dtype=np.float64)
+        key = (mesh.session_uid, tuple(np.round(linear, 6).ravel().tolist()), method)
+        version = core.geometry_version(mesh)
+        keys.append((obj, key))
+        cached = _axes_cache.get(key)
+        if (cached is not None and cached[0] == version) or key in jobs:
+            continue
+        jobs[key] = (version, core.positions(mesh) @ linear.T)
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as pool:
+        futures = {key: (version, pool.submit(principal_axes, co, method)) for key, (version, co) in jobs.items()}
+        for key, (version, future) in futures.items():
+            _axes_cache[key] = (version, future.result())
+
+    for obj, key in keys:
+        axes = _axes_cache[key][1]
+        # Principal axis i maps to global axis i, so the rotation is the transposed frame
+        rotation_matrix = mathutils.Matrix(axes.T.tolist())
+        obj.matrix_world = rotated_matrix(obj.matrix_world, rotation_matrix)
+
+    return skipped
@@ -0,0 +1,114 @@
+"""NumPy displacement pipeline of the cave wall generator.
+
+Every step works in place on an (N, 3) float64 position array and reads its
+parameters from settings, the operator or anything with the same attributes.
+"""
+
+import numpy as np
+from mathutils import noise
+from . import core
+
+# Vertices per step of the progressive pipeline, the vein noise runs per vertex
+CHUNK_SIZE = 16384
+# Edges per erosion step, the erosion is vectorized and much cheaper per element
+EDGE_CHUNK_SIZE = 131072
+
+
+def apply_parabolic_shape(co, settings):
+    # Apply parabolic curvature along both X and Y axes, using X and Y for the curvature
+    co[:, 2] = (co[:, 0] ** 2) * settings.parabolic_curve_x + (co[:, 1] ** 2) * settings.parabolic_curve_y
+
+
+def apply_random_displacement(co, settings):
+    # Displace vertices randomly along Z to create a bumpy cave wall
+    rng = np.random.default_rng(settings.seed)
+    co[:, 2] += rng.uniform(-settings.randomness, settings.randomness, len(co))
+
+
+def generate_veins(co, settings):
+    # Generate veins using a cellular noise pattern (e.g. Voronoi) with X and Y tiling control
+    # mathutils.noise has no array version, so only this lookup runs per vertex
+    cellular_value = np.array([
+        noise.noise((x * settings.vein_tiling_x, y * settings.vein_tiling_y, z * 0.1))
+        for x, y, z in co.tolist()
+    ]) * settings.veins
+
+    # Ensure veins are noticeable, vein_depth controls how deep the veins are
+    veins = cellular_value > 0.1
+    co[veins, 2] -= cellular_value[veins] * settings.vein_depth
+
+
+def erosion_steps(co, edges, settings):
+    """Erosion in chunks of edges, yielding between them; the heights are only written after the last chunk"""
+    # Apply erosion by smoothing vertex heights with the average of each vertex and its neighbors
+    heights = co[:, 2].copy()
+    neighbor_sum = np.zeros(len(heights))
+    neighbor_count = np.zeros(len(heights))
+    for start in range(0, len(edges), EDGE_CHUNK_SIZE):
+        chunk = edges[start:start + EDGE_CHUNK_SIZE]
+        # Count only over the vertex range the chunk touches, a grid chunk covers few rows
+        low = int(chunk.min())
+        local = chunk - low
+        length = int(local.max()) + 1
+        neighbor_sum[low:low + length] += (np.bincount(local[:, 0], weights=heights[chunk[:, 1]], minlength=length) +
+                                           np.bincount(local[:, 1], weights=heights[chunk[:, 0]], minlength=length))
+        neighbor_count[low:low + length] += (np.bincount(local[:, 0], minlength=length) +
+                                             np.bincount(local[:, 1], minlength=length))
+        yield
+
+    avg_height = (heights + neighbor_sum) / (neighbor_count + 1)
+    erosion_effect = avg_height * settings.erosion
+    co[:, 2] = avg_height - erosion_effect
+
+
+def apply_erosion(co, edges, settings):
+    for _ in erosion_steps(co, edges, settings):
+        pass
+
+
+def grid(side, size):
+    """Flat square grid like a subdivided plane: (co, edges, quads) with side * side vertices"""
+    x, y = np.meshgrid(np.linspace(-size / 2.0, size / 2.0, side), np.linspace(-size / 2.0, size / 2.0, side))
+    co = np.column_stack((x.ravel(), y.ravel(), np.zeros(side * side)))
+
+    index = np.arange(side * side, dtype=np.int32).reshape(side, side)
+    edges = np.concatenate((
+        np.column_stack((index[:, :-1].ravel(), index[:, 1:].ravel())),
+        np.column_stack((index[:-1, :].ravel(), index[1:, :].ravel())),
+    ))
+    quads = np.stack((index[:-1, :-1], index[:-1, 1:], index[1:, 1:], index[1:, :-1]), axis=-1).reshape(-1, 4)
+    return co, edges, quads
+
+
+
+def write_topology(mesh, side, quads):
+    """Replace the geometry of the mesh with a side * side grid of quads, UV mapped like a plane"""
+    mesh.clear_geometry()
+    mesh.vertices.add(side * side)
+    mesh.loops.add(quads.size)
+    mesh.polygons.add(len(quads))
+    corners = quads.ravel()
+    mesh.loops.foreach_set("vertex_index", corners)
+    mesh.polygons.foreach_set("loop_start", np.arange(0, quads.size, 4, dtype=np.int32))
+    uv = np.column_stack((corners % side, corners // side)) / (side - 1)
+    mesh.uv_layers.new(name="UVMap").data.foreach_set("uv", uv.astype(np.float32).ravel())
+    mesh.update(calc_edges=True)
+
+
+def write_mesh(mesh, co, quads, side):
+    """Write a grid to the mesh, rebuilding the topology only when the resolution changed"""
+    if len(mesh.vertices) != len(co) or len(mesh.polygons) != len(quads):
+        write_topology(mesh, side, quads)
+    core.set_positions(mesh, co)
+
+def pipeline(co, edges, settings):
+    """Run every displacement step on co, yielding between steps and vein chunks"""
+    apply_parabolic_shape(co, settings)
+    yield
+    apply_random_displacement(co, settings)
+    yield
+    for start in range(0, len(co), CHUNK_SIZE):
+        # Slices are views, so the chunks are displaced in place
+        generate_veins(co[start:start + CHUNK_SIZE], settings)
+        yield
+    yield from erosion_steps(co, edges, settings)
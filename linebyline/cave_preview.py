@@ -0,0 +1,174 @@
+"""Live preview of the cave wall generator.
+
+Every parameter change shows a coarse grid right away. Once the parameters
+settle, a timer refines it to full resolution in short time slices, so the
+UI never blocks. A newer change bumps the generation counter, which stops
+any refinement still running for older parameters.
+"""
+
+import bpy
+import time
+from types import SimpleNamespace
+from . import cave, core
+
+PREVIEW_NAME = "CaveWallPreview"
+# Custom property marking the preview object, so user objects are never touched
+MARKER = "cave_wall_preview"
+
+# Seconds without a parameter change before the refinement starts
+SETTLE_DELAY = 0.3
+# Seconds of work per timer call
+TIME_SLICE = 0.02
+
+# Parameters the pipeline reads, copied so a refinement sees one consistent set
+SETTINGS = (
+    "size", "subdivision", "parabolic_curve_x", "parabolic_curve_y", "seed", "randomness",
+    "erosion", "veins", "vein_tiling_x", "vein_tiling_y", "vein_depth",
+)
+
+# The full resolution grid arrays of the last refinement: ((side, size), co, edges, quads)
+_state = {"generation": 0, "grid": None}
+
+
+def find_preview():
+    """The preview object, found by its marker so it survives renames and file reloads"""
+    return next((obj for obj in bpy.data.objects if obj.get(MARKER)), None)
+
+
+def preview_mesh(kind):
+    """The 'COARSE' or 'FULL' resolution mesh of the preview, created on first use.
+
+    The preview object switches between the two, so the full resolution
+    faces are only rebuilt when the resolution changes.
+    """
+    mesh = next((mesh for mesh in bpy.data.meshes if mesh.get(MARKER) == kind), None)
+    if mesh is None:
+        mesh = bpy.data.meshes.new(f"{PREVIEW_NAME}{kind.title()}")
+        mesh[MARKER] = kind
+    return mesh
+
+
+def ensure_preview(scene):
+    obj = find_preview()
+    if obj is None:
+        obj = bpy.data.objects.new(PREVIEW_NAME, preview_mesh('COARSE'))
+        obj[MARKER] = True
+    if obj.name not in scene.objects:
+        scene.collection.objects.link(obj)
+    return obj
+
+
+def full_grid(side, size):
+    """Fresh positions and the shared edges and quads of the full resolution grid, built once per resolution"""
+    if _state["grid"] is None or _state["grid"][0] != (side, size):
+        _state["grid"] = ((side, size), *cave.grid(side, size))
+    _, co, edges, quads = _state["grid"]
+    return co.copy(), edges, quads
+
+
+def build(settings, side):
+    """Run the whole pipeline at once on a side * side grid"""
+    co, edges, quads = cave.grid(side, settings.size)
+    for _ in cave.pipeline(co, edges, settings):
+        pass
+    return co, quads, side
+
+
+class Refinement:
+    """Timer callback advancing the full resolution pipeline one time slice per call"""
+
+    def __init__(self, generation, settings, side):
+        self.generation = generation
+        self.settings = settings
+        self.side = side
+        self.steps = None
+
+    def run(self):
+        co, edges, quads = full_grid(self.side, self.settings.size)
+        yield
+        yield from cave.pipeline(co, edges, self.settings)
+
+        mesh = preview_mesh('FULL')
+        if len(mesh.vertices) != len(co) or len(mesh.polygons) != len(quads):
+            # Only a new resolution rebuilds the faces, later refinements just write positions
+            cave.write_topology(mesh, self.side, quads)
+            yield
+
+        obj = find_preview()
+        if obj is not None:
+            core.set_positions(mesh, co)
+            obj.data = mesh
+
+    def __call__(self):
+        if self.generation != _state["generation"]:
+            # Cancelled by a newer parameter change
+            return None
+
+        deadline = time.perf_counter() + TIME_SLICE
+        if self.steps is None:
+            self.steps = self.run()
+        for _ in self.steps:
+            if time.perf_counter() >= deadline:
+                return 0.0
+        return None
+
+
+def update(scene):
+    """Show the coarse preview of the scene settings and schedule the refinement"""
+    tool = scene.cave_wall_tool
+    _state["generation"] += 1
+    settings = SimpleNamespace(**{name: getattr(tool, name) for name in SETTINGS})
+
+    # A subdivided plane has two more vertices per side than cuts
+    full_side = settings.subdivision + 2
+    coarse_side = min(tool.preview_resolution, full_side)
+    obj = ensure_preview(scene)
+    mesh = preview_mesh('COARSE')
+    cave.write_mesh(mesh, *build(settings, coarse_side))
+    obj.data = mesh
+
+    if coarse_side < full_side:
+        refinement = Refinement(_state["generation"], settings, full_side)
+        bpy.app.timers.register(refinement, first_interval=SETTLE_DELAY)
+
+
+def _remove_preview_meshes():
+    for mesh in [mesh for mesh in bpy.data.meshes if mesh.get(MARKER)]:
+        bpy.data.meshes.remove(mesh)
+    _state["grid"] = None
+
+
+def keep(scene):
+    """Turn the preview into a regular object at full resolution"""
+    obj = find_preview()
+    if obj is None:
+        return None
+    cancel()
+
+    tool = scene.cave_wall_tool
+    settings = SimpleNamespace(**{name: getattr(tool, name) for name in SETTINGS})
+    side = settings.subdivision + 2
+    co, edges, quads = full_grid(side, settings.size)
+    for _ in cave.pipeline(co, edges, settings):
+        pass
+    mesh = preview_mesh('FULL')
+    cave.write_mesh(mesh, co, quads, side)
+    obj.data = mesh
+
+    del obj[MARKER]
+    del mesh[MARKER]
+    obj.name = mesh.name = "CaveWall"
+    _remove_preview_meshes()
+    return obj
+
+
+def cancel():
+    _state["generation"] += 1
+
+
+def remove():
+    cancel()
+    obj = find_preview()
+    if obj is not None:
+        bpy.data.objects.remove(obj)
+    _remove_preview_meshes()
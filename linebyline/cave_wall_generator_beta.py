@@ -0,0 +1,273 @@
+import bpy
+import random
+import sys
+from . import profiling
+
+# Same key as cave_preview.MARKER, repeated so changes without a preview do not import NumPy
+PREVIEW_MARKER = "cave_wall_preview"
+
+
+def _preview_module():
+    return sys.modules.get(f"{__package__}.cave_preview")
+
+
+def update_preview(self, context):
+    # The operator shares the wall settings, only the scene settings drive the preview
+    if not isinstance(self, CaveWallProperties):
+        return
+    # Importing the preview pulls in NumPy, so only do that once the preview is on
+    if self.live_preview:
+        from . import cave_preview
+        cave_preview.update(context.scene)
+    elif any(obj.get(PREVIEW_MARKER) for obj in bpy.data.objects):
+        # A preview saved with the file is still found after reloading it
+        from . import cave_preview
+        cave_preview.remove()
+
+
+class CaveWallSettings:
+    """Wall settings shared by the operator and the live preview"""
+
+    size: bpy.props.FloatProperty(
+        name="Size",
+        description="Controls the overall size of the cave wall",
+        default=10.0,
+        min=1.0,
+        max=100.0,
+        update=update_preview,
+    )
+
+    subdivision: bpy.props.IntProperty(
+        name="Subdivision",
+        description="Number of subdivisions to add for detail",
+        default=2,
+        min=0,
+        max=1022,
+        soft_max=100,
+        update=update_preview,
+    )
+
+    parabolic_curve_x: bpy.props.FloatProperty(
+        name="Parabolic Curve X",
+        description="Controls the parabolic curvature along the X axis",
+        default=0.01,
+        min=-0.1,
+        max=0.1,
+        update=update_preview,
+    )
+
+    parabolic_curve_y: bpy.props.FloatProperty(
+        name="Parabolic Curve Y",
+        description="Controls the parabolic curvature along the Y axis",
+        default=0.01,
+        min=-0.1,
+        max=0.1,
+        update=update_preview,
+    )
+
+    randomness: bpy.props.FloatProperty(
+        name="Randomness",
+        description="Controls the randomness of the wall's surface",
+        default=0.5,
+        min=0.0,
+        max=1.0,
+        update=update_preview,
+    )
+
+    seed: bpy.props.IntProperty(
+        name="Seed",
+        description="Seed of the random displacement, the same seed gives the same wall",
+        default=0,
+        min=0,
+        update=update_preview,
+    )
+
+    erosion: bpy.props.FloatProperty(
+        name="Erosion",
+        description="Simulates smoother erosion on the cave wall",
+        default=1.0,
+        min=0.0,
+        max=10.0,
+        update=update_preview,
+    )
+
+    veins: bpy.props.FloatProperty(
+        name="Veins",
+        description="Controls the appearance of veins on the cave wall using a cellular noise pattern",
+        default=1.0,
+        min=0.0,
+        max=2.0,
+        update=update_preview,
+    )
+
+    vein_tiling_x: bpy.props.FloatProperty(
+        name="Vein Tiling X",
+        description="Controls the tiling of the Voronoi texture on the X axis",
+        default=1.0,
+        min=0.1,
+        max=5.0,
+        update=update_preview,
+    )
+
+    vein_tiling_y: bpy.props.FloatProperty(
+        name="Vein Tiling Y",
+        description="Controls the tiling of the Voronoi texture on the Y axis",
+        default=1.0,
+        min=0.1,
+        max=5.0,
+        update=update_preview,
+    )
+
+    vein_depth: bpy.props.FloatProperty(
+        name="Vein Depth",
+        description="Controls how deep the veins are displaced",
+        default=1.0,
+        min=0.1,
+        max=10.0,
+        update=update_preview,
+    )
+
+
+@profiling.instrument
+class CaveWallOperator(CaveWallSettings, bpy.types.Operator):
+    bl_idname = "mesh.create_cave_wall"
+    bl_label = "Create Cave Wall"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    randomize_values: bpy.props.BoolProperty(
+        name="Randomize All",
+        description="Randomize all values for a unique cave wall",
+        default=False,
+    )
+
+    def execute(self, context):
+        from . import cave
+
+        if self.randomize_values:
+            self.randomize_parameters()
+            self.randomize_values = False  # Reset button to default state after action
+
+        # Build the same grid as the live preview, so a seed gives the same wall in both
+        with profiling.stage("grid"):
+            side = self.subdivision + 2
+            co, edges, quads = cave.grid(side, self.size)
+            profiling.count(len(co))
+
+        # Run the whole displacement pipeline on one position array and write it back once
+        with profiling.stage("parabolic"):
+            cave.apply_parabolic_shape(co, self)
+        with profiling.stage("random"):
+            cave.apply_random_displacement(co, self)
+        with profiling.stage("veins"):
+            cave.generate_veins(co, self)
+        with profiling.stage("erosion"):
+            cave.apply_erosion(co, edges, self)
+
+        with profiling.stage("write"):
+            mesh = bpy.data.meshes.new("CaveWall")
+            cave.write_mesh(mesh, co, quads, side)
+            obj = bpy.data.objects.new("CaveWall", mesh)
+            context.collection.objects.link(obj)
+
+        # Select the new wall like the add operators do
+        for selected in context.selected_objects:
+            selected.select_set(False)
+        obj.select_set(True)
+        context.view_layer.objects.active = obj
+        return {'FINISHED'}
+
+    def randomize_parameters(self):
+        # Randomize all parameters except size, subdivision, and parabolic curvature
+        self.randomness = random.uniform(0.0, 1.0)
+        self.seed = random.randint(0, 2**31 - 1)
+        self.erosion = random.uniform(0.0, 3.0)
+        self.veins = random.uniform(0.0, 2.0)
+        self.vein_tiling_x = random.uniform(0.1, 5.0)
+        self.vein_tiling_y = random.uniform(0.1, 5.0)
+        self.vein_depth = random.uniform(0.1, 3.0)
+
+
+@profiling.instrument
+class CaveWallKeepPreviewOperator(bpy.types.Operator):
+    """Turn the Live Preview into a Cave Wall Object at Full Resolution"""
+    bl_idname = "mesh.cave_wall_keep_preview"
+    bl_label = "Keep Preview"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        from . import cave_preview
+
+        obj = cave_preview.keep(context.scene)
+        if obj is None:
+            self.report({'WARNING'}, "No preview to keep.")
+            return {'CANCELLED'}
+
+        # The kept wall is a regular object now, the next change starts a new preview
+        context.scene.cave_wall_tool.live_preview = False
+        return {'FINISHED'}
+
+
+class CaveWallProperties(CaveWallSettings, bpy.types.PropertyGroup):
+    live_preview: bpy.props.BoolProperty(
+        name="Live Preview",
+        description="Show a coarse preview while the parameters change and refine it once they settle",
+        default=False,
+        update=update_preview
+    )
+    preview_resolution: bpy.props.IntProperty(
+        name="Preview Resolution",
+        description="Vertices per side of the coarse preview",
+        default=96,
+        min=16,
+        max=256,
+        update=update_preview
+    )
+
+
+class VIEW3D_PT_CaveWall(bpy.types.Panel):
+    bl_label = "Cave Wall"
+    bl_idname = "VIEW3D_PT_cave_wall"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = 'linebyline'
+
+    def draw(self, context):
+        layout = self.layout
+        tool = context.scene.cave_wall_tool
+
+        row = layout.row()
+        row.prop(tool, "live_preview")
+        row.prop(tool, "preview_resolution", text="")
+
+        col = layout.column()
+        for name in ("size", "subdivision", "parabolic_curve_x", "parabolic_curve_y", "randomness", "seed",
+                     "erosion", "veins", "vein_tiling_x", "vein_tiling_y", "vein_depth"):
+            col.prop(tool, name)
+
+        row = layout.row()
+        row.enabled = tool.live_preview
+        row.operator(CaveWallKeepPreviewOperator.bl_idname)
+
+
+def menu_func(self, context):
+    self.layout.separator()
+    self.layout.operator(CaveWallOperator.bl_idname)
+
+def register():
+    bpy.utils.register_class(CaveWallOperator)
+    bpy.utils.register_class(CaveWallKeepPreviewOperator)
+    bpy.utils.register_class(CaveWallProperties)
+    bpy.utils.register_class(VIEW3D_PT_CaveWall)
+    bpy.types.Scene.cave_wall_tool = bpy.props.PointerProperty(type=CaveWallProperties)
+    bpy.types.VIEW3D_MT_mesh_add.append(menu_func)
+
+def unregister():
+    # Stops refinements still running on timers
+    if _preview_module():
+        _preview_module().cancel()
+    bpy.utils.unregister_class(CaveWallOperator)
+    bpy.utils.unregister_class(CaveWallKeepPreviewOperator)
+    bpy.utils.unregister_class(VIEW3D_PT_CaveWall)
+    bpy.utils.unregister_class(CaveWallProperties)
+    del bpy.types.Scene.cave_wall_tool
+    bpy.types.VIEW3D_MT_mesh_add.remove(menu_func)
@@ -0,0 +1,154 @@
+"""Convex collision proxies: mesh arrays go to hull.py, the hulls come back as objects"""
+
+import bpy
+import numpy as np
+import os
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from . import core, hull
+
+# Custom property marking generated proxies, they are replaced on the next run
+MARKER = "collision_proxy"
+
+# Below this many vertices in total the hulls are built in Blender, starting worker processes costs more
+PROCESS_THRESHOLD = 50000
+
+# Blender truncates longer ID names, which would cut off the hint
+MAX_NAME_BYTES = 63
+
+HINT_SUFFIXES = {
+    'CONVCOLONLY': "-convcolonly",
+    'CONVCOL': "-convcol",
+}
+
+
+def export_arrays(obj, depsgraph, apply_modifiers):
+    """Local vertex positions and edges of an object, (N, 3) and (E, 2)"""
+    if not (apply_modifiers and obj.modifiers):
+        return core.positions(obj.data), core.edges(obj.data)
+
+    obj_eval = obj.evaluated_get(depsgraph)
+    mesh = obj_eval.to_mesh()
+    try:
+        points = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", points)
+        edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+        mesh.edges.foreach_get("vertices", edges)
+    finally:
+        obj_eval.to_mesh_clear()
+    return points.reshape(-1, 3), edges.reshape(-1, 2)
+
+
+def _run_worker(arrays, arguments):
+    """Build the hulls of some objects in a separate Python process"""
+    with tempfile.TemporaryDirectory() as directory:
+        input_path = os.path.join(directory, "input.npz")
+        output_path = os.path.join(directory, "output.npz")
+        np.savez(
+            input_path,
+            points=np.concatenate([points for points, _ in arrays]),
+            point_counts=[len(points) for points, _ in arrays],
+            edges=np.concatenate([edges for _, edges in arrays]),
+            edge_counts=[len(edges) for _, edges in arrays],
+        )
+        # sys.executable is the Python that ships with Blender, with NumPy
+        process = subprocess.run(
+            [sys.executable, hull.__file__, input_path, output_path, *arguments],
+            capture_output=True, text=True,
+        )
+        if process.returncode != 0:
+            raise RuntimeError(f"Hull worker failed: {process.stderr[-2000:]}")
+
+        with np.load(output_path) as data:
+            vertex_counts = data["vertex_counts"]
+            vertices = np.split(data["vertices"], np.cumsum(vertex_counts)[:-1])
+            triangles = np.split(data["triangles"], np.cumsum(data["triangle_counts"])[:-1])
+            hull_counts = data["hull_counts"].tolist()
+
+    hulls = list(zip(vertices, triangles)) if len(vertex_counts) else []
+    results = []
+    for count in hull_counts:
+        results.append(hulls[:count])
+        hulls = hulls[count:]
+    return results
+
+
+def build_hulls(arrays, max_vertices, use_decompose, max_hulls, max_concavity, processes=0):
+    """Hulls of every object, [(vertices, triangles), ...] per object.
+
+    Large jobs are split by vertex count over worker processes, processes=0
+    uses one per CPU core.
+    """
+    processes = min(processes or os.cpu_count() or 1, len(arrays))
+    if processes <= 1 or sum(len(points) for points, _ in arrays) < PROCESS_THRESHOLD:
+        return [
+            hull.build_proxies(points, edges, max_vertices, use_decompose, max_hulls, max_concavity)
+            for points, edges in arrays
+        ]
+
+    # Give the next largest object to the worker with the fewest vertices so far
+    batches = [[] for _ in range(processes)]
+    loads = [0] * processes
+    for index in sorted(range(len(arrays)), key=lambda i: -len(arrays[i][0])):
+        worker = loads.index(min(loads))
+        batches[worker].append(index)
+        loads[worker] += len(arrays[index][0])
+    batches = [batch for batch in batches if batch]
+
+    arguments = ["--budget", str(max_vertices), "--max-hulls", str(max_hulls), "--concavity", str(max_concavity)]
+    if use_decompose:
+        arguments.append("--decompose")
+
+    results = [None] * len(arrays)
+    with ThreadPoolExecutor(max_workers=len(batches)) as pool:
+        futures = [pool.submit(_run_worker, [arrays[i] for i in batch], arguments) for batch in batches]
+        for batch, future in zip(batches, futures):
+            for index, hulls in zip(batch, future.result()):
+                results[index] = hulls
+    return results
+
+
+def proxy_name(source_name, index, count, suffix):
+    """Name of a proxy with the hint at the end, shortening the source name when needed"""
+    number = f"_{index + 1}" if count > 1 else ""
+    base = source_name
+    while len(f"{base}{number}{suffix}".encode("utf-8")) > MAX_NAME_BYTES:
+        base = base[:-1]
+    return f"{base}{number}{suffix}"
+
+
+def remove_proxies(source):
+    """Delete the proxies generated for source by an earlier run"""
+    for child in [child for child in source.children if child.get(MARKER)]:
+        mesh = child.data
+        bpy.data.objects.remove(child)
+        if mesh.users == 0:
+            bpy.data.meshes.remove(mesh)
+
+
+def create_proxies(source, hulls, suffix):
+    """Add the hulls as children of source; returns (proxies, names Blender had to change)"""
+    remove_proxies(source)
+    collection = source.users_collection[0] if source.users_collection else bpy.context.scene.collection
+    proxies = []
+    renamed = []
+
+    for index, (vertices, triangles) in enumerate(hulls):
+        name = proxy_name(source.name, index, len(hulls), suffix)
+        mesh = bpy.data.meshes.new(name)
+        mesh.from_pydata(vertices.tolist(), [], triangles.tolist())
+        mesh.update()
+
+        proxy = bpy.data.objects.new(name, mesh)
+        proxy[MARKER] = True
+        proxy.display_type = 'WIRE'
+        # The hulls are in the local space of the source, so no parent inverse is needed
+        proxy.parent = source
+        collection.objects.link(proxy)
+        if proxy.name != name:
+            renamed.append(proxy.name)
+        proxies.append(proxy)
+
+    return proxies, renamed
@@ -0,0 +1,133 @@
+import bpy
+from . import profiling
+
+
+@profiling.instrument
+class GenerateCollisionProxiesOperator(bpy.types.Operator):
+    """Generate Simplified Convex Collision Meshes for the Selected Objects, Named with a Godot Hint"""
+    bl_idname = "object.generate_collision_proxies"
+    bl_label = "Generate Collision Proxies"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    hint: bpy.props.EnumProperty(
+        name="Hint",
+        description="Godot import hint added to the proxy names",
+        items=[
+            ('CONVCOLONLY', "-convcolonly", "Only the convex collision shape is imported"),
+            ('CONVCOL', "-convcol", "The proxy mesh is imported as well, with a convex collision shape"),
+        ],
+        default='CONVCOLONLY'
+    )
+    vertex_budget: bpy.props.IntProperty(
+        name="Vertex Budget",
+        description="Maximum vertices per convex hull, 0 for no limit",
+        default=32,
+        min=0,
+        soft_max=256
+    )
+    decompose: bpy.props.BoolProperty(
+        name="Convex Decomposition",
+        description="Split concave meshes into several convex hulls",
+        default=False
+    )
+    max_hulls: bpy.props.IntProperty(
+        name="Max Hulls",
+        description="Maximum number of convex hulls per object",
+        default=8,
+        min=1,
+        max=64
+    )
+    max_concavity: bpy.props.FloatProperty(
+        name="Max Concavity",
+        description="Parts deeper inside their hull than this, relative to the object size, are split further",
+        default=0.05,
+        min=0.001,
+        max=1.0
+    )
+    apply_modifiers: bpy.props.BoolProperty(
+        name="Apply Modifiers",
+        description="Build the hulls from the evaluated meshes",
+        default=True
+    )
+    processes: bpy.props.IntProperty(
+        name="Processes",
+        description="Worker processes for large selections, 0 for one per CPU core",
+        default=0,
+        min=0,
+        soft_max=32
+    )
+
+    def execute(self, context):
+        from . import collision
+
+        objects = [obj for obj in context.selected_objects if obj.type == 'MESH' and not obj.get(collision.MARKER)]
+        if not objects:
+            self.report({'WARNING'}, "Select at least one mesh object.")
+            return {'CANCELLED'}
+
+        with profiling.stage("export"):
+            depsgraph = context.evaluated_depsgraph_get()
+            arrays = [collision.export_arrays(obj, depsgraph, self.apply_modifiers) for obj in objects]
+            profiling.count(sum(len(points) for points, _ in arrays))
+
+        with profiling.stage("hulls"):
+            try:
+                results = collision.build_hulls(
+                    arrays,
+                    self.vertex_budget,
+                    self.decompose,
+                    self.max_hulls,
+                    self.max_concavity,
+                    self.processes,
+                )
+            except RuntimeError as error:
+                self.report({'ERROR'}, str(error))
+                return {'CANCELLED'}
+
+        with profiling.stage("objects"):
+            suffix = collision.HINT_SUFFIXES[self.hint]
+            created = 0
+            flat = []
+            renamed = []
+            for obj, hulls in zip(objects, results):
+                if not hulls:
+                    flat.append(obj.name)
+                    continue
+                proxies, names = collision.create_proxies(obj, hulls, suffix)
+                created += len(proxies)
+                renamed.extend(names)
+
+        warnings = []
+        if renamed:
+            print("Proxy names taken by other objects:", ", ".join(renamed))
+            warnings.append(f"{len(renamed)} proxy name(s) were taken and got a number after the hint, see console.")
+        if flat:
+            warnings.append(f"Skipped flat objects: {', '.join(flat)}")
+        if warnings:
+            self.report({'WARNING'}, f"Created {created} proxies. " + " ".join(warnings))
+        else:
+            self.report({'INFO'}, f"Created {created} collision proxies for {len(objects)} object(s).")
+        return {'FINISHED'}
+
+
+class VIEW3D_PT_CollisionProxies(bpy.types.Panel):
+    bl_label = "Collision Proxies"
+    bl_idname = "VIEW3D_PT_collision_proxies"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = 'linebyline'
+
+    def draw(self, context):
+        layout = self.layout
+        layout.operator(GenerateCollisionProxiesOperator.bl_idname, text="Convex Hull").decompose = False
+        layout.operator(GenerateCollisionProxiesOperator.bl_idname, text="Convex Decomposition").decompose = True
+
+
+def register():
+    bpy.utils.register_class(GenerateCollisionProxiesOperator)
+    bpy.utils.register_class(VIEW3D_PT_CollisionProxies)
+
+
+def unregister():
+    bpy.utils.unregister_class(GenerateCollisionProxiesOperator)
+    bpy.utils.unregister_class(VIEW3D_PT_CollisionProxies)
@@ -0,0 +1,282 @@
+"""Shared mesh data access with an update-aware array cache.
+
+Imports NumPy, so the operators only import this module when they run. The
+handlers of the package forward depsgraph updates, undo and file loads here
+once it is imported.
+"""
+
+import bmesh
+import bpy
+import numpy as np
+from collections import OrderedDict
+
+# Upper bound for the memory held by cached arrays
+CACHE_LIMIT_BYTES = 512 * 1024 * 1024
+
+# (mesh session uid, array name, element count) -> read-only array, least recently used first
+_array_cache = OrderedDict()
+_cache_bytes = 0
+
+# Geometry update counter per ID session uid, bumped by the depsgraph handler.
+# Session uids are never reused within a session, unlike memory addresses.
+_geometry_versions = {}
+# Bumped whenever all caches are cleared, so old version numbers never match again
+_epoch = 0
+
+
+def geometry_version(id_data):
+    """Counter that changes whenever the geometry of an object or mesh is updated"""
+    return (_epoch, _geometry_versions.get(id_data.session_uid, 0))
+
+
+def invalidate(mesh=None):
+    """Drop the cached arrays of one mesh, or of all meshes.
+
+    Call this after writing mesh data directly, the depsgraph handler only
+    runs once the operator has finished.
+    """
+    global _cache_bytes
+    if mesh is None:
+        _array_cache.clear()
+        _cache_bytes = 0
+        return
+
+    uid = mesh.session_uid
+    _geometry_versions[uid] = _geometry_versions.get(uid, 0) + 1
+    for key in [key for key in _array_cache if key[0] == uid]:
+        _cache_bytes -= _array_cache.pop(key).nbytes
+
+
+def _cached(mesh, name, collection, attribute, dtype, width=1):
+    """Read an attribute of a mesh element collection with foreach_get, memoized per mesh"""
+    global _cache_bytes
+    count = len(collection)
+    key = (mesh.session_uid, name, count)
+    array = _array_cache.get(key)
+    if array is not None:
+        _array_cache.move_to_end(key)
+        return array
+
+    array = np.empty(count * width, dtype=dtype)
+    collection.foreach_get(attribute, array)
+    if width > 1:
+        array = array.reshape(-1, width)
+    array.flags.writeable = False
+
+    _array_cache[key] = array
+    _cache_bytes += array.nbytes
+    while _cache_bytes > CACHE_LIMIT_BYTES and len(_array_cache) > 1:
+        _, evicted = _array_cache.popitem(last=False)
+        _cache_bytes -= evicted.nbytes
+    return array
+
+
+def positions(mesh):
+    """Local vertex positions, (N, 3) float32"""
+    return _cached(mesh, "co", mesh.vertices, "co", np.float32, 3)
+
+
+def vertex_selection(mesh):
+    """Vertex select flags, (N,) bool"""
+    return _cached(mesh, "vertex_select", mesh.vertices, "select", bool)
+
+
+def vertex_normals(mesh):
+    """Vertex normals, (N, 3) float32"""
+    return _cached(mesh, "vertex_normal", mesh.vertex_normals, "vector", np.float32, 3)
+
+
+def edges(mesh):
+    """Edge vertex indices, (E, 2) int32"""
+    return _cached(mesh, "edge_vertices", mesh.edges, "vertices", np.int32, 2)
+
+
+def edge_selection(mesh):
+    """Edge select flags, (E,) bool"""
+    return _cached(mesh, "edge_select", mesh.edges, "select", bool)
+
+
+def edge_seams(mesh):
+    """Edge seam flags, (E,) bool"""
+    return _cached(mesh, "edge_seam", mesh.edges, "use_seam", bool)
+
+
+def loop_vertices(mesh):
+    """Vertex index of every face corner, (L,) int32"""
+    return _cached(mesh, "loop_vertex", mesh.loops, "vertex_index", np.int32)
+
+
+def loop_edges(mesh):
+    """Edge index of every face corner, (L,) int32"""
+    return _cached(mesh, "loop_edge", mesh.loops, "edge_index", np.int32)
+
+
+def polygon_loop_starts(mesh):
+    """First loop index of every face, (F,) int32"""
+    return _cached(mesh, "polygon_loop_start", mesh.polygons, "loop_start", np.int32)
+
+
+def polygon_loop_totals(mesh):
+    """Number of corners of every face, (F,) int32"""
+    return _cached(mesh, "polygon_loop_total", mesh.polygons, "loop_total", np.int32)
+
+
+def polygon_selection(mesh):
+    """Face select flags, (F,) bool"""
+    return _cached(mesh, "polygon_select", mesh.polygons, "select", bool)
+
+
+def polygon_material_indices(mesh):
+    """Material slot index of every face, (F,) int32"""
+    return _cached(mesh, "polygon_material", mesh.polygons, "material_index", np.int32)
+
+
+def uv_coordinates(mesh, layer):
+    """UV coordinates of every face corner in a UV layer, (L, 2) float32"""
+    return _cached(mesh, f"uv:{layer.name}", layer.data, "uv", np.float32, 2)
+
+
+def polygons(mesh):
+    """Vertex indices of every face as a list of lists, e.g. for BVHTree.FromPolygons"""
+    starts = polygon_loop_starts(mesh)
+    return [corners.tolist() for corners in np.split(loop_vertices(mesh), starts[1:])] if len(starts) else []
+
+
+def edit_vertex_selection(bm):
+    """Vertex select flags of an edit bmesh, (N,) bool, never cached.
+
+    The edit mode readers walk the bmesh instead of copying it into the mesh
+    with update_from_editmode, which writes every element of the mesh.
+    """
+    return np.fromiter((v.select for v in bm.verts), dtype=bool, count=len(bm.verts))
+
+
+def edit_edges(bm):
+    """Edge vertex indices of an edit bmesh, (E, 2) int32"""
+    bm.verts.index_update()
+    return np.array([(e.verts[0].index, e.verts[1].index) for e in bm.edges], dtype=np.int32).reshape(-1, 2)
+
+
+# Mesh custom property with the named vertex selection snapshots
+SNAPSHOT_PROPERTY = "selection_snapshots"
+
+
+def save_selection_snapshot(mesh, name, bm=None):
+    """Store the vertex selection under name as a bitset, 32 vertices per integer; returns the selected count.
+
+    Pass the edit bmesh of a mesh in edit mode.
+    """
+    select = vertex_selection(mesh) if bm is None else edit_vertex_selection(bm)
+    bits = np.packbits(select)
+    bits = np.concatenate((bits, np.zeros(-len(bits) % 4, dtype=np.uint8)))
+    if SNAPSHOT_PROPERTY not in mesh:
+        mesh[SNAPSHOT_PROPERTY] = {}
+    mesh[SNAPSHOT_PROPERTY][name] = {"count": len(select), "bits": bits.view(np.int32)}
+    return int(np.count_nonzero(select))
+
+
+def selection_snapshot(mesh, name, count=None):
+    """Vertex select flags saved under name, (N,) bool, or None when missing or the vertex count changed.
+
+    count is the current vertex count, pass len(bm.verts) in edit mode.
+    """
+    snapshots = mesh.get(SNAPSHOT_PROPERTY)
+    snapshot = snapshots.get(name) if snapshots else None
+    if count is None:
+        count = len(mesh.vertices)
+    if snapshot is None or snapshot["count"] != count:
+        return None
+    bits = np.asarray(snapshot["bits"], dtype=np.int32).view(np.uint8)
+    return np.unpackbits(bits, count=snapshot["count"]).astype(bool)
+
+
+def input_selection(mesh, snapshot="", bm=None):
+    """Vertex select flags an operator works on: the snapshot when one is named, else the current selection.
+
+    Pass the edit bmesh of a mesh in edit mode. A missing snapshot selects
+    nothing, so the operators report the mesh as without selection.
+    """
+    count = len(mesh.vertices) if bm is None else len(bm.verts)
+    if not snapshot:
+        return vertex_selection(mesh) if bm is None else edit_vertex_selection(bm)
+    select = selection_snapshot(mesh, snapshot, count)
+    return np.zeros(count, dtype=bool) if select is None else select
+
+
+def restore_selection_snapshot(mesh, name, bm=None):
+    """Select the snapshot vertices with one bulk write per element type; False when the snapshot is unusable.
+
+    In edit mode pass the edit bmesh, the selection is then written to it directly.
+    """
+    select = selection_snapshot(mesh, name, None if bm is None else len(bm.verts))
+    if select is None:
+        return False
+
+    if bm is not None:
+        for edge in bm.edges:
+            edge.select = False
+        for face in bm.faces:
+            face.select = False
+        for vert, flag in zip(bm.verts, select.tolist()):
+            vert.select = flag
+        # Selects the edges and faces whose vertices are all selected
+        bm.select_flush(True)
+        bm.select_history.clear()
+        bmesh.update_edit_mesh(mesh, loop_triangles=False, destructive=False)
+        return True
+
+    # Edges and faces are selected when all their vertices are, as a selection flush would
+    mesh.vertices.foreach_set("select", select)
+    mesh.edges.foreach_set("select", select[edges(mesh)].all(axis=1).ravel())
+    starts = polygon_loop_starts(mesh)
+    if len(starts):
+        mesh.polygons.foreach_set("select", np.logical_and.reduceat(select[loop_vertices(mesh)], starts))
+    mesh.update()
+    invalidate(mesh)
+    return True
+
+
+def world_matrices(objects):
+    """World matrices of the objects, (N, 4, 4) float32, never cached"""
+    if isinstance(objects, bpy.types.bpy_prop_collection):
+        matrices = np.empty(len(objects) * 16, dtype=np.float32)
+        objects.foreach_get("matrix_world", matrices)
+        # foreach_get returns the matrices column-major
+        return matrices.reshape(-1, 4, 4).transpose(0, 2, 1)
+    return np.array([obj.matrix_world for obj in objects], dtype=np.float32).reshape(-1, 4, 4)
+
+
+def to_world(co, matrix):
+    """Transform (N, 3) local positions with a 4x4 matrix"""
+    matrix = np.asarray(matrix, dtype=np.float64)
+    return co @ matrix[:3, :3].T + matrix[:3, 3]
+
+
+def set_positions(mesh, co):
+    """Write (N, 3) local positions back to the mesh and drop its cached arrays"""
+    mesh.vertices.foreach_set("co", np.ascontiguousarray(co, dtype=np.float32).ravel())
+    mesh.update()
+    invalidate(mesh)
+
+
+def track_geometry_updates(depsgraph):
+    """Bump the geometry versions and drop the arrays of everything the depsgraph updated"""
+    for update in depsgraph.updates:
+        if not update.is_updated_geometry:
+            continue
+        id_data = update.id.original
+        if isinstance(id_data, bpy.types.Object):
+            uid = id_data.session_uid
+            _geometry_versions[uid] = _geometry_versions.get(uid, 0) + 1
+            if id_data.type == 'MESH':
+                invalidate(id_data.data)
+        elif isinstance(id_data, bpy.types.Mesh):
+            invalidate(id_data)
+
+
+def clear_all():
+    """Forget every cached array and geometry version, e.g. after undo or loading a file"""
+    global _epoch
+    _epoch += 1
+    _geometry_versions.clear()
+    invalidate()
@@ -0,0 +1,281 @@
+"""Content hashes and the manifest of the incremental glTF export"""
+
+import bpy
+import hashlib
+import json
+import numpy as np
+import os
+from collections import defaultdict
+from . import core
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+# Object types written to the .glb files
+EXPORT_TYPES = {'MESH', 'EMPTY', 'CURVE', 'LIGHT', 'CAMERA'}
+
+
+def _read(collection, attribute, dtype, width=1):
+    array = np.empty(len(collection) * width, dtype=dtype)
+    collection.foreach_get(attribute, array)
+    return array
+
+
+def _value_bytes(value):
+    """Stable bytes of an RNA property value"""
+    if isinstance(value, set):
+        value = sorted(value)
+    elif hasattr(value, "__len__") and not isinstance(value, str):
+        value = tuple(value)
+    return repr(value).encode()
+
+
+def _hash_mesh(digest, mesh, cached):
+    """Add the exported mesh arrays; cached meshes go through the shared array cache"""
+    if cached:
+        arrays = [
+            core.positions(mesh),
+            core.loop_vertices(mesh),
+            core.polygon_loop_starts(mesh),
+            core.polygon_material_indices(mesh),
+        ]
+        arrays += [core.uv_coordinates(mesh, layer) for layer in mesh.uv_layers]
+    else:
+        arrays = [
+            _read(mesh.vertices, "co", np.float32, 3),
+            _read(mesh.loops, "vertex_index", np.int32),
+            _read(mesh.polygons, "loop_start", np.int32),
+            _read(mesh.polygons, "material_index", np.int32),
+        ]
+        arrays += [_read(layer.data, "uv", np.float32, 2) for layer in mesh.uv_layers]
+
+    # Shading: smooth faces, sharp edges and custom split normals
+    arrays.append(_read(mesh.polygons, "use_smooth", bool))
+    sharp_edge = mesh.attributes.get("sharp_edge")
+    if sharp_edge is not None and sharp_edge.domain == 'EDGE':
+        arrays.append(_read(sharp_edge.data, "value", bool))
+    if mesh.has_custom_normals:
+        arrays.append(_read(mesh.corner_normals, "vector", np.float32, 3))
+
+    for array in arrays:
+        digest.update(len(array).to_bytes(8, "little"))
+        digest.update(np.ascontiguousarray(array).tobytes())
+
+    # Color attributes are exported as vertex colors
+    for attribute in mesh.color_attributes:
+        digest.update(f"{attribute.name}|{attribute.domain}".encode())
+        digest.update(_read(attribute.data, "color", np.float32, 4).tobytes())
+
+    # Shape keys are exported as morph targets
+    if mesh.shape_keys:
+        for key_block in mesh.shape_keys.key_blocks:
+            digest.update(key_block.name.encode())
+            digest.update(_read(key_block.data, "co", np.float32, 3).tobytes())
+
+
+def _image_hash(image, images):
+    """Hash of an image: its path, plus its content when that is not the file on disk; memoized in images"""
+    key = image.session_uid
+    if key not in images:
+        digest = hashlib.sha256(f"{image.name}|{image.source}|{image.filepath}".encode())
+        if image.is_dirty or image.source == 'GENERATED':
+            # Painted or generated pixels only exist in memory
+            pixels = np.empty(len(image.pixels), dtype=np.float32)
+            image.pixels.foreach_get(pixels)
+            digest.update(pixels.tobytes())
+        elif image.packed_file is not None:
+            digest.update(image.packed_file.data)
+        images[key] = digest.digest()
+    return images[key]
+
+
+def _hash_node_tree(digest, node_tree, images):
+    """Add the nodes, unlinked input values and links of a node tree, node groups included"""
+    for node in node_tree.nodes:
+        digest.update(f"{node.name}|{node.bl_idname}".encode())
+        image = getattr(node, "image", None)
+        if image is not None:
+            digest.update(_image_hash(image, images))
+        group = getattr(node, "node_tree", None)
+        if group is not None:
+            digest.update(group.name.encode())
+            _hash_node_tree(digest, group, images)
+        for socket in node.inputs:
+            if socket.is_linked or not hasattr(socket, "default_value"):
+                continue
+            digest.update(_value_bytes(socket.default_value))
+    for link in node_tree.links:
+        digest.update(f"{link.from_node.name}.{link.from_socket.identifier}>{link.to_node.name}.{link.to_socket.identifier}".encode())
+
+
+def _hash_material(digest, material, images):
+    """Add the material settings the glTF exporter reads"""
+    if material is None:
+        digest.update(b"<none>")
+        return
+    digest.update(material.name.encode())
+    digest.update(np.array([*material.diffuse_color, material.metallic, material.roughness], dtype=np.float32).tobytes())
+    if material.node_tree:
+        _hash_node_tree(digest, material.node_tree, images)
+
+
+def object_hash(obj, depsgraph, apply_modifiers, images=None):
+    """Hash of everything of one object that ends up in the .glb file.
+
+    The name carries the Godot import hint suffix, so changing the hint
+    changes the hash as well. images memoizes image hashes over several calls.
+    """
+    if images is None:
+        images = {}
+    digest = hashlib.sha256()
+    digest.update(f"{obj.name}|{obj.type}|{obj.parent.name if obj.parent else ''}".encode())
+    digest.update(np.array(obj.matrix_world, dtype=np.float32).tobytes())
+
+    if obj.type in {'MESH', 'CURVE'}:
+        # Without modifiers the evaluated mesh matches the original one
+        if obj.type == 'CURVE' or (apply_modifiers and obj.modifiers):
+            obj_eval = obj.evaluated_get(depsgraph)
+            mesh = obj_eval.to_mesh()
+            try:
+                _hash_mesh(digest, mesh, cached=False)
+            finally:
+                obj_eval.to_mesh_clear()
+        else:
+            _hash_mesh(digest, obj.data, cached=True)
+    elif obj.type == 'EMPTY':
+        digest.update(obj.empty_display_type.encode())
+    elif obj.data is not None:
+        # Lights and cameras: hash their settings through the RNA properties
+        for prop in obj.data.bl_rna.properties:
+            if prop.type in {'BOOLEAN', 'INT', 'FLOAT', 'ENUM', 'STRING'}:
+                digest.update(_value_bytes(getattr(obj.data, prop.identifier)))
+
+    for slot in obj.material_slots:
+        _hash_material(digest, slot.material, images)
+
+    return digest.hexdigest()
+
+
+def collect_units(objects, grouping):
+    """Group the exported objects into units, one .glb file each: name -> [objects]"""
+    units = defaultdict(list)
+    for obj in objects:
+        if obj.type not in EXPORT_TYPES:
+            continue
+        name = obj.name if grouping == 'OBJECT' else obj.users_collection[0].name
+        units[name].append(obj)
+    return units
+
+
+def unit_hash(objects, depsgraph, settings, images=None):
+    digest = hashlib.sha256(json.dumps(settings, sort_keys=True).encode())
+    for obj in sorted(objects, key=lambda obj: obj.name):
+        digest.update(object_hash(obj, depsgraph, settings["apply_modifiers"], images).encode())
+    return digest.hexdigest()
+
+
+def unit_filename(name, used):
+    """File name of a unit, unique even when names only differ in unsafe characters"""
+    stem = bpy.path.clean_name(name)
+    filename = f"{stem}.glb"
+    if filename in used:
+        filename = f"{stem}_{hashlib.sha1(name.encode()).hexdigest()[:8]}.glb"
+    used.add(filename)
+    return filename
+
+
+def load_manifest(directory):
+    path = os.path.join(directory, MANIFEST_NAME)
+    if os.path.exists(path):
+        with open(path) as file:
+            manifest = json.load(file)
+        if manifest.get("version") == MANIFEST_VERSION:
+            return manifest
+    return {"version": MANIFEST_VERSION, "units": {}}
+
+
+def save_manifest(directory, manifest):
+    path = os.path.join(directory, MANIFEST_NAME)
+    with open(path + ".tmp", "w") as file:
+        json.dump(manifest, file, indent=2, sort_keys=True)
+    os.replace(path + ".tmp", path)
+
+
+def export_unit(context, objects, filepath, apply_modifiers):
+    """Export only the objects of one unit, restoring the selection afterwards"""
+    view_layer = context.view_layer
+    # Objects of excluded collections are not in the view layer and cannot be selected
+    in_view_layer = set(view_layer.objects)
+    objects = [obj for obj in objects if obj in in_view_layer]
+    if not objects:
+        raise RuntimeError("None of its objects are in the view layer")
+    selected = list(context.selected_objects)
+    active = view_layer.objects.active
+    try:
+        for obj in selected:
+            obj.select_set(False)
+        for obj in objects:
+            obj.select_set(True)
+        bpy.ops.export_scene.gltf(
+            filepath=filepath,
+            export_format='GLB',
+            use_selection=True,
+            export_apply=apply_modifiers,
+        )
+    finally:
+        for obj in objects:
+            obj.select_set(False)
+        for obj in selected:
+            obj.select_set(True)
+        view_layer.objects.active = active
+
+
+def export_incremental(context, directory, grouping, objects, apply_modifiers, remove_stale=True, force=False):
+    """Export the units whose hash changed and drop the files of units that are gone.
+
+    Pass remove_stale=False when objects is only part of the scene. Returns
+    (exported, unchanged, removed, errors), errors being (unit, message) pairs.
+    """
+    os.makedirs(directory, exist_ok=True)
+    manifest = load_manifest(directory)
+    entries = manifest["units"]
+    depsgraph = context.evaluated_depsgraph_get()
+    settings = {"grouping": grouping, "apply_modifiers": apply_modifiers}
+
+    units = collect_units(objects, grouping)
+    # Stale files are only removed at the end, so their names stay taken until then
+    used = {entry["file"] for entry in entries.values()}
+    # Image hashes are shared by all units, textures are often used by many materials
+    images = {}
+    exported = unchanged = 0
+    errors = []
+
+    for name, unit_objects in units.items():
+        content_hash = unit_hash(unit_objects, depsgraph, settings, images)
+        entry = entries.get(name)
+        filename = entry["file"] if entry else unit_filename(name, used)
+        filepath = os.path.join(directory, filename)
+
+        if not force and entry and entry["hash"] == content_hash and os.path.exists(filepath):
+            unchanged += 1
+            continue
+
+        try:
+            export_unit(context, unit_objects, filepath, apply_modifiers)
+        except RuntimeError as error:
+            errors.append((name, str(error)))
+            continue
+        entries[name] = {"file": filename, "hash": content_hash, "objects": sorted(obj.name for obj in unit_objects)}
+        exported += 1
+
+    # Units that no longer exist leave stale files behind
+    removed = 0
+    stale = [name for name in entries if name not in units] if remove_stale else []
+    for name in stale:
+        filepath = os.path.join(directory, entries.pop(name)["file"])
+        if os.path.exists(filepath):
+            os.remove(filepath)
+        removed += 1
+
+    save_manifest(directory, manifest)
+    return exported, unchanged, removed, errors
@@ -0,0 +1,82 @@
+import bpy
+from . import profiling
+
+@profiling.instrument
+class MESH_OT_mark_face_outline_seams(bpy.types.Operator):
+    """Mark Outline of Selected Faces as Seams"""
+    bl_idname = "mesh.mark_face_outline_seams"
+    bl_label = "Mark Face Outline as Seams"
+    bl_options = {"REGISTER", "UNDO"}
+
+    def execute(self, context):
+        from .seams import mark_face_outline_as_seams
+        return mark_face_outline_as_seams(context)
+
+# Island sizes listed in the info bar, the console gets all of them
+ISLAND_REPORT_LIMIT = 8
+
+@profiling.instrument
+class MESH_OT_analyze_uv_islands(bpy.types.Operator):
+    """Count the UV Islands the Seams Produce and Find Seams that Cut Nothing, without Unwrapping"""
+    bl_idname = "mesh.analyze_uv_islands"
+    bl_label = "Analyze UV Islands"
+    bl_options = {"REGISTER", "UNDO"}
+
+    selected_only: bpy.props.BoolProperty(
+        name="Selected Faces Only",
+        description="Only analyze the islands of the selected faces",
+        default=False
+    )
+    select_problems: bpy.props.BoolProperty(
+        name="Select Problems",
+        description="Select the seam edges that do not separate two islands and the dangling seam ends (edit mode only)",
+        default=True
+    )
+
+    def execute(self, context):
+        from .seams import analyze_uv_islands, select_elements
+
+        obj = context.object
+        if obj is None or obj.type != 'MESH':
+            self.report({'WARNING'}, "The active object must be a mesh.")
+            return {'CANCELLED'}
+
+        island_faces, inner_seams, dangling = analyze_uv_islands(obj, self.selected_only)
+        profiling.count(int(island_faces.sum()))
+
+        sizes = sorted(island_faces.tolist(), reverse=True)
+        print(f"UV islands of '{obj.name}', faces per island:", sizes)
+        listed = ", ".join(map(str, sizes[:ISLAND_REPORT_LIMIT])) + (", ..." if len(sizes) > ISLAND_REPORT_LIMIT else "")
+        message = f"{len(sizes)} UV island(s), faces: {listed}."
+
+        if len(inner_seams) or len(dangling):
+            if self.select_problems and obj.mode == 'EDIT':
+                select_elements(obj, inner_seams, dangling)
+                if len(dangling):
+                    # Lone dangling end vertices only show up in vertex select mode
+                    context.tool_settings.mesh_select_mode[0] = True
+            self.report(
+                {'WARNING'},
+                f"{message} {len(inner_seams)} seam edge(s) inside an island, {len(dangling)} dangling seam end(s)."
+            )
+        else:
+            self.report({'INFO'}, f"{message} All seams are closed.")
+        return {'FINISHED'}
+
+def edge_menu_func(self, context):
+    self.layout.separator()  # Add a separator
+    self.layout.operator(
+        MESH_OT_mark_face_outline_seams.bl_idname, 
+        text="Mark Face Outline as Seams"
+    )
+    self.layout.operator(MESH_OT_analyze_uv_islands.bl_idname)
+
+def register():
+    bpy.utils.register_class(MESH_OT_mark_face_outline_seams)
+    bpy.utils.register_class(MESH_OT_analyze_uv_islands)
+    bpy.types.VIEW3D_MT_edit_mesh_edges.append(edge_menu_func)
+
+def unregister():
+    bpy.utils.unregister_class(MESH_OT_mark_face_outline_seams)
+    bpy.utils.unregister_class(MESH_OT_analyze_uv_islands)
+    bpy.types.VIEW3D_MT_edit_mesh_edges.remove(edge_menu_func)
@@ -0,0 +1,107 @@
+import bpy
+from . import profiling
+
+
+@profiling.instrument
+class EXPORT_SCENE_OT_IncrementalGltf(bpy.types.Operator):
+    """Export Objects or Collections to .glb Files, Skipping Everything Unchanged since the Last Export"""
+    bl_idname = "export_scene.incremental_gltf"
+    bl_label = "Incremental glTF Export"
+    bl_options = {'REGISTER'}
+
+    force: bpy.props.BoolProperty(
+        name="Export All",
+        description="Export every unit, even when its hash did not change",
+        default=False,
+        options={'SKIP_SAVE'}
+    )
+
+    def execute(self, context):
+        from .export_cache import export_incremental
+
+        tool = context.scene.incremental_export_tool
+        if tool.directory.startswith("//") and not bpy.data.is_saved:
+            self.report({'WARNING'}, "Save the .blend file first or choose an absolute export folder.")
+            return {'CANCELLED'}
+
+        objects = context.selected_objects if tool.selected_only else context.scene.objects
+        exported, unchanged, removed, errors = export_incremental(
+            context,
+            bpy.path.abspath(tool.directory),
+            tool.grouping,
+            objects,
+            tool.apply_modifiers,
+            remove_stale=not tool.selected_only,
+            force=self.force,
+        )
+        profiling.count(exported + unchanged)
+
+        summary = f"Exported {exported}, unchanged {unchanged}, removed {removed} stale file(s)."
+        if errors:
+            unit, message = errors[0]
+            self.report({'ERROR'}, f"{len(errors)} export(s) failed, first '{unit}': {message}. {summary}")
+        else:
+            self.report({'INFO'}, summary)
+        return {'FINISHED'}
+
+
+class VIEW3D_PT_IncrementalGltf(bpy.types.Panel):
+    bl_label = "Godot Export"
+    bl_idname = "VIEW3D_PT_incremental_gltf"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = 'linebyline'
+
+    def draw(self, context):
+        layout = self.layout
+        tool = context.scene.incremental_export_tool
+
+        layout.prop(tool, "directory")
+        layout.prop(tool, "grouping")
+        layout.prop(tool, "selected_only")
+        layout.prop(tool, "apply_modifiers")
+
+        layout.operator(EXPORT_SCENE_OT_IncrementalGltf.bl_idname, text="Export Changed").force = False
+        layout.operator(EXPORT_SCENE_OT_IncrementalGltf.bl_idname, text="Export All").force = True
+
+
+class IncrementalExportProperties(bpy.types.PropertyGroup):
+    directory: bpy.props.StringProperty(
+        name="Folder",
+        description="Folder for the .glb files and the manifest",
+        subtype='DIR_PATH',
+        default="//godot_export/"
+    )
+    grouping: bpy.props.EnumProperty(
+        name="Files",
+        description="What goes into one .glb file",
+        items=[
+            ('OBJECT', "Per Object", "One .glb file per object"),
+            ('COLLECTION', "Per Collection", "One .glb file per collection, objects use their first collection"),
+        ],
+        default='OBJECT'
+    )
+    selected_only: bpy.props.BoolProperty(
+        name="Selected Only",
+        description="Only export the selected objects, files of other objects are kept",
+        default=False
+    )
+    apply_modifiers: bpy.props.BoolProperty(
+        name="Apply Modifiers",
+        description="Export the evaluated meshes with their modifiers applied",
+        default=True
+    )
+
+
+def register():
+    bpy.utils.register_class(IncrementalExportProperties)
+    bpy.utils.register_class(EXPORT_SCENE_OT_IncrementalGltf)
+    bpy.utils.register_class(VIEW3D_PT_IncrementalGltf)
+    bpy.types.Scene.incremental_export_tool = bpy.props.PointerProperty(type=IncrementalExportProperties)
+
+
+def unregister():
+    bpy.utils.unregister_class(EXPORT_SCENE_OT_IncrementalGltf)
+    bpy.utils.unregister_class(VIEW3D_PT_IncrementalGltf)
+    bpy.utils.unregister_class(IncrementalExportProperties)
+    del bpy.types.Scene.incremental_export_tool
@@ -0,0 +1,193 @@
+import bpy
+import json
+import os
+import re
+import sys
+from collections import defaultdict
+
+try:
+    from . import profiling
+except ImportError:
+    # The headless audit runs this file as a script, profiling.py sits next to it
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import profiling
+
+# Godot import hints, longest first so '-convcolonly' is not read as '-colonly'
+HINTS = ("-convcolonly", "-convcol", "-colonly", "-col", "-noimp")
+COLLISION_HINTS = {"-col", "-colonly", "-convcol", "-convcolonly"}
+COLLISION_ONLY_HINTS = {"-colonly", "-convcolonly"}
+
+# Numbering Blender appends when a name is already taken
+DUPLICATE_NUMBER = re.compile(r"\.\d{3,}$")
+
+# Issues found by the last audit run from the panel
+_last_issues = []
+
+
+def parse_name(name):
+    """Split an object name into (base name, hints, mangled).
+
+    'mangled' is True when Blender appended a number after a hint, which
+    hides the hint from the Godot importer.
+    """
+    mangled = False
+    match = DUPLICATE_NUMBER.search(name)
+    if match and name[:match.start()].endswith(HINTS):
+        mangled = True
+        name = name[:match.start()]
+
+    hints = []
+    stripped = True
+    while stripped:
+        stripped = False
+        for hint in HINTS:
+            if name.endswith(hint) and len(name) > len(hint):
+                hints.insert(0, hint)
+                name = name[:-len(hint)]
+                stripped = True
+                break
+
+    return name, tuple(hints), mangled
+
+
+def build_index(objects):
+    """Index objects once by parsed base name: base -> [(object, hints, mangled)]"""
+    index = defaultdict(list)
+    for obj in objects:
+        base, hints, mangled = parse_name(obj.name)
+        index[base].append((obj, hints, mangled))
+    return index
+
+
+def audit_objects(objects):
+    """Return a list of (severity, object name, message) tuples"""
+    issues = []
+    index = build_index(objects)
+
+    for base, entries in index.items():
+        seen = defaultdict(list)
+        has_visual = any(not COLLISION_ONLY_HINTS.intersection(hints) for _, hints, _ in entries)
+
+        for obj, hints, mangled in entries:
+            if mangled:
+                issues.append(('ERROR', obj.name, "Blender numbering after the hint, Godot will ignore it"))
+
+            collision = COLLISION_HINTS.intersection(hints)
+            if len(collision) > 1:
+                issues.append(('ERROR', obj.name, f"Conflicting hints {', '.join(sorted(collision))}"))
+            if collision and "-noimp" in hints:
+                issues.append(('ERROR', obj.name, "'-noimp' combined with a collision hint"))
+            if collision and obj.type != 'MESH':
+                issues.append(('ERROR', obj.name, f"Collision hint on a non-mesh object ({obj.type})"))
+
+            if COLLISION_ONLY_HINTS.intersection(hints) and not has_visual:
+                issues.append(('WARNING', obj.name, f"No visual object named '{base}' for this collision"))
+
+            if hints:
+                seen[hints].append(obj.name)
+
+        for hints, names in seen.items():
+            if len(names) > 1:
+                issues.append(('WARNING', names[0], f"'{base}{''.join(hints)}' is used by {len(names)} objects"))
+
+    return issues
+
+
+@profiling.instrument
+class OBJECT_OT_AuditGodotHints(bpy.types.Operator):
+    """Check the Godot import hints of all objects in the scene"""
+    bl_idname = "object.audit_godot_hints"
+    bl_label = "Audit Godot Import Hints"
+
+    def execute(self, context):
+        _last_issues[:] = audit_objects(context.scene.objects)
+
+        for severity, name, message in _last_issues:
+            print(f"{severity}: {name}: {message}")
+
+        errors = sum(1 for severity, _, _ in _last_issues if severity == 'ERROR')
+        warnings = len(_last_issues) - errors
+        if _last_issues:
+            self.report({'WARNING'}, f"Godot hints: {errors} error(s), {warnings} warning(s), see console")
+        else:
+            self.report({'INFO'}, "Godot hints: no issues found")
+        return {'FINISHED'}
+
+
+class VIEW3D_PT_AuditGodotHints(bpy.types.Panel):
+    bl_label = "Godot Hint Audit"
+    bl_idname = "VIEW3D_PT_audit_godot_hints"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = 'linebyline'
+
+    def draw(self, context):
+        layout = self.layout
+        layout.operator(OBJECT_OT_AuditGodotHints.bl_idname, text="Audit Scene")
+
+        # Show the first results of the last run
+        for severity, name, message in _last_issues[:20]:
+            icon = 'ERROR' if severity == 'ERROR' else 'INFO'
+            layout.label(text=f"{name}: {message}", icon=icon)
+        if len(_last_issues) > 20:
+            layout.label(text=f"... and {len(_last_issues) - 20} more")
+
+
+def main(argv):
+    """Audit .blend files headless.
+
+    blender --background --factory-startup --python linebyline/godot_hint_audit.py -- a.blend b.blend --json report.json
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="godot_hint_audit")
+    parser.add_argument("files", nargs="+", help=".blend files to audit")
+    parser.add_argument("--json", help="Write all issues to this JSON file")
+    args = parser.parse_args(argv)
+
+    report = {}
+    errors = 0
+    failed = 0
+    for path in args.files:
+        try:
+            bpy.ops.wm.open_mainfile(filepath=path, load_ui=False)
+        except RuntimeError as error:
+            # A corrupt or unreadable file fails on its own, the other files are still audited
+            message = f"Could not open the file: {error}"
+            report[path] = [{"severity": 'ERROR', "object": "", "message": message}]
+            failed += 1
+            errors += 1
+            print(f"{path}: ERROR: {message}")
+            continue
+
+        issues = audit_objects(bpy.data.objects)
+        report[path] = [
+            {"severity": severity, "object": name, "message": message}
+            for severity, name, message in issues
+        ]
+        errors += sum(1 for severity, _, _ in issues if severity == 'ERROR')
+        for severity, name, message in issues:
+            print(f"{path}: {severity}: {name}: {message}")
+
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(report, file, indent=2)
+
+    print(f"Audited {len(args.files) - failed} file(s), {failed} could not be opened, {errors} error(s)")
+    return 1 if errors else 0
+
+
+def register():
+    bpy.utils.register_class(OBJECT_OT_AuditGodotHints)
+    bpy.utils.register_class(VIEW3D_PT_AuditGodotHints)
+
+
+def unregister():
+    bpy.utils.unregister_class(OBJECT_OT_AuditGodotHints)
+    bpy.utils.unregister_class(VIEW3D_PT_AuditGodotHints)
+
+
+if __name__ == "__main__":
+    if bpy.app.background and "--" in sys.argv:
+        sys.exit(main(sys.argv[sys.argv.index("--") + 1:]))
+    register()
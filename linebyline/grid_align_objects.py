@@ -1,16 +1,8 @@
-bl_info = {
-    "name": "Align to 2D Grid",
-    "blender": (4, 1, 1),
-    "category": "Object",
-    "author": "linebyline",
-    "version": (1, 1, 0),
-    "description": "Align selected objects to a specified 2D grid with spacing",
-    "support": "COMMUNITY",
-}
-
 import bpy
 import math
+from . import profiling
 
+@profiling.instrument
 class OBJECT_OT_AlignToGrid(bpy.types.Operator):
     bl_idname = "object.align_to_grid"
     bl_label = "Align to Grid"
@@ -89,6 +81,3 @@ def unregister():
     bpy.utils.unregister_class(VIEW3D_PT_AlignToGridPanel)
     bpy.utils.unregister_class(AlignToGridProperties)
     del bpy.types.Scene.align_to_grid_tool
-
-if __name__ == "__main__":
-    register()
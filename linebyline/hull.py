@@ -0,0 +1,286 @@
+"""Convex hulls and approximate convex decomposition with NumPy only.
+
+This module imports neither bpy nor the rest of the addon, so collision.py
+can run it in worker processes with the Python that ships with Blender:
+
+    python hull.py input.npz output.npz --budget 32 --decompose --max-hulls 8 --concavity 0.05
+
+input.npz holds "points" (all objects concatenated), "point_counts", "edges"
+(indices local to each object) and "edge_counts". output.npz holds the hulls
+of all objects concatenated: "vertices", "vertex_counts", "triangles",
+"triangle_counts" and "hull_counts" (hulls per object).
+"""
+
+import argparse
+import sys
+import numpy as np
+
+# Relative to the size of the point cloud, points closer to a plane count as on it
+EPSILON = 1e-9
+
+
+def _planes(points, faces):
+    """Outward unit normals and plane offsets of triangles"""
+    a, b, c = points[faces[:, 0]], points[faces[:, 1]], points[faces[:, 2]]
+    normals = np.cross(b - a, c - a)
+    normals /= np.maximum(np.linalg.norm(normals, axis=1, keepdims=True), 1e-300)
+    return normals, np.einsum("ij,ij->i", normals, a)
+
+
+def _initial_simplex(points, tolerance):
+    """Four points spanning a tetrahedron, or None when the points are flat"""
+    first = np.argmin(points[:, 0])
+    second = np.argmax(np.linalg.norm(points - points[first], axis=1))
+    line = points[second] - points[first]
+    if np.linalg.norm(line) <= tolerance:
+        return None
+
+    # Farthest from the line, then farthest from the plane
+    third = np.argmax(np.linalg.norm(np.cross(points - points[first], line), axis=1))
+    normal = np.cross(line, points[third] - points[first])
+    if np.linalg.norm(normal) <= tolerance:
+        return None
+    normal /= np.linalg.norm(normal)
+    heights = (points - points[first]) @ normal
+    fourth = np.argmax(np.abs(heights))
+    if abs(heights[fourth]) <= tolerance:
+        return None
+    return first, second, third, fourth
+
+
+def convex_hull(points, max_vertices=0):
+    """Quickhull, adding the farthest outside point until none is left or the budget is used.
+
+    Returns (vertices, triangles) with outward facing triangles, or None when
+    the points do not span a volume. With a budget the hull only uses the
+    max_vertices points that matter most, so it can cut slightly into the shape.
+    """
+    points = np.unique(np.asarray(points, dtype=np.float64), axis=0)
+    if len(points) < 4:
+        return None
+    tolerance = EPSILON * max(np.ptp(points, axis=0).max(), 1.0)
+    simplex = _initial_simplex(points, tolerance)
+    if simplex is None:
+        return None
+
+    first, second, third, fourth = simplex
+    tetrahedron = np.array([
+        [first, second, third], [first, fourth, second],
+        [second, fourth, third], [third, fourth, first],
+    ])
+    # Turn every face away from the center of the tetrahedron
+    center = points[list(simplex)].mean(axis=0)
+    normals, offsets = _planes(points, tetrahedron)
+    inward = normals @ center - offsets > 0
+    tetrahedron[inward] = tetrahedron[inward][:, ::-1]
+
+    # Face arrays grow by doubling; neighbors[f, k] is the face across the edge from corner k to k + 1
+    capacity = 64
+    faces = np.zeros((capacity, 3), dtype=np.int64)
+    normals = np.zeros((capacity, 3))
+    offsets = np.zeros(capacity)
+    neighbors = np.full((capacity, 3), -1, dtype=np.int64)
+    # Height of the farthest outside point of each face, -inf for faces without points or removed
+    farthest = np.full(capacity, -np.inf)
+    alive = np.zeros(capacity, dtype=bool)
+    outside = {}
+    count = 0
+
+    def add_faces(new_faces, candidates):
+        """Append faces and give them the candidate points above them; returns their indices"""
+        nonlocal faces, normals, offsets, neighbors, farthest, alive, capacity, count
+        while count + len(new_faces) > capacity:
+            capacity *= 2
+            faces = np.resize(faces, (capacity, 3))
+            normals = np.resize(normals, (capacity, 3))
+            offsets = np.resize(offsets, capacity)
+            neighbors = np.resize(neighbors, (capacity, 3))
+            farthest = np.resize(farthest, capacity)
+            alive = np.resize(alive, capacity)
+        indices = np.arange(count, count + len(new_faces))
+        count += len(new_faces)
+        faces[indices] = new_faces
+        normals[indices], offsets[indices] = _planes(points, new_faces)
+        neighbors[indices] = -1
+        farthest[indices] = -np.inf
+        alive[indices] = True
+
+        if len(candidates):
+            distances = points[candidates] @ normals[indices].T - offsets[indices]
+            best = np.argmax(distances, axis=1)
+            heights = distances[np.arange(len(candidates)), best]
+            above = heights > tolerance
+            candidates, best, heights = candidates[above], best[above], heights[above]
+            for j in np.unique(best):
+                mine = best == j
+                outside[indices[j]] = candidates[mine]
+                farthest[indices[j]] = heights[mine].max()
+        return indices
+
+    indices = add_faces(tetrahedron, np.arange(len(points)))
+    edge_faces = {}
+    for face in indices:
+        for k in range(3):
+            edge_faces[faces[face, k], faces[face, (k + 1) % 3]] = (face, k)
+    for (a, b), (face, k) in edge_faces.items():
+        neighbors[face, k] = edge_faces[b, a][0]
+    hull_vertices = 4
+
+    while not max_vertices or hull_vertices < max_vertices:
+        start = int(np.argmax(farthest[:count]))
+        if farthest[start] == -np.inf:
+            break
+        candidates = outside.pop(start)
+        apex = candidates[np.argmax(points[candidates] @ normals[start] - offsets[start])]
+        point = points[apex]
+
+        # Walk the faces the apex sees, collecting the horizon edges with the face behind them
+        visible = {start}
+        stack = [start]
+        horizon = []
+        while stack:
+            face = stack.pop()
+            for k in range(3):
+                neighbor = neighbors[face, k]
+                if neighbor in visible:
+                    continue
+                if normals[neighbor] @ point - offsets[neighbor] > tolerance:
+                    visible.add(neighbor)
+                    stack.append(neighbor)
+                else:
+                    horizon.append((faces[face, k], faces[face, (k + 1) % 3], neighbor))
+
+        orphans = [candidates] + [outside.pop(face) for face in visible if face in outside]
+        orphans = np.concatenate(orphans)
+        orphans = orphans[orphans != apex]
+        removed = list(visible)
+        alive[removed] = False
+        farthest[removed] = -np.inf
+
+        # A fan of new faces from the horizon to the apex, linked to each other and to the faces behind
+        horizon = np.array(horizon, dtype=np.int64)
+        new_faces = np.column_stack((horizon[:, :2], np.full(len(horizon), apex)))
+        indices = add_faces(new_faces, orphans)
+        by_start = dict(zip(horizon[:, 0].tolist(), indices.tolist()))
+        by_end = dict(zip(horizon[:, 1].tolist(), indices.tolist()))
+        for (a, b, behind), face in zip(horizon.tolist(), indices.tolist()):
+            neighbors[face] = (behind, by_start[b], by_end[a])
+            k = np.flatnonzero(faces[behind] == b)[0]
+            neighbors[behind, k] = face
+        hull_vertices += 1
+
+    used, triangles = np.unique(faces[:count][alive[:count]], return_inverse=True)
+    return points[used], triangles.reshape(-1, 3).astype(np.int32)
+
+
+def concavity(points, vertices, triangles):
+    """Deepest point below the hull surface and its depth; 0 for convex shapes"""
+    normals, offsets = _planes(vertices, triangles)
+    depth = np.min(offsets - points @ normals.T, axis=1)
+    deepest = np.argmax(depth)
+    return deepest, max(depth[deepest], 0.0)
+
+
+def split(points, edges, axis, position):
+    """Split at a plane, adding the points where edges cross it to both halves"""
+    side = points[:, axis] > position
+    a, b = points[edges[:, 0]], points[edges[:, 1]]
+    crossing = side[edges[:, 0]] != side[edges[:, 1]]
+    t = (position - a[crossing, axis]) / (b[crossing, axis] - a[crossing, axis])
+    cut = a[crossing] + t[:, None] * (b[crossing] - a[crossing])
+
+    halves = []
+    for mask in (~side, side):
+        # Keep the edges within the half, re-indexed to its points
+        index = np.cumsum(mask) - 1
+        inner = mask[edges[:, 0]] & mask[edges[:, 1]]
+        halves.append((np.concatenate((points[mask], cut)), index[edges[inner]]))
+    return halves
+
+
+def decompose(points, edges, max_vertices=0, max_hulls=8, max_concavity=0.05):
+    """Approximate convex decomposition: split the most concave part until it is convex enough.
+
+    A part is split at the plane through its deepest point below the hull,
+    across its longest side. max_concavity is relative to the size of the
+    whole shape. Returns a list of (vertices, triangles).
+    """
+    points = np.asarray(points, dtype=np.float64)
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    limit = max_concavity * np.linalg.norm(np.ptp(points, axis=0))
+
+    parts = []
+
+    def add(part_points, part_edges):
+        hull = convex_hull(part_points, max_vertices)
+        if hull is not None:
+            deepest, depth = concavity(part_points, *hull)
+            parts.append([depth, deepest, part_points, part_edges, hull])
+
+    add(points, edges)
+    while parts and len(parts) < max_hulls:
+        worst = max(range(len(parts)), key=lambda i: parts[i][0])
+        depth, deepest, part_points, part_edges, _ = parts[worst]
+        if depth <= limit:
+            break
+
+        extent = np.ptp(part_points, axis=0)
+        axis = int(np.argmax(extent))
+        position = part_points[deepest, axis]
+        low, high = part_points[:, axis].min(), part_points[:, axis].max()
+        if not low + 0.05 * extent[axis] < position < high - 0.05 * extent[axis]:
+            # The deepest point lies at the edge of the part, split through the middle instead
+            position = (low + high) / 2.0
+
+        parts.pop(worst)
+        for half in split(part_points, part_edges, axis, position):
+            add(*half)
+
+    return [part[4] for part in parts]
+
+
+def build_proxies(points, edges, max_vertices=0, use_decompose=False, max_hulls=8, max_concavity=0.05):
+    """Hulls of one object: one convex hull, or a decomposition into several"""
+    if use_decompose:
+        return decompose(points, edges, max_vertices, max_hulls, max_concavity)
+    hull = convex_hull(points, max_vertices)
+    return [] if hull is None else [hull]
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(prog="hull")
+    parser.add_argument("input")
+    parser.add_argument("output")
+    parser.add_argument("--budget", type=int, default=0, help="Maximum vertices per hull, 0 for no limit")
+    parser.add_argument("--decompose", action="store_true", help="Split concave shapes into several hulls")
+    parser.add_argument("--max-hulls", type=int, default=8)
+    parser.add_argument("--concavity", type=float, default=0.05)
+    args = parser.parse_args(argv)
+
+    data = np.load(args.input)
+    object_points = np.split(data["points"], np.cumsum(data["point_counts"])[:-1])
+    object_edges = np.split(data["edges"], np.cumsum(data["edge_counts"])[:-1])
+
+    vertices, vertex_counts, triangles, triangle_counts, hull_counts = [], [], [], [], []
+    for points, edges in zip(object_points, object_edges):
+        hulls = build_proxies(points, edges, args.budget, args.decompose, args.max_hulls, args.concavity)
+        hull_counts.append(len(hulls))
+        for hull_vertices, hull_triangles in hulls:
+            vertices.append(hull_vertices)
+            vertex_counts.append(len(hull_vertices))
+            triangles.append(hull_triangles)
+            triangle_counts.append(len(hull_triangles))
+
+    np.savez(
+        args.output,
+        vertices=np.concatenate(vertices) if vertices else np.empty((0, 3)),
+        vertex_counts=np.array(vertex_counts, dtype=np.int64),
+        triangles=np.concatenate(triangles) if triangles else np.empty((0, 3), dtype=np.int32),
+        triangle_counts=np.array(triangle_counts, dtype=np.int64),
+        hull_counts=np.array(hull_counts, dtype=np.int64),
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,96 @@
+"""Origin placement helpers of the set origin operators"""
+
+import bpy
+import bmesh
+from collections import defaultdict
+from mathutils import Matrix, Vector
+from . import core
+
+
+def selected_vertex_center(mesh, snapshot=""):
+    """Average local position of the selected vertices, or None if none are selected"""
+    select = core.input_selection(mesh, snapshot)
+    if not select.any():
+        return None
+
+    return Vector(core.positions(mesh)[select].mean(axis=0, dtype=float))
+
+
+# Per-axis anchor of each preset: MIN, CENTER or MAX of the local bounding box
+PRESET_ANCHORS = {
+    'BOTTOM_CENTER': ('CENTER', 'CENTER', 'MIN'),
+    'MIN_CORNER': ('MIN', 'MIN', 'MIN'),
+}
+
+
+def preset_origin(mesh, preset, custom_anchor):
+    """Local origin position for a preset, or None if the mesh has no usable vertices"""
+    if not len(mesh.vertices):
+        return None
+    co = core.positions(mesh)
+
+    if preset == 'LOWEST_SELECTED':
+        select = core.vertex_selection(mesh)
+        if not select.any():
+            return None
+        selected = co[select]
+        return Vector(selected[selected[:, 2].argmin()])
+
+    anchor = custom_anchor if preset == 'CUSTOM' else PRESET_ANCHORS[preset]
+    low = co.min(axis=0)
+    high = co.max(axis=0)
+    bounds = {'MIN': low, 'CENTER': (low + high) * 0.5, 'MAX': high}
+    return Vector([bounds[anchor[axis]][axis] for axis in range(3)])
+
+
+def mesh_users(meshes):
+    """Map mesh pointers to every object using that mesh, in one scan of bpy.data"""
+    users = defaultdict(list)
+    for obj in bpy.data.objects:
+        if obj.type == 'MESH' and obj.data.as_pointer() in meshes:
+            users[obj.data.as_pointer()].append(obj)
+    return users
+
+
+def edit_selected_center(bm, select=None):
+    """Average local position of the selected vertices of an edit bmesh, or of those flagged in select, or None"""
+    if select is None:
+        selected = [v.co for v in bm.verts if v.select]
+    else:
+        selected = [v.co for v, flag in zip(bm.verts, select.tolist()) if flag]
+    if not selected:
+        return None
+    return sum(selected, Vector()) / len(selected)
+
+
+def compensate_users(offset, users):
+    """Keep every user of a shifted mesh, and its children, in place in world space"""
+    for obj in users:
+        obj.matrix_world = obj.matrix_world @ Matrix.Translation(offset)
+        for child in obj.children:
+            child.matrix_parent_inverse = Matrix.Translation(-offset) @ child.matrix_parent_inverse
+
+
+def shift_origin(mesh, offset, users):
+    """Move the origin to the local point offset without moving the geometry in world space.
+
+    The mesh is shifted once and every object using it is compensated, so
+    shared meshes stay in place for all their users. Children keep their
+    world transform as well.
+    """
+    mesh.transform(Matrix.Translation(-offset), shape_keys=True)
+    mesh.update()
+    core.invalidate(mesh)
+    compensate_users(offset, users)
+
+
+def shift_origin_edit(mesh, offset, users):
+    """Same as shift_origin, applied in place to the edit bmesh of the mesh"""
+    bm = bmesh.from_edit_mesh(mesh)
+    bm.transform(Matrix.Translation(-offset))
+    for layer in bm.verts.layers.shape.values():
+        for v in bm.verts:
+            v[layer] -= offset
+    bmesh.update_edit_mesh(mesh, loop_triangles=False, destructive=False)
+    core.invalidate(mesh)
+    compensate_users(offset, users)
@@ -0,0 +1,128 @@
+"""Opt-in timing of the linebyline operators, configured from the addon preferences"""
+
+import functools
+import os
+import time
+from contextlib import nullcontext
+
+# Mirrored from the addon preferences so the disabled check is one lookup
+_profiling = {"enabled": False, "output": 'NONE', "directory": ""}
+# Runs of the instrumented operators currently executing, innermost last
+_runs = []
+_NULL_STAGE = nullcontext()
+
+
+class _Stage:
+    """Times one named stage of the innermost instrumented operator"""
+
+    def __init__(self, run, name):
+        self.run = run
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.run["stages"].append((self.name, self.start, time.perf_counter() - self.start))
+        return False
+
+
+def stage(name):
+    """Context manager timing a named stage, a shared no-op when profiling is disabled"""
+    if not _profiling["enabled"] or not _runs:
+        return _NULL_STAGE
+    return _Stage(_runs[-1], name)
+
+
+def count(elements):
+    """Add processed elements to the throughput of the running operator"""
+    if _profiling["enabled"] and _runs:
+        _runs[-1]["elements"] += elements
+
+
+def instrument(operator_class):
+    """Class decorator wrapping an operator's execute with the profiling layer"""
+    execute = operator_class.execute
+
+    @functools.wraps(execute)
+    def wrapper(self, context):
+        if not _profiling["enabled"]:
+            return execute(self, context)
+        return _profiled_execute(execute, self, context)
+
+    operator_class.execute = wrapper
+    return operator_class
+
+
+def _profiled_execute(execute, operator, context):
+    run = {"stages": [], "elements": 0}
+    output = _profiling["output"]
+    if output == 'PSTATS':
+        import cProfile
+        profiler = cProfile.Profile()
+    else:
+        profiler = None
+
+    _runs.append(run)
+    start = time.perf_counter()
+    try:
+        if profiler:
+            result = profiler.runcall(execute, operator, context)
+        else:
+            result = execute(operator, context)
+    finally:
+        total = time.perf_counter() - start
+        _runs.pop()
+
+    name = operator.bl_idname
+    parts = [f"{name}: {total * 1000.0:.1f} ms"]
+    # Stages entered once per object are summed into one entry
+    stage_totals = {}
+    for stage_name, _, duration in run["stages"]:
+        stage_totals[stage_name] = stage_totals.get(stage_name, 0.0) + duration
+    parts += [f"{stage_name} {duration * 1000.0:.1f} ms" for stage_name, duration in stage_totals.items()]
+    if run["elements"]:
+        parts.append(f"{run['elements']} elements, {run['elements'] / max(total, 1e-9):,.0f}/s")
+    message = ", ".join(parts)
+    print(message)
+    operator.report({'INFO'}, message)
+
+    if output != 'NONE':
+        import bpy
+        import tempfile
+        directory = bpy.path.abspath(_profiling["directory"]) or tempfile.gettempdir()
+        stem = os.path.join(directory, f"{name.replace('.', '_')}_{time.strftime('%Y%m%d_%H%M%S')}")
+        if profiler:
+            profiler.dump_stats(stem + ".pstats")
+        else:
+            _write_trace(stem + ".json", name, start, total, run)
+
+    return result
+
+
+def _write_trace(path, name, start, total, run):
+    """Write a Chrome trace (chrome://tracing, Perfetto) of one operator run"""
+    import json
+    import threading
+
+    pid = os.getpid()
+    tid = threading.get_ident()
+    events = [{"name": name, "ph": "X", "ts": 0.0, "dur": total * 1e6, "pid": pid, "tid": tid,
+               "args": {"elements": run["elements"]}}]
+    events += [
+        {"name": stage_name, "ph": "X", "ts": (stage_start - start) * 1e6, "dur": duration * 1e6,
+         "pid": pid, "tid": tid}
+        for stage_name, stage_start, duration in run["stages"]
+    ]
+    with open(path, "w") as file:
+        json.dump({"traceEvents": events}, file)
+
+
+def configure(preferences):
+    """Copy the profiling settings of the addon preferences"""
+    _profiling.update(
+        enabled=preferences.profiling_enabled,
+        output=preferences.profile_output,
+        directory=preferences.profile_directory,
+    )
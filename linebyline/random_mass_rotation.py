@@ -0,0 +1,293 @@
+import bpy
+import random
+import sys
+from math import radians
+from . import profiling
+
+@profiling.instrument
+class RandomManipulatorOperator(bpy.types.Operator):
+    """Randomly Rotate and Move Selected Objects"""
+    bl_idname = "object.random_manipulator_operator"
+    bl_label = "Random Manipulator"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        from .scatter import SNAP_DIRECTIONS, random_offset, resolve_overlaps, scatter_with_min_distance, snap_to_surface, translate
+
+        tool = context.scene.random_manipulator_tool
+
+        # Get user settings for rotation
+        random_rotation_strength = tool.rotation_strength
+        apply_rotation_x = tool.rotation_apply_x
+        apply_rotation_y = tool.rotation_apply_y
+        apply_rotation_z = tool.rotation_apply_z
+
+        # Get user settings for movement
+        move_strength_x = tool.move_strength_x
+        move_strength_y = tool.move_strength_y
+        move_strength_z = tool.move_strength_z
+        move_strength = (move_strength_x, move_strength_y, move_strength_z)
+
+        mesh_objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
+        origins = [obj.matrix_world.translation.copy() for obj in mesh_objects]
+        profiling.count(len(mesh_objects))
+
+        with profiling.stage("rotate"):
+            for obj in mesh_objects:
+                # Apply random rotation
+                if apply_rotation_x:
+                    obj.rotation_euler.x += radians(random.uniform(-random_rotation_strength, random_rotation_strength))
+                if apply_rotation_y:
+                    obj.rotation_euler.y += radians(random.uniform(-random_rotation_strength, random_rotation_strength))
+                if apply_rotation_z:
+                    obj.rotation_euler.z += radians(random.uniform(-random_rotation_strength, random_rotation_strength))
+
+        # The moves below write world matrices, which have to include the new rotations
+        context.view_layer.update()
+
+        # Apply random movement
+        if tool.min_distance_enabled:
+            with profiling.stage("scatter"):
+                failed = scatter_with_min_distance(
+                    mesh_objects,
+                    move_strength,
+                    tool.min_distance,
+                    tool.max_attempts,
+                )
+            if failed:
+                self.report({'WARNING'}, f"No free spot found for {failed} object(s), left in place.")
+        else:
+            with profiling.stage("move"):
+                for obj in mesh_objects:
+                    translate(obj, random_offset(*move_strength))
+
+        # Push apart or re-roll objects that still interpenetrate
+        if tool.resolve_overlaps:
+            with profiling.stage("resolve"):
+                context.view_layer.update()
+                remaining = resolve_overlaps(
+                    mesh_objects,
+                    origins,
+                    move_strength,
+                    tool.resolve_mode,
+                    tool.resolve_iterations,
+                )
+            if remaining:
+                self.report({'WARNING'}, f"{remaining} overlapping pair(s) left after resolving.")
+
+        # Snap moved objects onto the target surface
+        if tool.snap_enabled:
+            target = tool.snap_target
+            if target is None:
+                self.report({'WARNING'}, "No snap target selected!")
+                return {'FINISHED'}
+
+            with profiling.stage("snap"):
+                missed = snap_to_surface(
+                    mesh_objects,
+                    target,
+                    context.evaluated_depsgraph_get(),
+                    SNAP_DIRECTIONS[tool.snap_direction],
+                    tool.snap_align_normal,
+                )
+            if missed:
+                self.report({'WARNING'}, f"{missed} object(s) did not hit the snap target.")
+
+        return {'FINISHED'}
+
+class RandomManipulatorPanel(bpy.types.Panel):
+    """Creates a Panel in the Tool Shelf"""
+    bl_label = "Random Manipulator"
+    bl_idname = "OBJECT_PT_random_manipulator"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = 'linebyline'
+
+    def draw(self, context):
+        layout = self.layout
+        tool = context.scene.random_manipulator_tool
+
+        # Rotation settings
+        layout.label(text="Random Rotation Settings")
+        layout.prop(tool, "rotation_strength", text="Strength (°)")
+
+        row = layout.row(align=True)
+        row.prop(tool, "rotation_apply_x", text="X")
+        row.prop(tool, "rotation_apply_y", text="Y")
+        row.prop(tool, "rotation_apply_z", text="Z")
+
+        # Movement settings
+        layout.separator()
+        layout.label(text="Random Movement Settings")
+        layout.prop(tool, "move_strength_x", text="Strength X")
+        layout.prop(tool, "move_strength_y", text="Strength Y")
+        layout.prop(tool, "move_strength_z", text="Strength Z")
+
+        # Minimum distance settings
+        layout.prop(tool, "min_distance_enabled", text="Minimum Distance")
+        if tool.min_distance_enabled:
+            layout.prop(tool, "min_distance", text="Distance")
+            layout.prop(tool, "max_attempts", text="Attempts")
+
+        # Overlap resolution settings
+        layout.prop(tool, "resolve_overlaps", text="Resolve Overlaps")
+        if tool.resolve_overlaps:
+            layout.prop(tool, "resolve_mode", text="Mode")
+            layout.prop(tool, "resolve_iterations", text="Iterations")
+
+        # Surface snapping settings
+        layout.separator()
+        layout.prop(tool, "snap_enabled", text="Snap to Surface")
+        if tool.snap_enabled:
+            layout.prop(tool, "snap_target", text="Target")
+            layout.prop(tool, "snap_direction", text="Direction")
+            layout.prop(tool, "snap_align_normal", text="Align to Normal")
+
+        # Apply button
+        layout.separator()
+        layout.operator("object.random_manipulator_operator", text="Apply Random Manipulation")
+
+class RandomManipulatorProperties(bpy.types.PropertyGroup):
+    # Rotation properties
+    rotation_strength: bpy.props.FloatProperty(
+        name="Rotation Strength",
+        description="Maximum random rotation in degrees",
+        default=30.0,
+        min=0.0,
+        max=360.0,
+        step=0.01,
+    )
+    rotation_apply_x: bpy.props.BoolProperty(
+        name="Apply Rotation X",
+        description="Apply random rotation to the X axis",
+        default=True,
+    )
+    rotation_apply_y: bpy.props.BoolProperty(
+        name="Apply Rotation Y",
+        description="Apply random rotation to the Y axis",
+        default=True,
+    )
+    rotation_apply_z: bpy.props.BoolProperty(
+        name="Apply Rotation Z",
+        description="Apply random rotation to the Z axis",
+        default=True,
+    )
+
+    # Movement properties
+    move_strength_x: bpy.props.FloatProperty(
+        name="Move Strength X",
+        description="Maximum random movement along the X axis",
+        default=1.0,
+        min=0.0,
+        max=10.0,
+        step=0.001,
+    )
+    move_strength_y: bpy.props.FloatProperty(
+        name="Move Strength Y",
+        description="Maximum random movement along the Y axis",
+        default=1.0,
+        min=0.0,
+        max=10.0,
+        step=0.001,
+    )
+    move_strength_z: bpy.props.FloatProperty(
+        name="Move Strength Z",
+        description="Maximum random movement along the Z axis",
+        default=1.0,
+        min=0.0,
+        max=10.0,
+        step=0.001,
+    )
+
+    # Minimum distance properties
+    min_distance_enabled: bpy.props.BoolProperty(
+        name="Minimum Distance",
+        description="Keep the bounding spheres of moved objects apart so they do not intersect",
+        default=False,
+    )
+    min_distance: bpy.props.FloatProperty(
+        name="Minimum Distance",
+        description="Extra gap kept between the bounding spheres of moved objects",
+        default=0.0,
+        min=0.0,
+        max=100.0,
+        step=0.01,
+    )
+    max_attempts: bpy.props.IntProperty(
+        name="Max Attempts",
+        description="Random positions tried per object before it is left in place",
+        default=30,
+        min=1,
+        max=1000,
+    )
+
+    # Overlap resolution properties
+    resolve_overlaps: bpy.props.BoolProperty(
+        name="Resolve Overlaps",
+        description="Separate moved meshes that still intersect each other",
+        default=False,
+    )
+    resolve_mode: bpy.props.EnumProperty(
+        name="Resolve Mode",
+        description="How overlapping objects are separated",
+        items=[
+            ('PUSH', "Push Apart", "Move both objects apart along the axis of least penetration"),
+            ('REROLL', "Re-roll", "Pick a new random position for one of the objects"),
+        ],
+        default='PUSH',
+    )
+    resolve_iterations: bpy.props.IntProperty(
+        name="Resolve Iterations",
+        description="Maximum number of resolution passes",
+        default=10,
+        min=1,
+        max=100,
+    )
+
+    # Surface snapping properties
+    snap_enabled: bpy.props.BoolProperty(
+        name="Snap to Surface",
+        description="Project moved objects onto the surface of a target mesh",
+        default=False,
+    )
+    snap_target: bpy.props.PointerProperty(
+        name="Snap Target",
+        description="Mesh object the moved objects are projected onto",
+        type=bpy.types.Object,
+        poll=lambda self, obj: obj.type == 'MESH',
+    )
+    snap_direction: bpy.props.EnumProperty(
+        name="Snap Direction",
+        description="World direction along which objects are projected",
+        items=[
+            ('NEG_Z', "-Z", ""),
+            ('POS_Z', "+Z", ""),
+            ('NEG_Y', "-Y", ""),
+            ('POS_Y', "+Y", ""),
+            ('NEG_X', "-X", ""),
+            ('POS_X', "+X", ""),
+        ],
+        default='NEG_Z',
+    )
+    snap_align_normal: bpy.props.BoolProperty(
+        name="Align to Normal",
+        description="Rotate snapped objects so their up axis follows the surface normal",
+        default=False,
+    )
+
+def register():
+    bpy.utils.register_class(RandomManipulatorProperties)
+    bpy.utils.register_class(RandomManipulatorOperator)
+    bpy.utils.register_class(RandomManipulatorPanel)
+    bpy.types.Scene.random_manipulator_tool = bpy.props.PointerProperty(type=RandomManipulatorProperties)
+
+def unregister():
+    bpy.utils.unregister_class(RandomManipulatorOperator)
+    bpy.utils.unregister_class(RandomManipulatorPanel)
+    bpy.utils.unregister_class(RandomManipulatorProperties)
+    del bpy.types.Scene.random_manipulator_tool
+
+    # The BVH cache only exists once the operator has run
+    scatter = sys.modules.get(f"{__package__}.scatter")
+    if scatter is not None:
+        scatter._bvh_cache.clear()
@@ -0,0 +1,451 @@
+import bpy
+import re
+from . import profiling
+from bpy.app.handlers import persistent
+from uuid import uuid4
+
+# Blender truncates longer ID names, which would cut off the suffixes
+MAX_NAME_BYTES = 63
+
+# Number of planned renames listed in the panel preview
+PREVIEW_LIMIT = 30
+
+# Last computed preview, cleared on every depsgraph update
+_preview_cache = {}
+
+
+def collect_suffixes(tool):
+    """Return the list of suffixes enabled in the rename settings"""
+    suffixes = []
+
+    # Check which suffixes are selected
+    if tool.suffix_col:
+        suffixes.append("-col")
+    if tool.suffix_colonly:
+        suffixes.append("-colonly")
+    if tool.suffix_convcol:
+        suffixes.append("-convcol")
+    if tool.suffix_convcolonly:
+        suffixes.append("-convcolonly")
+    if tool.suffix_noimp:
+        suffixes.append("-noimp")
+
+    # Custom suffix
+    if tool.suffix_custom_enabled:
+        if not tool.suffix_custom:
+            raise ValueError("Custom suffix is empty!")
+        suffixes.append(tool.suffix_custom)
+
+    return suffixes
+
+
+def natural_key(name):
+    """Sort key that orders 'Rock2' before 'Rock10'"""
+    return [int(part) if part.isdigit() else part.lower() for part in re.split(r"(\d+)", name)]
+
+
+def outliner_order(scene):
+    """Map object pointers to their position in the Outliner hierarchy.
+
+    Child collections come before the objects of a collection, and objects
+    are sorted by name, as the Outliner shows them by default.
+    """
+    order = {}
+
+    def walk(collection):
+        for child in collection.children:
+            walk(child)
+        for obj in sorted(collection.objects, key=lambda o: natural_key(o.name)):
+            order.setdefault(obj.as_pointer(), len(order))
+
+    walk(scene.collection)
+    return order
+
+
+def sort_objects(objects, sort_by, scene):
+    """Return the objects in the order they get numbered"""
+    if sort_by == 'OUTLINER':
+        order = outliner_order(scene)
+        return sorted(objects, key=lambda obj: order.get(obj.as_pointer(), len(order)))
+    if sort_by == 'NATURAL':
+        return sorted(objects, key=lambda obj: natural_key(obj.name))
+    if sort_by in {'X', 'Y', 'Z'}:
+        axis = "XYZ".index(sort_by)
+        return sorted(objects, key=lambda obj: obj.matrix_world.translation[axis])
+    return list(objects)
+
+
+def render_template(template, obj, index):
+    """Fill the name template tokens for one object"""
+    collection = obj.users_collection[0].name if obj.users_collection else ""
+    tokens = {
+        "name": obj.name,
+        "collection": collection,
+        "index": index,
+        "type": obj.type.lower(),
+        "data": obj.data.name if obj.data else "",
+    }
+    try:
+        return template.format_map(tokens)
+    except KeyError as error:
+        raise ValueError(f"Unknown template token {error}")
+    except (ValueError, IndexError, AttributeError, TypeError) as error:
+        raise ValueError(f"Invalid template: {error}")
+
+
+def build_plan(context):
+    """Plan object and mesh data renames from the scene settings.
+
+    Returns two lists of (ID, final name) pairs, one for objects and one for
+    mesh data. Invalid settings raise ValueError with a user-facing message.
+    """
+    scene = context.scene
+    tool = scene.rename_tool
+    suffixes = collect_suffixes(tool)
+    objects = sort_objects(context.selected_objects, tool.sort, scene)
+
+    if tool.mode == 'BASIC':
+        if not tool.base_name:
+            raise ValueError("Base name is empty!")
+        base_names = [
+            f"{tool.base_name}.{str(idx).zfill(3)}"
+            for idx in range(1, len(objects) + 1)
+        ]
+    else:
+        pattern = None
+        if tool.find and tool.use_regex:
+            try:
+                pattern = re.compile(tool.find)
+            except re.error as error:
+                raise ValueError(f"Invalid regex: {error}")
+
+        base_names = []
+        for idx, obj in enumerate(objects, start=tool.start_index):
+            name = render_template(tool.template, obj, idx)
+            if pattern is not None:
+                try:
+                    name = pattern.sub(tool.replace, name)
+                except re.error as error:
+                    # Bad group references in the replacement only fail here
+                    raise ValueError(f"Invalid replacement: {error}")
+            elif tool.find:
+                name = name.replace(tool.find, tool.replace)
+            if not name:
+                raise ValueError(f"Template gives an empty name for '{obj.name}'")
+            base_names.append(name)
+
+    suffix = "".join(suffixes)
+    object_plan = [(obj, name + suffix) for obj, name in zip(objects, base_names)]
+
+    # Mesh data is named after the first object using it, without suffixes
+    mesh_plan = []
+    if tool.mesh_data:
+        seen = set()
+        for (obj, _), name in zip(object_plan, base_names):
+            if obj.type == 'MESH' and obj.data.as_pointer() not in seen:
+                seen.add(obj.data.as_pointer())
+                mesh_plan.append((obj.data, name))
+
+    return object_plan, mesh_plan
+
+
+def find_conflicts(plan, collection):
+    """Return final names that cannot be assigned without Blender renaming them.
+
+    Names held by IDs outside the batch, duplicates inside the plan and names
+    longer than Blender allows are all reported.
+    """
+    batch = {id_data.as_pointer() for id_data, _ in plan}
+    index = {id_data.name: id_data for id_data in collection}
+    conflicts = []
+    seen = set()
+
+    for _, name in plan:
+        holder = index.get(name)
+        if name in seen:
+            conflicts.append(f"'{name}' is planned twice")
+        elif holder is not None and holder.as_pointer() not in batch:
+            conflicts.append(f"'{name}' is already used")
+        elif len(name.encode("utf-8")) > MAX_NAME_BYTES:
+            conflicts.append(f"'{name}' is longer than {MAX_NAME_BYTES} bytes")
+        seen.add(name)
+
+    return conflicts
+
+
+def apply_names(plan, collection):
+    """Rename in two phases so no final name collides with a name still in use.
+
+    Every ID first gets a temporary name that is unique in the collection,
+    which frees all final names, then the final names are assigned.
+    """
+    existing = set(collection.keys())
+    token = uuid4().hex[:8]
+    for idx, (id_data, _) in enumerate(plan):
+        temp_name = f"__rename_{token}_{idx}"
+        while temp_name in existing:
+            temp_name += "_"
+        id_data.name = temp_name
+
+    for id_data, name in plan:
+        id_data.name = name
+
+
+def settings_key(context):
+    """Everything the planned names depend on, used to validate the preview cache"""
+    tool = context.scene.rename_tool
+    return (
+        tool.mode, tool.base_name, tool.template,
+        tool.find, tool.replace, tool.use_regex,
+        tool.sort, tool.start_index, tool.mesh_data,
+        tool.suffix_col, tool.suffix_colonly, tool.suffix_convcol,
+        tool.suffix_convcolonly, tool.suffix_noimp,
+        tool.suffix_custom_enabled, tool.suffix_custom,
+        len(context.selected_objects),
+        context.active_object.as_pointer() if context.active_object else 0,
+    )
+
+
+def get_preview(context):
+    """Return (rows, total, error) for the panel, computing the plan only when needed"""
+    key = settings_key(context)
+    if _preview_cache.get("key") != key:
+        try:
+            object_plan, _ = build_plan(context)
+            rows = [(obj.name, name) for obj, name in object_plan[:PREVIEW_LIMIT]]
+            _preview_cache.update(key=key, rows=rows, total=len(object_plan), error=None)
+        except ValueError as error:
+            _preview_cache.update(key=key, rows=[], total=0, error=str(error))
+
+    return _preview_cache["rows"], _preview_cache["total"], _preview_cache["error"]
+
+
+@persistent
+def _clear_preview_cache(*args):
+    # Selection and name changes all go through a depsgraph update
+    _preview_cache.clear()
+
+
+# Addon class to handle renaming
+@profiling.instrument
+class OBJECT_OT_RenameMultipleObjects(bpy.types.Operator):
+    bl_idname = "object.rename_multiple_objects"
+    bl_label = "Rename Multiple Objects"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    # Function to execute the renaming operation
+    def execute(self, context):
+        # Plan all final names before touching any object
+        try:
+            object_plan, mesh_plan = build_plan(context)
+        except ValueError as error:
+            self.report({'WARNING'}, str(error))
+            return {'CANCELLED'}
+
+        conflicts = find_conflicts(object_plan, bpy.data.objects)
+        conflicts += find_conflicts(mesh_plan, bpy.data.meshes)
+        if conflicts:
+            self.report({'WARNING'}, f"{len(conflicts)} name conflict(s), first: {conflicts[0]}")
+            return {'CANCELLED'}
+
+        # Renaming selected objects and their mesh data
+        apply_names(object_plan, bpy.data.objects)
+        apply_names(mesh_plan, bpy.data.meshes)
+
+        return {'FINISHED'}
+
+# Panel to display the button, input field, checkboxes, and custom suffix input in the UI
+class VIEW3D_PT_RenameMultipleObjects(bpy.types.Panel):
+    bl_label = "Rename Multiple Objects"
+    bl_idname = "VIEW3D_PT_rename_multiple_objects"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = 'linebyline'
+
+    def draw(self, context):
+        layout = self.layout
+        tool = context.scene.rename_tool
+
+        # Naming mode
+        layout.prop(tool, "mode", expand=True)
+
+        if tool.mode == 'BASIC':
+            # Input field to define the base name
+            layout.prop(tool, "base_name")
+        else:
+            # Template and find/replace fields
+            layout.prop(tool, "template")
+            layout.label(text="Tokens: {name} {collection} {index:03} {type} {data}")
+            layout.prop(tool, "start_index")
+            row = layout.row(align=True)
+            row.prop(tool, "find")
+            row.prop(tool, "use_regex", text="", icon='SORTBYEXT')
+            layout.prop(tool, "replace")
+
+        layout.prop(tool, "sort")
+        layout.prop(tool, "mesh_data")
+
+        # Checkboxes for suffix types
+        layout.prop(tool, "suffix_col")
+        layout.prop(tool, "suffix_colonly")
+        layout.prop(tool, "suffix_convcol")
+        layout.prop(tool, "suffix_convcolonly")
+        layout.prop(tool, "suffix_noimp")
+
+        # Checkbox for custom suffix
+        layout.prop(tool, "suffix_custom_enabled")
+
+        # Custom suffix input field (only shown if checkbox is enabled)
+        if tool.suffix_custom_enabled:
+            layout.prop(tool, "suffix_custom")
+
+        # Preview of the planned names, only computed while expanded
+        layout.prop(tool, "show_preview", icon='HIDE_OFF')
+        if tool.show_preview:
+            rows, total, error = get_preview(context)
+            box = layout.box()
+            if error:
+                box.label(text=error, icon='ERROR')
+            for old_name, new_name in rows:
+                box.label(text=f"{old_name}  →  {new_name}")
+            if total > len(rows):
+                box.label(text=f"... and {total - len(rows)} more")
+
+        # Button to trigger the renaming operator
+        layout.operator("object.rename_multiple_objects", text="Rename Selected Objects")
+
+# Define the properties for base name, suffixes, and custom suffix
+class RenameProperties(bpy.types.PropertyGroup):
+    base_name: bpy.props.StringProperty(
+        name="Base Name",
+        description="Base name for renaming objects",
+        default="Object"
+    )
+
+    # Properties for the template engine
+    mode: bpy.props.EnumProperty(
+        name="Mode",
+        description="How the new names are built",
+        items=[
+            ('BASIC', "Base Name", "Base name with a numerical suffix"),
+            ('TEMPLATE', "Template", "Name template with tokens and find/replace"),
+        ],
+        default='BASIC'
+    )
+
+    template: bpy.props.StringProperty(
+        name="Template",
+        description="Name template, e.g. '{collection}_{name}_{index:03}'",
+        default="{name}"
+    )
+
+    start_index: bpy.props.IntProperty(
+        name="Start Index",
+        description="Value of {index} for the first object",
+        default=1,
+        min=0
+    )
+
+    find: bpy.props.StringProperty(
+        name="Find",
+        description="Text or regular expression to replace in the template result",
+        default=""
+    )
+
+    replace: bpy.props.StringProperty(
+        name="Replace",
+        description="Replacement text, regex groups can be used as \\1",
+        default=""
+    )
+
+    use_regex: bpy.props.BoolProperty(
+        name="Use Regex",
+        description="Treat the find text as a regular expression",
+        default=False
+    )
+
+    sort: bpy.props.EnumProperty(
+        name="Order",
+        description="Order in which objects are numbered",
+        items=[
+            ('SELECTION', "Selection", "Order of the current selection"),
+            ('OUTLINER', "Outliner", "Collection hierarchy order, objects sorted by name"),
+            ('NATURAL', "Name", "Natural sort of the current names"),
+            ('X', "X Position", "World X location"),
+            ('Y', "Y Position", "World Y location"),
+            ('Z', "Z Position", "World Z location"),
+        ],
+        default='SELECTION'
+    )
+
+    mesh_data: bpy.props.BoolProperty(
+        name="Rename Mesh Data",
+        description="Also rename the mesh data of each object, without suffixes",
+        default=False
+    )
+
+    show_preview: bpy.props.BoolProperty(
+        name="Preview",
+        description="Show the planned names",
+        default=False
+    )
+
+    suffix_col: bpy.props.BoolProperty(
+        name="-col",
+        description="Append '-col' suffix",
+        default=False
+    )
+
+    suffix_colonly: bpy.props.BoolProperty(
+        name="-colonly",
+        description="Append '-colonly' suffix",
+        default=False
+    )
+
+    suffix_convcol: bpy.props.BoolProperty(
+        name="-convcol",
+        description="Append '-convcol' suffix",
+        default=False
+    )
+
+    suffix_convcolonly: bpy.props.BoolProperty(
+        name="-convcolonly",
+        description="Append '-convcolonly' suffix",
+        default=False
+    )
+
+    suffix_noimp: bpy.props.BoolProperty(
+        name="-noimp",
+        description="Append '-noimp' suffix",
+        default=False
+    )
+
+    # Property for enabling custom suffix
+    suffix_custom_enabled: bpy.props.BoolProperty(
+        name="Enable Custom Suffix",
+        description="Enable the custom suffix field",
+        default=False
+    )
+
+    # Custom suffix input field
+    suffix_custom: bpy.props.StringProperty(
+        name="Custom Suffix",
+        description="Enter a custom suffix",
+        default=""
+    )
+
+# Registering the addon
+def register():
+    bpy.utils.register_class(RenameProperties)
+    bpy.utils.register_class(OBJECT_OT_RenameMultipleObjects)
+    bpy.utils.register_class(VIEW3D_PT_RenameMultipleObjects)
+    bpy.types.Scene.rename_tool = bpy.props.PointerProperty(type=RenameProperties)
+    bpy.app.handlers.depsgraph_update_post.append(_clear_preview_cache)
+
+# Unregistering the addon
+def unregister():
+    bpy.app.handlers.depsgraph_update_post.remove(_clear_preview_cache)
+    bpy.utils.unregister_class(OBJECT_OT_RenameMultipleObjects)
+    bpy.utils.unregister_class(VIEW3D_PT_RenameMultipleObjects)
+    bpy.utils.unregister_class(RenameProperties)
+    del bpy.types.Scene.rename_tool
@@ -1,16 +1,8 @@
-bl_info = {
-    "name": "Replace with Empty Plain Axis",
-    "blender": (4, 1, 1),
-    "category": "Object",
-    "author": "linebyline",
-    "version": (1, 2, 0),
-    "description": "Replaces selected objects with empty plain axis objects, copying location and rotation.",
-    "support": "COMMUNITY",
-}
-
 import bpy
+from . import profiling
 
 # Operator to replace the selected object(s) with empties
+@profiling.instrument
 class OBJECT_OT_replace_with_empty(bpy.types.Operator):
     bl_idname = "object.replace_with_empty"
     bl_label = "Replace with Empty Plain Axis"
@@ -75,6 +67,3 @@ def unregister():
     bpy.utils.unregister_class(OBJECT_OT_replace_with_empty)
     bpy.utils.unregister_class(OBJECT_PT_replace_with_empty_panel)
     bpy.types.VIEW3D_MT_object_context_menu.remove(menu_func)  # Remove from the "W" menu
-
-if __name__ == "__main__":
-    register()
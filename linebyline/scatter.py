@@ -0,0 +1,274 @@
+"""Placement helpers of the random manipulator: spacing, overlap resolution and surface snapping"""
+
+import random
+from math import floor
+from statistics import median
+from mathutils import Matrix, Vector
+from mathutils.bvhtree import BVHTree
+from . import core
+
+# Snap directions in world space
+SNAP_DIRECTIONS = {
+    'NEG_Z': Vector((0.0, 0.0, -1.0)),
+    'POS_Z': Vector((0.0, 0.0, 1.0)),
+    'NEG_Y': Vector((0.0, -1.0, 0.0)),
+    'POS_Y': Vector((0.0, 1.0, 0.0)),
+    'NEG_X': Vector((-1.0, 0.0, 0.0)),
+    'POS_X': Vector((1.0, 0.0, 0.0)),
+}
+
+# Cached BVH trees: object session uid -> (mesh session uid, geometry versions, tree)
+_bvh_cache = {}
+
+
+def translate(obj, offset):
+    """Move an object by a world space offset, parented objects included"""
+    obj.matrix_world = Matrix.Translation(offset) @ obj.matrix_world
+
+
+def get_target_bvh(target, depsgraph):
+    """Return a local-space BVH of the evaluated target, rebuilt only when its geometry changed"""
+    key = target.session_uid
+    state = (target.data.session_uid, core.geometry_version(target), core.geometry_version(target.data))
+    cached = _bvh_cache.get(key)
+    if cached is not None and cached[:3] == state:
+        return cached[3]
+
+    tree = BVHTree.FromObject(target.evaluated_get(depsgraph), depsgraph)
+    _bvh_cache[key] = state + (tree,)
+    return tree
+
+
+def snap_to_surface(objects, target, depsgraph, direction, align_to_normal):
+    """Project objects onto the target surface along a world direction.
+
+    All rays are transformed into the target's local space with a single
+    inverse matrix and cast against one cached tree. Returns the number of
+    objects that did not hit the surface.
+    """
+    tree = get_target_bvh(target, depsgraph)
+    matrix = target.matrix_world
+    matrix_inv = matrix.inverted()
+    normal_matrix = matrix_inv.transposed().to_3x3()
+    local_direction = (matrix_inv.to_3x3() @ direction).normalized()
+
+    # Build the batch of rays first, then cast them against the tree
+    rays = [(obj, matrix_inv @ obj.matrix_world.translation) for obj in objects if obj != target]
+    missed = 0
+
+    for obj, origin in rays:
+        # Cast along the direction, and back again for objects below the surface
+        location, normal, _, _ = tree.ray_cast(origin, local_direction)
+        if location is None:
+            location, normal, _, _ = tree.ray_cast(origin, -local_direction)
+        if location is None:
+            missed += 1
+            continue
+
+        # Work on the world matrix, so parented objects land on the surface as well
+        hit = matrix @ location
+        world = obj.matrix_world.copy()
+        world.translation = hit
+        if align_to_normal:
+            world_normal = (normal_matrix @ normal).normalized()
+            up = -direction
+            if world_normal.dot(up) < 0.0:
+                world_normal.negate()
+            rotation = up.rotation_difference(world_normal).to_matrix().to_4x4()
+            world = Matrix.Translation(hit) @ rotation @ Matrix.Translation(-hit) @ world
+        obj.matrix_world = world
+
+    return missed
+
+
+class SpatialHashGrid:
+    """Uniform hash grid of bounding spheres for fast neighbour lookups.
+
+    Every sphere, grown by half the minimum distance, is stored in all cells
+    its bounding box touches. Two spheres that are too close then always
+    share a cell, whatever their size compared to the cells.
+    """
+
+    def __init__(self, cell_size, min_distance):
+        self.cell_size = cell_size
+        self.margin = min_distance * 0.5
+        self.cells = {}
+
+    def cells_of(self, position, radius):
+        size = self.cell_size
+        extent = radius + self.margin
+        low = [floor((position[axis] - extent) / size) for axis in range(3)]
+        high = [floor((position[axis] + extent) / size) for axis in range(3)]
+        for x in range(low[0], high[0] + 1):
+            for y in range(low[1], high[1] + 1):
+                for z in range(low[2], high[2] + 1):
+                    yield x, y, z
+
+    def insert(self, position, radius):
+        entry = (position.copy(), radius)
+        for cell in self.cells_of(position, radius):
+            self.cells.setdefault(cell, []).append(entry)
+
+    def is_free(self, position, radius):
+        min_distance = self.margin * 2.0
+        for cell in self.cells_of(position, radius):
+            for other_position, other_radius in self.cells.get(cell, ()):
+                limit = radius + other_radius + min_distance
+                if (position - other_position).length_squared < limit * limit:
+                    return False
+        return True
+
+
+def bounding_radius(obj):
+    """Radius of a sphere around the object origin enclosing its bounding box"""
+    scale = max(abs(s) for s in obj.matrix_world.to_scale())
+    return max(Vector(corner).length for corner in obj.bound_box) * scale
+
+
+def random_offset(move_x, move_y, move_z):
+    return Vector((
+        random.uniform(-move_x, move_x),
+        random.uniform(-move_y, move_y),
+        random.uniform(-move_z, move_z),
+    ))
+
+
+def scatter_with_min_distance(objects, move_strength, min_distance, max_attempts):
+    """Dart-throwing placement that keeps bounding spheres min_distance apart.
+
+    Returns the number of objects for which no free spot was found; those
+    stay at their current location. When that spot is free as well they
+    keep others away from it, otherwise they are left out of the grid.
+    """
+    if not objects:
+        return 0
+    radii = [bounding_radius(obj) for obj in objects]
+    # Cells fit a typical object; the largest objects span at most 16 cells per axis
+    cell_size = max(2.0 * median(radii) + min_distance, (2.0 * max(radii) + min_distance) / 16.0, 1e-4)
+    grid = SpatialHashGrid(cell_size, min_distance)
+    failed = 0
+
+    for obj, radius in zip(objects, radii):
+        origin = obj.matrix_world.translation.copy()
+        for _ in range(max_attempts):
+            candidate = origin + random_offset(*move_strength)
+            if grid.is_free(candidate, radius):
+                translate(obj, candidate - origin)
+                grid.insert(candidate, radius)
+                break
+        else:
+            if grid.is_free(origin, radius):
+                grid.insert(origin, radius)
+            failed += 1
+
+    return failed
+
+def world_aabb(obj, matrix):
+    corners = [matrix @ Vector(corner) for corner in obj.bound_box]
+    return (
+        Vector(tuple(min(c[axis] for c in corners) for axis in range(3))),
+        Vector(tuple(max(c[axis] for c in corners) for axis in range(3))),
+    )
+
+
+def find_aabb_pairs(boxes):
+    """Sweep and prune along X, returning index pairs whose boxes intersect"""
+    order = sorted(range(len(boxes)), key=lambda i: boxes[i][0].x)
+    active = []
+    pairs = []
+
+    for i in order:
+        box_min, box_max = boxes[i]
+        # Drop boxes that ended before this one starts on the sweep axis
+        active = [j for j in active if boxes[j][1].x >= box_min.x]
+        for j in active:
+            other_min, other_max = boxes[j]
+            if (box_min.y <= other_max.y and other_min.y <= box_max.y and
+                    box_min.z <= other_max.z and other_min.z <= box_max.z):
+                pairs.append((j, i))
+        active.append(i)
+
+    return pairs
+
+
+def resolve_overlaps(objects, origins, move_strength, mode, iterations):
+    """Separate interpenetrating meshes after randomization.
+
+    Candidate pairs come from a sweep and prune over world AABBs and are
+    confirmed with BVHTree.overlap on world space trees, which are only
+    rebuilt for objects that moved. Pairs whose surfaces do not touch are
+    still overlapping when one mesh lies inside the other. origins are world
+    positions. Returns the number of overlapping pairs left after the last
+    iteration.
+    """
+    matrices = [obj.matrix_world.copy() for obj in objects]
+    mesh_data = {}
+    trees = {}
+
+    def world_tree(index):
+        if index not in trees:
+            mesh = objects[index].data
+            key = mesh.session_uid
+            if key not in mesh_data:
+                mesh_data[key] = (core.positions(mesh), core.polygons(mesh))
+            co, polygons = mesh_data[key]
+            trees[index] = BVHTree.FromPolygons(core.to_world(co, matrices[index]).tolist(), polygons)
+        return trees[index]
+
+    def first_vertex(index):
+        co = mesh_data[objects[index].data.session_uid][0]
+        return matrices[index] @ Vector(co[0]) if len(co) else None
+
+    def contains(outer, inner):
+        # Without touching surfaces, one vertex tells whether the whole mesh is inside
+        point = first_vertex(inner)
+        if point is None:
+            return False
+        location, normal, _, _ = world_tree(outer).find_nearest(point)
+        return location is not None and (point - location).dot(normal) < 0.0
+
+    def move(index, offset):
+        matrices[index] = Matrix.Translation(offset) @ matrices[index]
+        objects[index].matrix_world = matrices[index]
+        trees.pop(index, None)
+
+    def intersecting(i, j):
+        if world_tree(i).overlap(world_tree(j)):
+            return True
+        return contains(i, j) or contains(j, i)
+
+    def find_overlaps(boxes):
+        return [(i, j) for i, j in find_aabb_pairs(boxes) if intersecting(i, j)]
+
+    for _ in range(iterations):
+        boxes = [world_aabb(obj, matrix) for obj, matrix in zip(objects, matrices)]
+        overlapping = find_overlaps(boxes)
+        if not overlapping:
+            return 0
+
+        moved = set()
+        for i, j in overlapping:
+            if mode == 'REROLL':
+                # Re-roll the later object of the pair from its original spot
+                if j not in moved:
+                    offset = origins[j] + random_offset(*move_strength) - matrices[j].translation
+                    move(j, offset)
+                    moved.add(j)
+                continue
+
+            if i in moved or j in moved:
+                continue
+
+            # Push both objects apart along the axis of least AABB penetration
+            (min_i, max_i), (min_j, max_j) = boxes[i], boxes[j]
+            depths = [min(max_i[a], max_j[a]) - max(min_i[a], min_j[a]) for a in range(3)]
+            axis = depths.index(min(depths))
+            direction = 1.0 if (min_j[axis] + max_j[axis]) >= (min_i[axis] + max_i[axis]) else -1.0
+            offset = Vector((0.0, 0.0, 0.0))
+            offset[axis] = direction * (depths[axis] * 0.5 + 1e-4)
+            move(j, offset)
+            move(i, -offset)
+            moved.update((i, j))
+
+    boxes = [world_aabb(obj, matrix) for obj, matrix in zip(objects, matrices)]
+    return len(find_overlaps(boxes))
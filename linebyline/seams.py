@@ -0,0 +1,144 @@
+"""Seam marking and UV island analysis on the mesh arrays of the face outline seam operators"""
+
+import bmesh
+import bpy
+import numpy as np
+from . import core
+
+
+def face_arrays(obj):
+    """(loop faces, loop edges, edge vertices, seams, face selection) of a mesh object.
+
+    In edit mode the edit bmesh is written to the mesh first, so the arrays
+    are read with foreach_get like in object mode and keep the bmesh indices.
+    """
+    mesh = obj.data
+    if obj.mode == 'EDIT':
+        obj.update_from_editmode()
+        core.invalidate(mesh)
+    loop_faces = np.repeat(np.arange(len(mesh.polygons)), core.polygon_loop_totals(mesh))
+    return loop_faces, core.loop_edges(mesh), core.edges(mesh), core.edge_seams(mesh), core.polygon_selection(mesh)
+
+
+def mark_face_outline_as_seams(context):
+    obj = context.object
+    if obj is None or obj.type != 'MESH':
+        return {"CANCELLED"}
+    
+    # Read the face selection as arrays instead of walking the edges of every face
+    loop_faces, loop_edges, edge_vertices, _, face_select = face_arrays(obj)
+
+    # Get the bmesh for the object
+    bm = bmesh.from_edit_mesh(obj.data)
+    bm.edges.ensure_lookup_table()
+    
+    # Boundary edges of selected faces are used by exactly one selected face
+    selected_face_count = np.bincount(loop_edges[face_select[loop_faces]], minlength=len(edge_vertices))
+    outline = np.flatnonzero(selected_face_count == 1)
+    
+    # Deselect all edges to ensure only the desired edges are marked
+    for edge in bm.edges:
+        edge.select = False
+    
+    # Mark boundary edges of selected faces as seams
+    for index in outline.tolist():
+        edge = bm.edges[index]
+        edge.seam = True
+        edge.select = True
+
+    # Update the mesh
+    bmesh.update_edit_mesh(obj.data)
+    return {"FINISHED"}
+
+
+def connected_components(count, a, b):
+    """Component of every node of a graph given as edge arrays a, b, as the smallest node index.
+
+    Vectorized union-find: every round hooks the larger root of each edge
+    onto the smaller one, then jumps pointers until every node points at its root.
+    """
+    parent = np.arange(count)
+    while True:
+        root_a, root_b = parent[a], parent[b]
+        linked = root_a != root_b
+        if not linked.any():
+            return parent
+        # Several edges may hook the same root, any one of them wins, which is still a valid union
+        parent[np.maximum(root_a[linked], root_b[linked])] = np.minimum(root_a[linked], root_b[linked])
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+
+
+def island_analysis(face_count, loop_faces, loop_edges, edge_vertices, seams):
+    """UV islands the seams produce, without unwrapping.
+
+    Faces sharing an edge that is not a seam end up in the same island.
+    Returns (island of every face, faces per island, seam edges inside an
+    island, dangling seam end vertices). A seam inside an island does not
+    cut anything, a dangling end is a seam chain stopping inside the mesh.
+    """
+    # Pair every face corner with the last face written for its edge, the other face of a manifold edge.
+    # Edges with more faces link them all to that one face, which joins them just the same.
+    edge_face = np.full(len(edge_vertices), -1)
+    edge_face[loop_edges] = loop_faces
+    neighbours = edge_face[loop_edges]
+    shared = neighbours != loop_faces
+    on_seam = seams[loop_edges]
+    joined = shared & ~on_seam
+    labels = connected_components(face_count, loop_faces[joined], neighbours[joined])
+
+    # Roots label themselves, number them in order
+    roots = labels == np.arange(face_count)
+    islands = (np.cumsum(roots) - 1)[labels]
+    island_faces = np.bincount(islands, minlength=np.count_nonzero(roots))
+
+    # Seams with the same island on both sides
+    inner = np.zeros(len(edge_vertices), dtype=bool)
+    inner[loop_edges[shared & on_seam & (islands[loop_faces] == islands[neighbours])]] = True
+    inner_seams = np.flatnonzero(inner)
+
+    # Seam chain ends that are neither on the mesh boundary nor continued by another seam
+    edge_faces = np.bincount(loop_edges, minlength=len(edge_vertices))
+    used_seams = seams & (edge_faces > 0)
+    vertex_count = edge_vertices.max() + 1 if len(edge_vertices) else 0
+    seam_degree = np.bincount(edge_vertices[used_seams].ravel(), minlength=vertex_count)
+    boundary = np.zeros(vertex_count, dtype=bool)
+    boundary[edge_vertices[edge_faces == 1].ravel()] = True
+    dangling = np.flatnonzero((seam_degree == 1) & ~boundary)
+
+    return islands, island_faces, inner_seams, dangling
+
+
+def analyze_uv_islands(obj, selected_only=False):
+    """Island analysis of a mesh object, optionally of the selected faces only"""
+    loop_faces, loop_edges, edge_vertices, seams, face_select = face_arrays(obj)
+    face_count = len(face_select)
+    if selected_only:
+        # Unselected faces keep their own island and are left out of the counts
+        included = face_select[loop_faces]
+        loop_faces, loop_edges = loop_faces[included], loop_edges[included]
+
+    islands, island_faces, inner_seams, dangling = island_analysis(
+        face_count, loop_faces, loop_edges, edge_vertices, seams
+    )
+    if selected_only:
+        island_faces = np.bincount(islands[face_select], minlength=len(island_faces))
+        island_faces = island_faces[island_faces > 0]
+    return island_faces, inner_seams, dangling
+
+
+def select_elements(obj, edges, vertices):
+    """Select only the given edges and vertices of a mesh in edit mode"""
+    bpy.ops.mesh.select_all(action='DESELECT')
+    bm = bmesh.from_edit_mesh(obj.data)
+    bm.edges.ensure_lookup_table()
+    bm.verts.ensure_lookup_table()
+    for index in edges.tolist():
+        bm.edges[index].select = True
+    for index in vertices.tolist():
+        bm.verts[index].select = True
+    bm.select_flush(True)
+    bmesh.update_edit_mesh(obj.data)
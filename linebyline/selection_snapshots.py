@@ -0,0 +1,142 @@
+import bmesh
+import bpy
+from . import profiling
+
+# Same key as core.SNAPSHOT_PROPERTY, repeated so drawing the panel does not import NumPy
+SNAPSHOT_PROPERTY = "selection_snapshots"
+
+
+def snapshot_meshes(context):
+    """Unique meshes of the selected mesh objects as (mesh, edit bmesh) pairs, the bmesh is None outside edit mode"""
+    meshes = {}
+    for obj in context.selected_objects:
+        if obj.type != 'MESH' or obj.data.as_pointer() in meshes:
+            continue
+        bm = bmesh.from_edit_mesh(obj.data) if obj.data.is_editmode else None
+        meshes[obj.data.as_pointer()] = (obj.data, bm)
+    return list(meshes.values())
+
+
+@profiling.instrument
+class MESH_OT_save_selection_snapshot(bpy.types.Operator):
+    """Save the Vertex Selection of the Selected Meshes under a Name"""
+    bl_idname = "mesh.save_selection_snapshot"
+    bl_label = "Save Selection Snapshot"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    name: bpy.props.StringProperty(name="Name", description="Name of the snapshot, replaces one with the same name")
+
+    def execute(self, context):
+        from . import core
+
+        name = self.name or context.scene.selection_snapshot_tool.name
+        if not name:
+            self.report({'WARNING'}, "Enter a snapshot name.")
+            return {'CANCELLED'}
+
+        meshes = snapshot_meshes(context)
+        if not meshes:
+            self.report({'WARNING'}, "Select at least one mesh object.")
+            return {'CANCELLED'}
+
+        selected = sum(core.save_selection_snapshot(mesh, name, bm) for mesh, bm in meshes)
+        self.report({'INFO'}, f"Saved '{name}' with {selected} vertices in {len(meshes)} mesh(es).")
+        return {'FINISHED'}
+
+
+@profiling.instrument
+class MESH_OT_restore_selection_snapshot(bpy.types.Operator):
+    """Select the Vertices of a Saved Selection Snapshot Again"""
+    bl_idname = "mesh.restore_selection_snapshot"
+    bl_label = "Restore Selection Snapshot"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    name: bpy.props.StringProperty(name="Name")
+
+    def execute(self, context):
+        from . import core
+
+        # Meshes in edit mode get the selection written to their edit bmesh, without a mode switch
+        meshes = snapshot_meshes(context)
+        restored = sum(core.restore_selection_snapshot(mesh, self.name, bm) for mesh, bm in meshes)
+
+        if restored < len(meshes):
+            self.report({'WARNING'}, f"No usable snapshot '{self.name}' in {len(meshes) - restored} mesh(es), the vertex count may have changed.")
+        return {'FINISHED'}
+
+
+@profiling.instrument
+class MESH_OT_delete_selection_snapshot(bpy.types.Operator):
+    """Delete a Selection Snapshot from the Selected Meshes"""
+    bl_idname = "mesh.delete_selection_snapshot"
+    bl_label = "Delete Selection Snapshot"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    name: bpy.props.StringProperty(name="Name")
+
+    def execute(self, context):
+        for obj in context.selected_objects:
+            snapshots = obj.data.get(SNAPSHOT_PROPERTY) if obj.type == 'MESH' else None
+            if snapshots and self.name in snapshots:
+                del snapshots[self.name]
+        return {'FINISHED'}
+
+
+class VIEW3D_PT_SelectionSnapshots(bpy.types.Panel):
+    bl_label = "Selection Snapshots"
+    bl_idname = "VIEW3D_PT_selection_snapshots"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = 'linebyline'
+
+    def draw(self, context):
+        layout = self.layout
+        tool = context.scene.selection_snapshot_tool
+
+        row = layout.row(align=True)
+        row.prop(tool, "name", text="")
+        row.operator(MESH_OT_save_selection_snapshot.bl_idname, text="Save")
+
+        obj = context.object
+        snapshots = obj.data.get(SNAPSHOT_PROPERTY) if obj and obj.type == 'MESH' else None
+        if not snapshots:
+            layout.label(text="No snapshots on the active mesh")
+            return
+
+        for name in snapshots.keys():
+            row = layout.row(align=True)
+            row.label(text=name)
+            row.operator(MESH_OT_restore_selection_snapshot.bl_idname, text="", icon='RESTRICT_SELECT_OFF').name = name
+            row.operator(MESH_OT_delete_selection_snapshot.bl_idname, text="", icon='X').name = name
+
+        layout.label(text="Use a snapshot as input:")
+        col = layout.column(align=True)
+        col.operator("object.set_origin_to_selected_vertex", text="Origin to Snapshot").snapshot = tool.name
+        col.operator("object.add_empty_at_vertex", text="Empties at Snapshot").snapshot = tool.name
+        col.operator("object.align_global", text="Align Snapshot Edge to X").snapshot = tool.name
+
+
+class SelectionSnapshotProperties(bpy.types.PropertyGroup):
+    name: bpy.props.StringProperty(
+        name="Snapshot Name",
+        description="Name used to save snapshots and by the operators below",
+        default="Anchor"
+    )
+
+
+def register():
+    bpy.utils.register_class(SelectionSnapshotProperties)
+    bpy.utils.register_class(MESH_OT_save_selection_snapshot)
+    bpy.utils.register_class(MESH_OT_restore_selection_snapshot)
+    bpy.utils.register_class(MESH_OT_delete_selection_snapshot)
+    bpy.utils.register_class(VIEW3D_PT_SelectionSnapshots)
+    bpy.types.Scene.selection_snapshot_tool = bpy.props.PointerProperty(type=SelectionSnapshotProperties)
+
+
+def unregister():
+    bpy.utils.unregister_class(MESH_OT_save_selection_snapshot)
+    bpy.utils.unregister_class(MESH_OT_restore_selection_snapshot)
+    bpy.utils.unregister_class(MESH_OT_delete_selection_snapshot)
+    bpy.utils.unregister_class(VIEW3D_PT_SelectionSnapshots)
+    bpy.utils.unregister_class(SelectionSnapshotProperties)
+    del bpy.types.Scene.selection_snapshot_tool
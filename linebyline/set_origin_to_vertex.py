@@ -0,0 +1,247 @@
+import bpy
+import bmesh
+from . import profiling
+
+
+# Operator to set the origin based on selected vertices
+@profiling.instrument
+class OBJECT_OT_SetOriginToSelectedVertex(bpy.types.Operator):
+    """Set Origin to Last Selected Vertex or Average of Selected Vertices for Each Selected Object"""
+    bl_idname = "object.set_origin_to_selected_vertex"
+    bl_label = "Set Origin to Selected Vertex"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    snapshot: bpy.props.StringProperty(
+        name="Snapshot",
+        description="Use this saved vertex selection instead of the current one",
+        default="",
+        options={'SKIP_SAVE'}
+    )
+
+    @classmethod
+    def poll(cls, context):
+        # Ensure objects are selected and all are meshes
+        return (context.selected_objects and 
+                all(obj.type == 'MESH' for obj in context.selected_objects) and 
+                context.mode in {'OBJECT', 'EDIT_MESH'})
+
+    def execute(self, context):
+        from . import core
+        from .origin import edit_selected_center, mesh_users, selected_vertex_center, shift_origin, shift_origin_edit
+
+        # Process every unique mesh once, shared meshes included
+        edit_mode = context.mode == 'EDIT_MESH'
+        if edit_mode:
+            # Read the selection from the edit bmeshes, no mode switch needed
+            objects = context.objects_in_mode_unique_data
+        else:
+            objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
+
+        meshes = {}
+        for obj in objects:
+            meshes.setdefault(obj.data.as_pointer(), obj.data)
+
+        with profiling.stage("users"):
+            users = mesh_users(meshes)
+        without_selection = []
+        profiling.count(len(meshes))
+
+        for key, mesh in meshes.items():
+            with profiling.stage("selection"):
+                if edit_mode:
+                    bm = bmesh.from_edit_mesh(mesh)
+                    select = core.input_selection(mesh, self.snapshot, bm) if self.snapshot else None
+                    target_pos = edit_selected_center(bm, select)
+                else:
+                    target_pos = selected_vertex_center(mesh, self.snapshot)
+            if target_pos is None:
+                without_selection.append(mesh.name)
+                continue
+
+            with profiling.stage("shift"):
+                if edit_mode:
+                    shift_origin_edit(mesh, target_pos, users[key])
+                else:
+                    shift_origin(mesh, target_pos, users[key])
+
+        if without_selection and self.snapshot:
+            self.report({'WARNING'}, f"No usable snapshot '{self.snapshot}' in {len(without_selection)} mesh(es), e.g. '{without_selection[0]}'.")
+        elif without_selection:
+            self.report({'WARNING'}, f"No vertices selected in {len(without_selection)} mesh(es), e.g. '{without_selection[0]}'.")
+        else:
+            self.report({'INFO'}, "Origins updated for all selected objects.")
+        return {'FINISHED'}
+# Operator to set the origin to a bounding box or vertex based preset
+@profiling.instrument
+class OBJECT_OT_SetOriginPreset(bpy.types.Operator):
+    """Set the Origin of Each Selected Object to a Bounding Box or Vertex Preset"""
+    bl_idname = "object.set_origin_preset"
+    bl_label = "Set Origin Preset"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    preset: bpy.props.EnumProperty(
+        name="Preset",
+        items=[
+            ('BOTTOM_CENTER', "Bounding Box Bottom Center", "Center of the lowest face of the local bounding box"),
+            ('MIN_CORNER', "Bounding Box Min Corner", "Corner with the lowest X, Y and Z"),
+            ('CUSTOM', "Custom Anchor", "Pick min, center or max of the bounding box per axis"),
+            ('LOWEST_SELECTED', "Lowest Selected Vertex", "Selected vertex with the lowest local Z"),
+        ],
+        default='BOTTOM_CENTER'
+    )
+    anchor_x: bpy.props.EnumProperty(name="X", items=[
+            ('MIN', "Min", "Lowest bounding box value"),
+            ('CENTER', "Center", "Bounding box center"),
+            ('MAX', "Max", "Highest bounding box value"),
+        ], default='CENTER')
+    anchor_y: bpy.props.EnumProperty(name="Y", items=[
+            ('MIN', "Min", "Lowest bounding box value"),
+            ('CENTER', "Center", "Bounding box center"),
+            ('MAX', "Max", "Highest bounding box value"),
+        ], default='CENTER')
+    anchor_z: bpy.props.EnumProperty(name="Z", items=[
+            ('MIN', "Min", "Lowest bounding box value"),
+            ('CENTER', "Center", "Bounding box center"),
+            ('MAX', "Max", "Highest bounding box value"),
+        ], default='MIN')
+
+    @classmethod
+    def poll(cls, context):
+        return (context.selected_objects and
+                any(obj.type == 'MESH' for obj in context.selected_objects) and
+                context.mode == 'OBJECT')
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "preset")
+        if self.preset == 'CUSTOM':
+            row = layout.row(align=True)
+            row.prop(self, "anchor_x")
+            row.prop(self, "anchor_y")
+            row.prop(self, "anchor_z")
+
+    def execute(self, context):
+        from .origin import mesh_users, preset_origin, shift_origin
+
+        # Process every unique mesh once, shared meshes included
+        meshes = {}
+        for obj in context.selected_objects:
+            if obj.type == 'MESH':
+                meshes.setdefault(obj.data.as_pointer(), obj.data)
+
+        with profiling.stage("users"):
+            users = mesh_users(meshes)
+        custom_anchor = (self.anchor_x, self.anchor_y, self.anchor_z)
+        skipped = 0
+        profiling.count(len(meshes))
+
+        for key, mesh in meshes.items():
+            with profiling.stage("preset"):
+                target_pos = preset_origin(mesh, self.preset, custom_anchor)
+            if target_pos is None:
+                skipped += 1
+                continue
+            with profiling.stage("shift"):
+                shift_origin(mesh, target_pos, users[key])
+
+        if skipped:
+            self.report({'WARNING'}, f"Skipped {skipped} mesh(es) without usable vertices.")
+        return {'FINISHED'}
+
+
+# Custom Menu for the shortcut
+class VIEW3D_MT_SetOriginMenu(bpy.types.Menu):
+    bl_label = "Set Origin Menu"
+    bl_idname = "VIEW3D_MT_set_origin_custom"
+
+    def draw(self, context):
+        layout = self.layout
+
+        layout.operator(OBJECT_OT_SetOriginToSelectedVertex.bl_idname, text="Origin to Selected Vertex")
+
+        # The presets and Blender's own origin options only work in Object Mode
+        if context.mode != 'OBJECT':
+            return
+
+        # Bounding box and vertex presets
+        layout.operator(OBJECT_OT_SetOriginPreset.bl_idname, text="Origin to Bounding Box Bottom").preset = 'BOTTOM_CENTER'
+        layout.operator(OBJECT_OT_SetOriginPreset.bl_idname, text="Origin to Bounding Box Min Corner").preset = 'MIN_CORNER'
+        layout.operator(OBJECT_OT_SetOriginPreset.bl_idname, text="Origin to Custom Anchor").preset = 'CUSTOM'
+        layout.operator(OBJECT_OT_SetOriginPreset.bl_idname, text="Origin to Lowest Selected Vertex").preset = 'LOWEST_SELECTED'
+
+        layout.separator()
+        layout.label(text="Default Set Origin Options:")
+        layout.operator("object.origin_set", text="Origin to Geometry").type = 'GEOMETRY_ORIGIN'
+        layout.operator("object.origin_set", text="Origin to 3D Cursor").type = 'ORIGIN_CURSOR'
+        layout.operator("object.origin_set", text="Origin to Center of Mass (Surface)").type = 'ORIGIN_CENTER_OF_MASS'
+        layout.operator("object.origin_set", text="Origin to Center of Mass (Volume)").type = 'ORIGIN_CENTER_OF_VOLUME'
+
+
+# Tool Panel
+class VIEW3D_PT_SetOriginMenuPanel(bpy.types.Panel):
+    """Custom Set Origin Panel"""
+    bl_label = "Set Origin"
+    bl_idname = "VIEW3D_PT_set_origin_custom"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "linebyline"
+
+    def draw(self, context):
+        layout = self.layout
+        layout.operator(OBJECT_OT_SetOriginToSelectedVertex.bl_idname, text="Origin to Selected Vertex")
+
+        # Bounding box and vertex presets
+        layout.operator(OBJECT_OT_SetOriginPreset.bl_idname, text="Origin to Bounding Box Bottom").preset = 'BOTTOM_CENTER'
+        layout.operator(OBJECT_OT_SetOriginPreset.bl_idname, text="Origin to Bounding Box Min Corner").preset = 'MIN_CORNER'
+        layout.operator(OBJECT_OT_SetOriginPreset.bl_idname, text="Origin to Custom Anchor").preset = 'CUSTOM'
+        layout.operator(OBJECT_OT_SetOriginPreset.bl_idname, text="Origin to Lowest Selected Vertex").preset = 'LOWEST_SELECTED'
+        layout.separator()
+        layout.label(text="Default Set Origin Options:")
+        layout.operator("object.origin_set", text="Origin to Geometry").type = 'GEOMETRY_ORIGIN'
+        layout.operator("object.origin_set", text="Origin to 3D Cursor").type = 'ORIGIN_CURSOR'
+        layout.operator("object.origin_set", text="Origin to Center of Mass (Surface)").type = 'ORIGIN_CENTER_OF_MASS'
+        layout.operator("object.origin_set", text="Origin to Center of Mass (Volume)").type = 'ORIGIN_CENTER_OF_VOLUME'
+
+
+# Keymap registration, the shortcut is set in the addon preferences
+addon_keymaps = []
+
+
+def register_keymap(preferences):
+    keyconfig = bpy.context.window_manager.keyconfigs.addon
+    if keyconfig is None:
+        # No window manager keyconfigs in background mode
+        return
+
+    km = keyconfig.keymaps.new(name="3D View", space_type='VIEW_3D')
+    kmi = km.keymap_items.new(
+        idname="wm.call_menu",
+        type=preferences.custom_key.upper(),
+        value='PRESS',
+        shift=preferences.use_shift,
+        ctrl=preferences.use_ctrl,
+        alt=preferences.use_alt
+    )
+    kmi.properties.name = VIEW3D_MT_SetOriginMenu.bl_idname
+    addon_keymaps.append((km, kmi))
+
+
+def unregister_keymap():
+    for km, kmi in addon_keymaps:
+        km.keymap_items.remove(kmi)
+    addon_keymaps.clear()
+
+
+def register():
+    bpy.utils.register_class(OBJECT_OT_SetOriginToSelectedVertex)
+    bpy.utils.register_class(OBJECT_OT_SetOriginPreset)
+    bpy.utils.register_class(VIEW3D_MT_SetOriginMenu)
+    bpy.utils.register_class(VIEW3D_PT_SetOriginMenuPanel)
+
+
+def unregister():
+    unregister_keymap()
+    bpy.utils.unregister_class(OBJECT_OT_SetOriginToSelectedVertex)
+    bpy.utils.unregister_class(OBJECT_OT_SetOriginPreset)
+    bpy.utils.unregister_class(VIEW3D_MT_SetOriginMenu)
+    bpy.utils.unregister_class(VIEW3D_PT_SetOriginMenuPanel)
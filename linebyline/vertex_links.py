@@ -0,0 +1,61 @@
+"""Moves live linked empties to their vertices, writing only the empties whose vertex moved"""
+
+import bmesh
+import numpy as np
+from . import core
+
+# Source session uid -> (local positions, valid mask, world matrix) of the tracked vertices at the last refresh
+_previous = {}
+
+
+def clear():
+    _previous.clear()
+
+
+def tracked_positions(source, indices):
+    """Local positions of the tracked vertices and a mask of the indices that still exist"""
+    if source.mode == 'EDIT':
+        # The mesh arrays are stale in edit mode, read only the tracked vertices from the edit mesh
+        verts = bmesh.from_edit_mesh(source.data).verts
+        verts.ensure_lookup_table()
+        valid = indices < len(verts)
+        co = np.zeros((len(indices), 3))
+        if valid.any():
+            co[valid] = [verts[i].co for i in indices[valid].tolist()]
+        return co, valid
+
+    # The depsgraph handler of core may run after this one, so drop the old arrays first
+    core.invalidate(source.data)
+    positions = core.positions(source.data)
+    valid = indices < len(positions)
+    co = np.zeros((len(indices), 3))
+    co[valid] = positions[indices[valid]]
+    return co, valid
+
+
+def refresh(changes):
+    """Move the empties of updated sources: (source, empties, indices, geometry changed) tuples"""
+    moved = 0
+    for source, empties, indices, geometry_changed in changes:
+        uid = source.session_uid
+        indices = np.asarray(indices, dtype=np.int64)
+        matrix = np.array(source.matrix_world, dtype=np.float64)
+        previous = _previous.get(uid)
+
+        if previous is not None and not geometry_changed:
+            # Only the object moved, the local positions are the same
+            co, valid = previous[0], previous[1]
+        else:
+            co, valid = tracked_positions(source, indices)
+
+        if previous is None or not np.array_equal(matrix, previous[2]):
+            dirty = valid
+        else:
+            dirty = valid & np.any(co != previous[0], axis=1)
+        _previous[uid] = (co, valid, matrix)
+
+        dirty_indices = np.flatnonzero(dirty)
+        for i, position in zip(dirty_indices.tolist(), core.to_world(co[dirty_indices], matrix)):
+            empties[i].location = position
+        moved += len(dirty_indices)
+    return moved
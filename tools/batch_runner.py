@@ -0,0 +1,194 @@
+"""Run linebyline operators over many .blend files with a pool of headless Blender workers.
+
+    python tools/batch_runner.py job.json --blender /path/to/blender --concurrency 4 --report report.json
+
+The job file lists the files (glob patterns, relative to the job file) and the
+steps run on every file, in order:
+
+    {
+        "files": ["assets/**/*.blend"],
+        "save": true,
+        "steps": [
+            {"operator": "object.rename_multiple_objects", "select": "MESH",
+             "scene": {"rename_tool": {"mode": "TEMPLATE", "template": "{name}", "suffix_col": true}}},
+            {"operator": "object.set_origin_preset", "select": "MESH", "properties": {"preset": "BOTTOM_CENTER"}},
+            {"operator": "object.replace_with_empty", "select": ["Marker", "Spawn"]},
+            {"operator": "object.align_to_grid", "select": "ALL", "scene": {"align_to_grid_tool": {"spacing": 4.0}}}
+        ]
+    }
+
+"select" is KEEP (default), ALL, an object type such as MESH, or a list of
+object names; "active" optionally names the active object. "scene" sets
+scene settings before the operator runs, "properties" are operator arguments.
+
+Files whose content hash and job steps match the last successful run are
+skipped. The hash is taken after saving, so files saved by a run count as
+unchanged on the next one. The state is kept next to the job file.
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+WORKER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "batch_worker.py")
+
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def job_hash(job):
+    """Hash of everything in the job that changes the result of a file"""
+    relevant = {"steps": job["steps"], "save": job.get("save", True)}
+    return hashlib.sha256(json.dumps(relevant, sort_keys=True).encode()).hexdigest()
+
+
+def collect_files(job, base_dir):
+    files = []
+    for pattern in job["files"]:
+        matches = glob.glob(os.path.join(base_dir, pattern), recursive=True)
+        files.extend(os.path.abspath(path) for path in sorted(matches))
+    # Keep the first occurrence of files matched by several patterns
+    return list(dict.fromkeys(files))
+
+
+def load_state(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path) as file:
+        return json.load(file)
+
+
+def save_state(path, state):
+    # Write to a temporary file first so an interrupted run keeps the old state
+    temp_path = path + ".tmp"
+    with open(temp_path, "w") as file:
+        json.dump(state, file, indent=2)
+    os.replace(temp_path, path)
+
+
+def run_blender(blender, job_path, files, timeout):
+    """Run one Blender process over files, returning (records by file, failure message)"""
+    handle, results_path = tempfile.mkstemp(suffix=".jsonl")
+    os.close(handle)
+    command = [
+        blender, "--background", "--factory-startup", "--python", WORKER,
+        "--", "--job", job_path, "--results", results_path, *files,
+    ]
+    try:
+        try:
+            process = subprocess.run(command, capture_output=True, text=True, timeout=timeout)
+            failure = f"Blender exited with code {process.returncode}: {process.stderr[-2000:]}"
+        except subprocess.TimeoutExpired:
+            failure = f"Blender timed out after {timeout} s"
+
+        with open(results_path) as results:
+            records = {record["file"]: record for record in map(json.loads, results)}
+    finally:
+        os.remove(results_path)
+    return records, failure
+
+
+def run_worker(blender, job_path, files, timeout):
+    """Run a batch of files, returning a record per file.
+
+    The worker handles the files in order, so when Blender crashes or times
+    out the first file without a record is the culprit. It is reported as
+    failed and a new Blender process continues with the files after it.
+    """
+    records = []
+    remaining = list(files)
+    while remaining:
+        done, failure = run_blender(blender, job_path, remaining, timeout)
+        for index, path in enumerate(remaining):
+            if path not in done:
+                records.append({"file": path, "ok": False, "error": failure})
+                remaining = remaining[index + 1:]
+                break
+            records.append(done[path])
+        else:
+            remaining = []
+    return records
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(prog="batch_runner")
+    parser.add_argument("job", help="Job JSON file")
+    parser.add_argument("--blender", default="blender", help="Blender executable")
+    parser.add_argument("--concurrency", type=int, default=os.cpu_count() or 1,
+                        help="Number of Blender processes running at the same time")
+    parser.add_argument("--batch-size", type=int, default=8,
+                        help="Files per Blender process, amortizes the Blender startup")
+    parser.add_argument("--timeout", type=float, help="Seconds before a Blender process is killed")
+    parser.add_argument("--state", help="State file, default: <job>.state.json")
+    parser.add_argument("--force", action="store_true", help="Run unchanged files as well")
+    parser.add_argument("--report", help="Write the per-file report to this JSON file")
+    args = parser.parse_args(argv)
+
+    job_path = os.path.abspath(args.job)
+    with open(job_path) as file:
+        job = json.load(file)
+    state_path = args.state or os.path.splitext(job_path)[0] + ".state.json"
+    state = load_state(state_path)
+    steps_hash = job_hash(job)
+
+    # Skip files whose content and job are unchanged since their last successful run
+    files = collect_files(job, os.path.dirname(job_path))
+    pending = []
+    skipped = []
+    for path in files:
+        entry = state.get(path)
+        if not args.force and entry == {"hash": file_hash(path), "job": steps_hash}:
+            skipped.append({"file": path, "ok": True, "skipped": True})
+        else:
+            pending.append(path)
+
+    print(f"{len(files)} file(s), {len(skipped)} unchanged, {len(pending)} to run")
+    start = time.perf_counter()
+    records = []
+    batches = [pending[i:i + args.batch_size] for i in range(0, len(pending), args.batch_size)]
+
+    with ThreadPoolExecutor(max_workers=max(args.concurrency, 1)) as pool:
+        futures = [pool.submit(run_worker, args.blender, job_path, batch, args.timeout) for batch in batches]
+        for future in as_completed(futures):
+            for record in future.result():
+                records.append(record)
+                if record["ok"]:
+                    state[record["file"]] = {"hash": file_hash(record["file"]), "job": steps_hash}
+                    print(f"ok     {record['seconds']:8.2f}s  {record['file']}")
+                else:
+                    state.pop(record["file"], None)
+                    print(f"FAILED            {record['file']}: {record['error']}")
+            save_state(state_path, state)
+
+    failed = sum(1 for record in records if not record["ok"])
+    report = {
+        "job": job_path,
+        "seconds": time.perf_counter() - start,
+        "processed": len(records) - failed,
+        "failed": failed,
+        "skipped": len(skipped),
+        "files": records + skipped,
+    }
+    print(f"Done in {report['seconds']:.1f}s: {report['processed']} processed, "
+          f"{failed} failed, {len(skipped)} skipped")
+
+    if args.report:
+        with open(args.report, "w") as file:
+            json.dump(report, file, indent=2)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,108 @@
+"""Runs the steps of a batch job on .blend files, inside Blender.
+
+Started by batch_runner.py, not meant to be run by hand:
+
+    blender --background --factory-startup --python tools/batch_worker.py -- --job job.json --results out.jsonl a.blend b.blend
+
+Writes one JSON line per file to the results file as soon as the file is done,
+so the runner still gets the finished files when Blender crashes later on.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import traceback
+
+import addon_utils
+import bpy
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def select_objects(selection):
+    """Apply the selection of a step: KEEP, ALL, MESH, EMPTY or a list of object names"""
+    if selection == 'KEEP':
+        return
+    view_layer = bpy.context.view_layer
+    for obj in view_layer.objects:
+        if isinstance(selection, list):
+            select = obj.name in selection
+        elif selection == 'ALL':
+            select = True
+        else:
+            select = obj.type == selection
+        obj.select_set(select)
+
+    selected = [obj for obj in view_layer.objects if obj.select_get()]
+    if selected and (view_layer.objects.active is None or not view_layer.objects.active.select_get()):
+        view_layer.objects.active = selected[0]
+
+
+def apply_settings(settings):
+    """Set scene settings, e.g. {"rename_tool": {"suffix_col": true}}"""
+    scene = bpy.context.scene
+    for group_name, values in settings.items():
+        group = getattr(scene, group_name)
+        for name, value in values.items():
+            setattr(group, name, value)
+
+
+def run_step(step):
+    select_objects(step.get("select", 'KEEP'))
+    if step.get("active"):
+        bpy.context.view_layer.objects.active = bpy.data.objects[step["active"]]
+    apply_settings(step.get("scene", {}))
+
+    category, name = step["operator"].split(".")
+    operator = getattr(getattr(bpy.ops, category), name)
+    if not operator.poll():
+        raise RuntimeError(f"{step['operator']} cannot run in this file (poll failed)")
+    result = operator(**step.get("properties", {}))
+    if 'FINISHED' not in result:
+        raise RuntimeError(f"{step['operator']} returned {sorted(result)}")
+
+
+def run_file(path, job):
+    """Open a file, run all steps and save it; returns the result record"""
+    record = {"file": path, "ok": False, "steps": []}
+    start = time.perf_counter()
+    try:
+        bpy.ops.wm.open_mainfile(filepath=path, load_ui=False)
+        for step in job["steps"]:
+            step_start = time.perf_counter()
+            run_step(step)
+            record["steps"].append({"operator": step["operator"], "seconds": time.perf_counter() - step_start})
+        if job.get("save", True):
+            bpy.ops.wm.save_mainfile()
+        record["ok"] = True
+    except Exception as error:
+        record["error"] = f"{type(error).__name__}: {error}"
+        record["traceback"] = traceback.format_exc()
+    record["seconds"] = time.perf_counter() - start
+    return record
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(prog="batch_worker")
+    parser.add_argument("--job", required=True)
+    parser.add_argument("--results", required=True)
+    parser.add_argument("files", nargs="+")
+    args = parser.parse_args(argv)
+
+    with open(args.job) as file:
+        job = json.load(file)
+
+    sys.path.insert(0, REPO_DIR)
+    addon_utils.enable("linebyline", default_set=True)
+
+    with open(args.results, "a") as results:
+        for path in args.files:
+            results.write(json.dumps(run_file(path, job)) + "\n")
+            results.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[sys.argv.index("--") + 1:]))
@@ -0,0 +1,107 @@
+"""Measure Blender startup and addon enable time, before and after the package layout.
+
+Check out the old single-file addons next to the repository, then compare:
+
+    git worktree add ../linebyline-before <commit before the package>
+    python tools/measure_startup.py --blender /path/to/blender --before ../linebyline-before
+
+Every variant starts a fresh `blender --background --factory-startup` process
+--runs times and reports the median process wall time and the median time
+spent in addon_utils.enable, plus whether NumPy was imported by enabling:
+
+    none    Blender without any linebyline addon
+    before  every single-file addon found in the --before folder
+    after   the linebyline package of this repository
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs inside Blender: enable the modules and print the timings as one JSON line
+INNER_SCRIPT = """
+import addon_utils, json, sys, time
+sys.path.insert(0, {path!r})
+numpy_before = "numpy" in sys.modules
+start = time.perf_counter()
+for module in {modules!r}:
+    addon_utils.enable(module, default_set=False)
+enable = time.perf_counter() - start
+print("MEASURE " + json.dumps({{"enable": enable, "numpy_before": numpy_before, "numpy_after": "numpy" in sys.modules}}))
+"""
+
+
+def single_file_addons(folder):
+    """Top level .py files of a folder that declare bl_info"""
+    modules = []
+    for name in sorted(os.listdir(folder)):
+        if not name.endswith(".py"):
+            continue
+        with open(os.path.join(folder, name), encoding="utf-8") as file:
+            if "bl_info" in file.read():
+                modules.append(name[:-3])
+    return modules
+
+
+def run_variant(blender, path, modules, runs):
+    """Median wall and enable time of runs fresh Blender processes"""
+    command = [
+        blender, "--background", "--factory-startup",
+        "--python-expr", INNER_SCRIPT.format(path=path, modules=modules),
+    ]
+    walls = []
+    enables = []
+    numpy = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        output = subprocess.run(command, capture_output=True, text=True, check=True).stdout
+        walls.append(time.perf_counter() - start)
+
+        line = next(line for line in output.splitlines() if line.startswith("MEASURE "))
+        result = json.loads(line[len("MEASURE "):])
+        enables.append(result["enable"])
+        numpy = result["numpy_after"] and not result["numpy_before"]
+
+    return {
+        "modules": modules,
+        "wall": statistics.median(walls),
+        "enable": statistics.median(enables),
+        "imports_numpy": numpy,
+    }
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(prog="measure_startup")
+    parser.add_argument("--blender", default="blender", help="Blender executable")
+    parser.add_argument("--before", help="Folder with the old single-file addons")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--json", help="Write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    variants = {"none": (REPO_DIR, [])}
+    if args.before:
+        variants["before"] = (os.path.abspath(args.before), single_file_addons(args.before))
+    variants["after"] = (REPO_DIR, ["linebyline"])
+
+    results = {}
+    for name, (path, modules) in variants.items():
+        results[name] = run_variant(args.blender, path, modules, args.runs)
+        result = results[name]
+        print(f"{name:>6}: startup {result['wall'] * 1000.0:7.1f} ms, "
+              f"enable {result['enable'] * 1000.0:7.1f} ms, "
+              f"{len(modules)} module(s), imports NumPy: {result['imports_numpy']}")
+
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(results, file, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))